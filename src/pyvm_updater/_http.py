@@ -0,0 +1,30 @@
+"""Shared HTTP session for pyvm_updater."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+
+@functools.cache
+def get_session() -> requests.Session:
+    """Return the process-wide requests session, created on first use.
+
+    Sharing one session keeps connections to python.org alive between the
+    checksum, installer and metadata requests of a single run, including the
+    background metadata sync.
+    """
+    import requests  # type: ignore
+    from requests.adapters import HTTPAdapter
+
+    from . import __version__
+
+    session = requests.Session()
+    session.headers["User-Agent"] = f"pyvm-updater/{__version__} {session.headers['User-Agent']}"
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
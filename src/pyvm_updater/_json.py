@@ -0,0 +1,39 @@
+"""JSON (de)serialization helpers that prefer orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string.
+
+    Args:
+        obj: JSON-serializable object.
+        indent: Pretty-print with two-space indentation.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize obj as one newline-terminated JSON-lines record."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(",", ":")).encode() + b"\n"
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON document. Raises ValueError on malformed input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
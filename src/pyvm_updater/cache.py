@@ -0,0 +1,93 @@
+"""Persistent key/value cache for network lookups."""
+
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import json
+import time
+from typing import Any, Callable, TypeVar
+
+from . import metadata_store
+from ._json import dumps, loads
+from .constants import METADATA_TTL_SECONDS
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# How long a result is also kept in memory, so repeated calls in one run skip
+# SQLite entirely. Capped by the decorator's own ttl.
+_MEMO_TTL = 300
+
+
+def get(key: str, ttl: int = METADATA_TTL_SECONDS) -> Any | None:
+    """Return the cached value for key, or None if missing or older than ttl seconds."""
+    try:
+        row = metadata_store.connect().execute("SELECT value, fetched_at FROM kv WHERE key = ?", (key,)).fetchone()
+    except Exception:
+        return None
+    if not row or int(time.time()) - int(row[1]) >= ttl:
+        return None
+    try:
+        return loads(row[0])
+    except (TypeError, ValueError):
+        return None
+
+
+def put(key: str, value: Any) -> None:
+    """Store a JSON-serializable value under key."""
+    try:
+        with metadata_store.connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO kv(key, value, fetched_at) VALUES(?,?,?)",
+                (key, dumps(value), int(time.time())),
+            )
+    except Exception:
+        pass  # The cache is best-effort
+
+
+def cached(
+    ttl: int = METADATA_TTL_SECONDS,
+    cache_if: Callable[[Any], bool] = bool,
+    decode: Callable[[Any], Any] | None = None,
+) -> Callable[[F], F]:
+    """Cache a function's JSON-serializable result on disk for ttl seconds.
+
+    Results are also remembered in-process for up to _MEMO_TTL seconds.
+
+    Args:
+        ttl: Time-to-live of a cached result in seconds.
+        cache_if: Predicate deciding whether a fresh result is worth storing,
+                  so failed lookups are retried on the next call.
+        decode: Applied to values read back from disk, where JSON has turned
+                tuples into lists (pass ``tuple`` for tuple-returning functions).
+    """
+
+    def decorator(func: F) -> F:
+        prefix = f"{func.__module__}.{func.__qualname__}"
+        memo_ttl = min(ttl, _MEMO_TTL)
+        # (database path, key) -> (monotonic expiry, value)
+        memo: dict[tuple[str, str], tuple[float, Any]] = {}
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            arg_key = json.dumps([args, kwargs], sort_keys=True, default=str)
+            key = f"{prefix}:{hashlib.sha1(arg_key.encode()).hexdigest()}"
+            memo_key = (str(metadata_store.METADATA_DB), key)
+            entry = memo.get(memo_key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return copy.deepcopy(entry[1])
+            hit = get(key, ttl)
+            if hit is None:
+                hit = func(*args, **kwargs)
+                if not cache_if(hit):
+                    return hit
+                put(key, hit)
+            elif decode is not None:
+                hit = decode(hit)
+            memo[memo_key] = (time.monotonic() + memo_ttl, hit)
+            return copy.deepcopy(hit)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
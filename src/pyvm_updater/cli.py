@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import io
 import os
 import platform
 import shutil
@@ -11,33 +11,26 @@ import sys
 from typing import Any
 
 import click
-import requests
 
 from . import __version__
-from .config import get_config
-from .constants import HISTORY_FILE
-from .history import HistoryManager
-from .installers import (
-    remove_python_linux,
-    remove_python_macos,
-    remove_python_windows,
-    show_python_usage_instructions,
-    update_python_linux,
-    update_python_macos,
-    update_python_windows,
-)
 from .logging_config import get_logger, setup_logging
 from .utils import get_os_info, is_admin, validate_version_string
-from .version import (
-    check_python_version,
-    get_active_python_releases,
-    get_available_python_versions,
-    get_latest_python_info_with_retry,
-)
 
 # Module logger
 log = get_logger("cli")
 
+# (substring of python.org release status, label shown by `pyvm list`), first match wins
+_STATUS_LABELS = (
+    ("pre-release", "pre-release"),
+    ("bugfix", "bugfix"),
+    ("security", "security"),
+    ("end of life", "end-of-life"),
+)
+
+# The running interpreter's version cannot change during the process lifetime
+LOCAL_PY_VER = platform.python_version()
+LOCAL_PY_SERIES = f"{sys.version_info.major}.{sys.version_info.minor}"
+
 
 @click.group(invoke_without_command=True)
 @click.pass_context
@@ -46,6 +39,12 @@ log = get_logger("cli")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress non-essential output")
 def cli(ctx: click.Context, version: bool, verbose: bool, quiet: bool) -> None:
     """Python Version Manager - Check and install Python (does NOT modify system defaults)"""
+    if version:
+        click.echo(f"Python Version Manager v{__version__}")
+        ctx.exit()
+
+    from .config import get_config
+
     # Initialize logging
     setup_logging(verbose=verbose, quiet=quiet)
 
@@ -54,10 +53,6 @@ def cli(ctx: click.Context, version: bool, verbose: bool, quiet: bool) -> None:
     ctx.obj["config"] = get_config()
     ctx.obj["verbose"] = verbose
 
-    if version:
-        click.echo(f"Python Version Manager v{__version__}")
-        ctx.exit()
-
     if ctx.invoked_subcommand is None:
         ctx.invoke(check)
 
@@ -66,6 +61,9 @@ def cli(ctx: click.Context, version: bool, verbose: bool, quiet: bool) -> None:
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
 def rollback(yes: bool) -> None:
     """Rollback to the previous Python version state."""
+    from .history import HistoryManager
+    from .installers import REMOVERS
+
     try:
         last_action = HistoryManager.get_last_action()
         if not last_action:
@@ -85,27 +83,15 @@ def rollback(yes: bool) -> None:
                 sys.exit(0)
 
         os_name, _ = get_os_info()
-        success = False
-        if os_name == "windows":
-            success = remove_python_windows(version)
-        elif os_name == "linux":
-            success = remove_python_linux(version)
-        elif os_name == "darwin":
-            success = remove_python_macos(version)
-        else:
+        remove_fn = REMOVERS.get(os_name)
+        if remove_fn is None:
             click.echo(f"Unsupported operating system: {os_name}")
             sys.exit(1)
+        success = remove_fn(version)
 
         if success:
             click.echo(f"\nSuccessfully rolled back: Python {version} removed.")
-            history = HistoryManager.get_history()
-            if history:
-                history.pop()
-                try:
-                    with open(HISTORY_FILE, "w") as f:
-                        json.dump(history, f, indent=2)
-                except Exception:
-                    pass
+            HistoryManager.remove_last_action()
         else:
             click.echo("\nRollback encountered issues.")
             sys.exit(1)
@@ -121,6 +107,8 @@ def rollback(yes: bool) -> None:
 @cli.command()
 def check() -> None:
     """Check current Python version against latest stable release."""
+    from .version import check_python_version
+
     try:
         _local_ver, _latest_ver, needs_update = check_python_version(silent=False)
 
@@ -153,13 +141,20 @@ def install(
         pyvm install 3.11.5 --yes
         pyvm install 3.12.1 --installer pyenv
     """
+    from .history import HistoryManager
+    from .installers import (
+        INSTALLERS,
+        show_python_usage_instructions,
+    )
+    from .version import is_python_version_installed
+
     try:
         if not validate_version_string(version) or len(version.split(".")) < 3:
             click.echo(f"Error: Invalid version format: {version}")
             click.echo("Version must be in format: X.Y.Z (e.g., 3.12.1)")
             sys.exit(1)
 
-        local_ver = platform.python_version()
+        local_ver = LOCAL_PY_VER
         click.echo(f"Current Python: {local_ver}")
         click.echo(f"Target version: {version}")
 
@@ -167,6 +162,10 @@ def install(
             click.echo(f"\nPython {version} is already your current version.")
             sys.exit(0)
 
+        if is_python_version_installed(version, exact=True):
+            click.echo(f"\nPython {version} is already installed.")
+            sys.exit(0)
+
         os_name, arch = get_os_info()
         click.echo(f"System: {os_name.title()} ({arch})")
 
@@ -177,16 +176,11 @@ def install(
 
         click.echo(f"\nInstalling Python {version}...")
 
-        success = False
-        if os_name == "windows":
-            success = update_python_windows(version, preferred=installer)
-        elif os_name == "linux":
-            success = update_python_linux(version, build_from_source, preferred=installer)
-        elif os_name == "darwin":
-            success = update_python_macos(version, preferred=installer)
-        else:
+        install_fn = INSTALLERS.get(os_name)
+        if install_fn is None:
             click.echo(f"Unsupported operating system: {os_name}")
             sys.exit(1)
+        success = install_fn(version, preferred=installer, build_from_source=build_from_source)
 
         if success:
             HistoryManager.save_history("install", version)
@@ -208,6 +202,9 @@ def install(
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
 def remove(version: str, yes: bool) -> None:
     """Remove a specific Python version."""
+    from .history import HistoryManager
+    from .installers import REMOVERS
+
     try:
         if not validate_version_string(version):
             click.echo(f"Error: Invalid version format: {version}")
@@ -220,16 +217,11 @@ def remove(version: str, yes: bool) -> None:
                 click.echo("Removal cancelled.")
                 sys.exit(0)
 
-        success = False
-        if os_name == "windows":
-            success = remove_python_windows(version)
-        elif os_name == "linux":
-            success = remove_python_linux(version)
-        elif os_name == "darwin":
-            success = remove_python_macos(version)
-        else:
+        remove_fn = REMOVERS.get(os_name)
+        if remove_fn is None:
             click.echo(f"Unsupported operating system: {os_name}")
             sys.exit(1)
+        success = remove_fn(version)
 
         if success:
             HistoryManager.save_history("remove", version)
@@ -256,39 +248,54 @@ def remove(version: str, yes: bool) -> None:
 )
 def list_versions(show_all: bool) -> None:
     """List available Python versions."""
+    from .version import (
+        get_active_python_releases,
+        get_available_python_versions,
+        get_latest_python_info_with_retry,
+    )
+
     try:
         click.echo("Fetching Python versions...\n")
 
-        local_ver = platform.python_version()
-        local_series = ".".join(local_ver.split(".")[:2])
+        local_ver = LOCAL_PY_VER
 
         if show_all:
-            versions = get_available_python_versions(limit=100)
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Both lookups may hit the network; run them side by side
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                fut_versions = ex.submit(get_available_python_versions, 100)
+                fut_latest = ex.submit(get_latest_python_info_with_retry)
+                versions = fut_versions.result()
+                latest_ver, _ = fut_latest.result()
+
             if not versions:
                 click.echo("Could not fetch available versions.")
                 sys.exit(1)
 
-            latest_ver, _ = get_latest_python_info_with_retry()
+            out = io.StringIO()
+            out.write(f"{'VERSION':<12} {'STATUS'}\n")
+            out.write("-" * 40 + "\n")
 
-            click.echo(f"{'VERSION':<12} {'STATUS'}")
-            click.echo("-" * 40)
+            # "(installed)" wins when the local version is also the latest
+            status_map: dict[str, str] = {}
+            if latest_ver:
+                status_map[latest_ver] = "(latest)"
+            status_map[local_ver] = "(installed)"
 
             for v in versions:
                 ver = v["version"]
-                status = ""
-                if ver == local_ver:
-                    status = "(installed)"
-                elif latest_ver and ver == latest_ver:
-                    status = "(latest)"
-                click.echo(f"{ver:<12} {status}")
+                status = status_map.get(ver, "")
+                out.write(f"{ver:<12} {status}\n")
         else:
             releases = get_active_python_releases()
             if not releases:
                 click.echo("Could not fetch active releases.")
                 sys.exit(1)
 
-            click.echo(f"{'SERIES':<10} {'LATEST':<12} {'STATUS':<15} {'SUPPORT UNTIL'}")
-            click.echo("-" * 55)
+            out = io.StringIO()
+            out.write(f"{'SERIES':<10} {'LATEST':<12} {'STATUS':<15} {'SUPPORT UNTIL'}\n")
+            out.write("-" * 55 + "\n")
 
             for rel in releases:
                 series = rel["series"]
@@ -296,27 +303,19 @@ def list_versions(show_all: bool) -> None:
                 status = rel.get("status", "")
                 end_support = rel.get("end_of_support", "")
 
-                marker = ""
-                if series == local_series:
-                    marker = " *"
+                marker = " *" if series == LOCAL_PY_SERIES else ""
 
-                if "pre-release" in status.lower():
-                    status_display = "pre-release"
-                elif "bugfix" in status.lower():
-                    status_display = "bugfix"
-                elif "security" in status.lower():
-                    status_display = "security"
-                elif "end of life" in status.lower():
-                    status_display = "end-of-life"
-                else:
-                    status_display = status
+                low = status.lower()
+                status_display = next((label for needle, label in _STATUS_LABELS if needle in low), status)
 
-                click.echo(f"{series:<10} {latest:<12} {status_display:<15} {end_support}{marker}")
+                out.write(f"{series:<10} {latest:<12} {status_display:<15} {end_support}{marker}\n")
 
-            click.echo(f"\n * = your installed version ({local_ver})")
-            click.echo("\nUse 'pyvm list --all' to see all patch versions")
+            out.write(f"\n * = your installed version ({local_ver})\n")
+            out.write("\nUse 'pyvm list --all' to see all patch versions\n")
 
-        click.echo("Install with: pyvm install <version>")
+        # Emit the whole table in one write
+        out.write("Install with: pyvm install <version>\n")
+        click.echo(out.getvalue(), nl=False)
 
     except KeyboardInterrupt:
         click.echo("\n\nOperation cancelled.")
@@ -338,8 +337,15 @@ def update(
     installer: str = "auto",
 ) -> None:
     """Download and install Python version (does NOT modify system defaults)."""
+    from .history import HistoryManager
+    from .installers import (
+        INSTALLERS,
+        show_python_usage_instructions,
+    )
+    from .version import check_python_version, is_python_version_installed
+
     try:
-        local_ver = platform.python_version()
+        local_ver = LOCAL_PY_VER
         install_version = None
 
         if target_version:
@@ -369,6 +375,10 @@ def update(
             click.echo(f"\n🚀 Update available: {local_ver} → {latest_ver}")
             install_version = latest_ver
 
+        if is_python_version_installed(install_version, exact=True):
+            click.echo(f"\n✅ Python {install_version} is already installed.")
+            sys.exit(0)
+
         if not auto:
             if not click.confirm(f"\nDo you want to proceed with installing Python {install_version}?"):
                 click.echo("Installation cancelled.")
@@ -377,16 +387,11 @@ def update(
         os_name, arch = get_os_info()
         click.echo(f"\n🖥️  Detected: {os_name.title()} ({arch})")
 
-        success = False
-        if os_name == "windows":
-            success = update_python_windows(install_version, preferred=installer)
-        elif os_name == "linux":
-            success = update_python_linux(install_version, build_from_source, preferred=installer)
-        elif os_name == "darwin":
-            success = update_python_macos(install_version, preferred=installer)
-        else:
+        install_fn = INSTALLERS.get(os_name)
+        if install_fn is None:
             click.echo(f"❌ Unsupported operating system: {os_name}")
             sys.exit(1)
+        success = install_fn(install_version, preferred=installer, build_from_source=build_from_source)
 
         if success:
             HistoryManager.save_history("update", install_version)
@@ -428,19 +433,14 @@ def info() -> None:
         os_name, arch = get_os_info()
         click.echo(f"Operating System: {os_name.title()}")
         click.echo(f"Architecture:     {arch}")
-        click.echo(f"Python Version:   {platform.python_version()}")
+        click.echo(f"Python Version:   {LOCAL_PY_VER}")
         click.echo(f"Python Path:      {sys.executable}")
         click.echo(f"Platform:         {platform.platform()}")
         click.echo(f"\nAdmin/Sudo:       {'Yes' if is_admin() else 'No'}")
 
-        try:
-            result = subprocess.run(["which", "python3"], capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                python3_path = result.stdout.strip()
-                if python3_path != sys.executable:
-                    click.echo(f"python3 command:  {python3_path}")
-        except Exception:
-            pass
+        python3_path = shutil.which("python3")
+        if python3_path and python3_path != sys.executable:
+            click.echo(f"python3 command:  {python3_path}")
 
         click.echo("=" * 50)
 
@@ -463,16 +463,18 @@ def config(show: bool, init_config: bool, path: bool, set_kv: tuple[str, str] |
     """View or manage pyvm configuration."""
     from .config import CONFIG_FILE, get_config
 
+    cfg_exists = CONFIG_FILE.exists()
+
     if path:
         click.echo(f"Config file: {CONFIG_FILE}")
-        if CONFIG_FILE.exists():
+        if cfg_exists:
             click.echo("Status: exists")
         else:
             click.echo("Status: not created (using defaults)")
         return
 
     if init_config:
-        if CONFIG_FILE.exists():
+        if cfg_exists:
             click.echo(f"Config file already exists: {CONFIG_FILE}")
             return
 
@@ -529,14 +531,15 @@ def config(show: bool, init_config: bool, path: bool, set_kv: tuple[str, str] |
     pm = get_plugin_manager()
     click.echo("\nDetected Installers:")
     click.echo("-" * 40)
+    detected = pm.detect_installers()
     for plugin in pm.get_all_plugins():
-        status = "✅ Supported" if plugin.is_supported() else "❌ Not Found"
+        status = "✅ Supported" if detected.get(plugin.get_name()) else "❌ Not Found"
         priority = plugin.get_priority()
         click.echo(f"{plugin.get_name():<12} {status:<15} (Priority: {priority})")
     click.echo("-" * 40)
 
     click.echo(f"\nConfig file: {CONFIG_FILE}")
-    if not CONFIG_FILE.exists():
+    if not cfg_exists:
         click.echo("(Using defaults. Run 'pyvm config --init' to create config file.)")
 
 
@@ -606,8 +609,7 @@ def venv_create(
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def venv_list(as_json: bool) -> None:
     """List all virtual environments."""
-    import json as json_module
-
+    from ._json import dumps
     from .venv import list_venvs
 
     venvs = list_venvs()
@@ -621,7 +623,7 @@ def venv_list(as_json: bool) -> None:
         return
 
     if as_json:
-        click.echo(json_module.dumps(venvs, indent=2))
+        click.echo(dumps(venvs, indent=True))
     else:
         click.echo(f"{'NAME':<20} {'PYTHON':<10} {'STATUS':<10} PATH")
         click.echo("-" * 70)
@@ -681,6 +683,8 @@ def venv_activate(name: str) -> None:
 @cli.command()
 def doctor():
     """Run a health check of the environment."""
+    import requests
+
     click.secho("🩺 Running pyvm-updater health check...", fg="cyan", bold=True)
     click.echo("-" * 40)
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 # Try to import tomllib (Python 3.11+) or fallback to tomli
 try:
@@ -36,32 +38,44 @@ DEFAULT_CONFIG: dict[str, Any] = {
     },
 }
 
+# TOML value renderers for Config.save(), keyed on the exact value type
+_TOML_RENDERERS: dict[type, Callable[[Any], str]] = {
+    bool: lambda v: "true" if v else "false",
+    str: lambda v: f'"{v}"',
+    int: str,
+    float: str,
+}
+
+# Last parsed config file contents, keyed by the file's mtime (ns)
+_parsed_cache: tuple[int, dict[str, Any]] | None = None
+
 
 class Config:
     """Configuration manager for pyvm."""
 
-    _instance: Config | None = None
-    _config: dict[str, Any]
-
-    def __new__(cls) -> Config:
-        """Singleton pattern to ensure only one config instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._config = DEFAULT_CONFIG.copy()
-            cls._instance._load()
-        return cls._instance
+    def __init__(self) -> None:
+        self._config: dict[str, Any] = copy.deepcopy(DEFAULT_CONFIG)
+        self._load()
 
     def _load(self) -> None:
         """Load configuration from file if it exists."""
-        if not CONFIG_FILE.exists():
-            return
+        global _parsed_cache
 
         if tomllib is None:
             return  # Can't parse TOML without library
 
         try:
-            with open(CONFIG_FILE, "rb") as f:
-                user_config = tomllib.load(f)
+            mtime = CONFIG_FILE.stat().st_mtime_ns
+        except OSError:
+            return  # No config file, use defaults
+
+        try:
+            if _parsed_cache is not None and _parsed_cache[0] == mtime:
+                user_config = _parsed_cache[1]
+            else:
+                with open(CONFIG_FILE, "rb") as f:
+                    user_config = tomllib.load(f)
+                _parsed_cache = (mtime, user_config)
             self._merge_config(user_config)
         except Exception:
             pass  # Silently ignore config errors
@@ -70,9 +84,9 @@ class Config:
         """Merge user config into default config."""
         for section, values in user_config.items():
             if section in self._config and isinstance(values, dict):
-                self._config[section].update(values)
+                self._config[section].update(copy.deepcopy(values))
             else:
-                self._config[section] = values
+                self._config[section] = copy.deepcopy(values)
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """Get a configuration value.
@@ -147,20 +161,15 @@ class Config:
             CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
             # Format config as TOML manually (avoid dependency)
-            lines = []
-            for section, values in self._config.items():
-                lines.append(f"[{section}]")
-                for key, value in values.items():
-                    if isinstance(value, bool):
-                        lines.append(f"{key} = {str(value).lower()}")
-                    elif isinstance(value, str):
-                        lines.append(f'{key} = "{value}"')
-                    else:
-                        lines.append(f"{key} = {value}")
-                lines.append("")
-
-            with open(CONFIG_FILE, "w") as f:
-                f.write("\n".join(lines))
+            blocks = [
+                "\n".join(
+                    [f"[{section}]"]
+                    + [f"{key} = {_TOML_RENDERERS.get(type(value), str)(value)}" for key, value in values.items()]
+                )
+                + "\n"
+                for section, values in self._config.items()
+            ]
+            CONFIG_FILE.write_text("\n".join(blocks))
             return True
         except Exception:
             return False
@@ -175,11 +184,10 @@ class Config:
         if CONFIG_FILE.exists():
             return False
 
-        config = Config()
-        return config.save()
+        return get_config().save()
 
 
-# Convenience function
+@functools.cache
 def get_config() -> Config:
-    """Get the global configuration instance."""
+    """Get the shared configuration instance."""
     return Config()
@@ -5,12 +5,15 @@ from pathlib import Path
 
 # Network configuration
 MAX_RETRIES = 3
-RETRY_DELAY = 2  # seconds
+RETRY_DELAY = 2  # seconds, doubled after each failed attempt
+MAX_RETRY_DELAY = 30  # seconds
 DOWNLOAD_TIMEOUT = 120  # seconds
 REQUEST_TIMEOUT = 15  # seconds
 
-# History file location
-HISTORY_FILE = Path.home() / ".pyvm_history.json"
+# History file location (JSON lines, one action per line)
+HISTORY_FILE = Path.home() / ".pyvm_history.jsonl"
+# Pre-JSONL history file, migrated into HISTORY_FILE on first use
+LEGACY_HISTORY_FILE = Path.home() / ".pyvm_history.json"
 
 # Local metadata cache (versions, security, EOL)
 METADATA_DB = Path.home() / ".pyvm_metadata.sqlite"
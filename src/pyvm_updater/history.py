@@ -2,54 +2,194 @@
 
 from __future__ import annotations
 
-import json
+import mmap
+import os
 import platform
 import time
-from typing import Any, cast
+from collections import deque
+from pathlib import Path
+from typing import Any, BinaryIO
 
-from .constants import HISTORY_FILE
+from ._json import dumps_line, loads
+from .constants import HISTORY_FILE, LEGACY_HISTORY_FILE
+
+# Number of most recent entries returned by get_history()
+MAX_HISTORY_ENTRIES = 10
+
+# Once the log grows past this size, save_history() rewrites it down to the
+# last MAX_HISTORY_ENTRIES lines
+_COMPACT_THRESHOLD = 64 * 1024
 
 
 class HistoryManager:
-    """Manages the history of Python version installations and updates."""
+    """Manages the history of Python version installations and updates.
+
+    The history file holds one JSON object per line, so recording an action is
+    a single append and undoing the last one is a truncate. The entries read by
+    get_history() are kept in memory and updated by save_history(); set
+    _cache to None after changing the file behind the manager's back.
+    """
+
+    # (history file, most recent entries), filled lazily by get_history()
+    _cache: tuple[Path, list[dict[Any, Any]]] | None = None
 
     @staticmethod
     def save_history(action: str, version: str) -> None:
-        """Save an action and version to the history file."""
-        history = HistoryManager.get_history()
+        """Append an action and version to the history file."""
         entry = {
             "timestamp": time.time(),
             "action": action,
             "version": version,
             "previous_version": platform.python_version(),
         }
-        history.append(entry)
-
-        # Keep only the last 10 entries
-        history = history[-10:]
 
         try:
             HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(HISTORY_FILE, "w") as f:
-                json.dump(history, f, indent=2)
+            if not HISTORY_FILE.exists():
+                HistoryManager._migrate_legacy()
+            with open(HISTORY_FILE, "ab", buffering=8192) as f:
+                f.write(dumps_line(entry))
+                size = f.tell()
+            if size > _COMPACT_THRESHOLD:
+                HistoryManager._compact()
         except Exception as e:
             print(f"Warning: Could not save history: {e}")
+            return
+
+        cached = HistoryManager._cached_entries()
+        if cached is not None:
+            cached.append(entry)
+            del cached[:-MAX_HISTORY_ENTRIES]
 
     @staticmethod
     def get_history() -> list[dict[Any, Any]]:
-        """Load history from the history file."""
-        if not HISTORY_FILE.exists():
-            return []
+        """Load the most recent entries from the history file."""
+        cached = HistoryManager._cached_entries()
+        if cached is not None:
+            return list(cached)
         try:
-            with open(HISTORY_FILE) as f:
-                return cast(list[dict[Any, Any]], json.load(f))
-        except Exception:
+            with HistoryManager._open() as f:
+                tail = deque((line for line in f if line.strip()), maxlen=MAX_HISTORY_ENTRIES)
+            history = [loads(line) for line in tail]
+        except (OSError, ValueError):
             return []
+        HistoryManager._cache = (HISTORY_FILE, history)
+        return list(history)
 
     @staticmethod
     def get_last_action() -> dict[Any, Any] | None:
         """Get the last successful installation/update action."""
-        history = HistoryManager.get_history()
-        if not history:
+        cached = HistoryManager._cached_entries()
+        if cached is not None:
+            return cached[-1] if cached else None
+        last = HistoryManager._find_last_line()
+        if last is None:
+            return None
+        try:
+            entry = loads(last[1])
+        except ValueError:
             return None
-        return history[-1]
+        return entry if isinstance(entry, dict) else None
+
+    @staticmethod
+    def remove_last_action() -> bool:
+        """Drop the most recent entry from the history file.
+
+        Returns:
+            True if an entry was removed, False otherwise.
+        """
+        last = HistoryManager._find_last_line()
+        if last is None:
+            return False
+        try:
+            os.truncate(HISTORY_FILE, last[0])
+        except OSError:
+            return False
+        HistoryManager._cache = None  # an older entry may now be part of the tail
+        return True
+
+    @staticmethod
+    def _cached_entries() -> list[dict[Any, Any]] | None:
+        """Return the in-memory entries if they belong to the current HISTORY_FILE."""
+        cache = HistoryManager._cache
+        if cache is not None and cache[0] == HISTORY_FILE:
+            return cache[1]
+        return None
+
+    @staticmethod
+    def _open() -> BinaryIO:
+        """Open HISTORY_FILE for reading, migrating a legacy history file first if needed.
+
+        Raises:
+            FileNotFoundError: If there is no history at all.
+        """
+        try:
+            return open(HISTORY_FILE, "rb")
+        except FileNotFoundError:
+            if not HistoryManager._migrate_legacy():
+                raise
+            return open(HISTORY_FILE, "rb")
+
+    @staticmethod
+    def _find_last_line() -> tuple[int, bytes] | None:
+        """Locate the last non-empty line without reading the whole file.
+
+        Returns:
+            Tuple of (byte offset where the line starts, line content), or None.
+        """
+        try:
+            with HistoryManager._open() as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None  # mmap cannot map an empty file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    end = len(mm)
+                    while end > 0 and mm[end - 1] == 0x0A:  # skip trailing newlines
+                        end -= 1
+                    if end == 0:
+                        return None
+                    start = mm.rfind(b"\n", 0, end) + 1
+                    return start, mm[start:end]
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _compact() -> None:
+        """Rewrite the history file keeping only the most recent entries."""
+        with open(HISTORY_FILE, "rb") as f:
+            tail = deque((line for line in f if line.strip()), maxlen=MAX_HISTORY_ENTRIES)
+        tmp = HISTORY_FILE.with_name(HISTORY_FILE.name + ".tmp")
+        tmp.write_bytes(b"".join(tail))
+        os.replace(tmp, HISTORY_FILE)
+
+    @staticmethod
+    def _migrate_legacy() -> bool:
+        """Move entries from LEGACY_HISTORY_FILE into HISTORY_FILE.
+
+        The legacy file is normally a single JSON array; a file that already
+        holds JSON lines is carried over as-is.
+
+        A legacy file that cannot be parsed is left in place untouched.
+
+        Returns:
+            True if a legacy file was found and migrated, False otherwise.
+        """
+        try:
+            data = LEGACY_HISTORY_FILE.read_bytes()
+        except OSError:
+            return False
+        try:
+            if data.lstrip().startswith(b"["):
+                entries = loads(data)
+            else:
+                entries = [loads(line) for line in data.splitlines() if line.strip()]
+        except ValueError:
+            return False
+        if not isinstance(entries, list):
+            return False
+        try:
+            HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            HISTORY_FILE.write_bytes(b"".join(dumps_line(e) for e in entries[-MAX_HISTORY_ENTRIES:]))
+            LEGACY_HISTORY_FILE.unlink()
+        except OSError:
+            return False
+        return True
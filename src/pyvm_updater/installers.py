@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 import click
 
 from .config import get_config
 from .plugins.manager import get_plugin_manager
+from .utils import parse_version
+from .version import invalidate_installed_cache, is_python_version_installed
 
 
-def update_python_windows(version_str: str, preferred: str = "auto", **kwargs: Any) -> bool:
+def update_python_windows(
+    version_str: str, preferred: str = "auto", build_from_source: bool = False, **kwargs: Any
+) -> bool:
     """Update Python on Windows."""
     return _install_with_plugins(version_str, preferred=preferred)
 
@@ -27,13 +31,19 @@ def update_python_linux(
     return _install_with_plugins(version_str, preferred=preferred, **kwargs)
 
 
-def update_python_macos(version_str: str, preferred: str = "auto", **kwargs: Any) -> bool:
+def update_python_macos(
+    version_str: str, preferred: str = "auto", build_from_source: bool = False, **kwargs: Any
+) -> bool:
     """Update Python on macOS."""
     return _install_with_plugins(version_str, preferred=preferred, **kwargs)
 
 
 def _install_with_plugins(version_str: str, preferred: str = "auto", **kwargs: Any) -> bool:
     """Generic installation logic using the plugin system."""
+    if is_python_version_installed(version_str, exact=True):
+        click.echo(f"Python {version_str} is already installed.")
+        return True
+
     pm = get_plugin_manager()
     installer = pm.get_best_installer(preferred=preferred)
 
@@ -47,7 +57,10 @@ def _install_with_plugins(version_str: str, preferred: str = "auto", **kwargs: A
             f"Falling back to '{installer.get_name()}'."
         )
 
-    return installer.install(version_str, **kwargs)
+    try:
+        return installer.install(version_str, **kwargs)
+    finally:
+        invalidate_installed_cache()
 
 
 def remove_python_windows(version_str: str) -> bool:
@@ -70,7 +83,10 @@ def _uninstall_with_plugins(version_str: str) -> bool:
     pm = get_plugin_manager()
     # Try all supported installers until one succeeds
     for installer in pm.get_supported_plugins():
+        if installer.manages(version_str) is False:
+            continue  # Known not to own this version; don't spawn its uninstaller
         if installer.uninstall(version_str):
+            invalidate_installed_cache()
             click.echo(f"[OK] Python {version_str} uninstalled via {installer.get_name()}.")
             return True
 
@@ -80,11 +96,8 @@ def _uninstall_with_plugins(version_str: str) -> bool:
 
 def show_python_usage_instructions(version_str: str, os_name: str) -> None:
     """Show user how to use the newly installed Python version."""
-    try:
-        parts = version_str.split(".")
-        major_minor = f"{parts[0]}.{parts[1]}"
-    except (ValueError, IndexError):
-        major_minor = version_str
+    parts = parse_version(version_str)
+    major_minor = f"{parts[0]}.{parts[1]}" if parts else version_str
 
     click.echo("\n" + "=" * 60)
     click.echo("✅ Installation Complete!")
@@ -104,3 +117,18 @@ def show_python_usage_instructions(version_str: str, os_name: str) -> None:
 
     click.echo("-" * 60)
     click.echo("\n💡 Your old Python remains the system default.")
+
+
+# Entry points keyed by the OS name returned by get_os_info(). Every installer
+# accepts build_from_source so callers can dispatch without branching on the OS.
+INSTALLERS: dict[str, Callable[..., bool]] = {
+    "windows": update_python_windows,
+    "linux": update_python_linux,
+    "darwin": update_python_macos,
+}
+
+REMOVERS: dict[str, Callable[[str], bool]] = {
+    "windows": remove_python_windows,
+    "linux": remove_python_linux,
+    "darwin": remove_python_macos,
+}
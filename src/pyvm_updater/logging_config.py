@@ -8,6 +8,13 @@ import sys
 # Module-level logger
 logger = logging.getLogger("pyvm")
 
+# Formatters are constant, so build them once
+_VERBOSE_FMT = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s", datefmt="%H:%M:%S")
+_PLAIN_FMT = logging.Formatter("%(message)s")
+
+# (verbose, quiet) flags of the last setup_logging() call, None until configured
+_configured: tuple[bool, bool] | None = None
+
 
 def setup_logging(verbose: bool = False, quiet: bool = False) -> logging.Logger:
     """Configure logging for pyvm.
@@ -19,6 +26,16 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> logging.Logger:
     Returns:
         Configured logger instance.
     """
+    global _configured
+
+    # Nothing to do if already set up with the same flags for the current stdout
+    if (
+        _configured == (verbose, quiet)
+        and logger.handlers
+        and getattr(logger.handlers[0], "stream", None) is sys.stdout
+    ):
+        return logger
+
     # Determine log level
     if quiet:
         level = logging.WARNING
@@ -37,15 +54,10 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> logging.Logger:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
 
-    # Simple format for CLI output
-    if verbose:
-        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s", datefmt="%H:%M:%S")
-    else:
-        # Clean format for normal use
-        formatter = logging.Formatter("%(message)s")
-
-    console_handler.setFormatter(formatter)
+    # Timestamps in verbose mode, clean output otherwise
+    console_handler.setFormatter(_VERBOSE_FMT if verbose else _PLAIN_FMT)
     logger.addHandler(console_handler)
+    _configured = (verbose, quiet)
 
     return logger
 
@@ -1,27 +1,68 @@
 from __future__ import annotations
 
+import random
 import sqlite3
 import threading
 import time
+from pathlib import Path
 from typing import Any
 
-import requests  # type: ignore
-from bs4 import BeautifulSoup
+import lxml.html
 
-from .constants import MAX_RETRIES, METADATA_DB, METADATA_TTL_SECONDS, REQUEST_TIMEOUT, RETRY_DELAY
-from .utils import validate_version_string
+from ._http import get_session
+from .constants import MAX_RETRIES, METADATA_DB, METADATA_TTL_SECONDS, REQUEST_TIMEOUT
+from .utils import major_minor, retry_delay, validate_version_string
 
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS series (
+    series TEXT PRIMARY KEY, status TEXT, first_release TEXT, end_of_support TEXT,
+    latest_version TEXT, source TEXT, fetched_at INTEGER
+);
+CREATE TABLE IF NOT EXISTS versions (version TEXT PRIMARY KEY, url TEXT, source TEXT, fetched_at INTEGER);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB, fetched_at INTEGER);
+CREATE INDEX IF NOT EXISTS idx_versions_fetched_at ON versions(fetched_at DESC);
+"""
 
-def _connect() -> sqlite3.Connection:
+# Rows of the "Active Python Releases" list: the <li> entries following the
+# headings row whose last column is "Release schedule"
+_RELEASE_ROWS_XPATH = '//span[normalize-space()="Release schedule"]/ancestor::div[1]/following-sibling::ol[1]/li'
+
+# The "Download Python X.Y.Z" button in the page header
+_DOWNLOAD_BUTTON_XPATH = '(//a[contains(concat(" ", normalize-space(@class), " "), " button ")])[1]'
+
+# Per-thread (database path, connection); the background sync thread gets its own
+_tls = threading.local()
+
+# (database path, last_sync, monotonic time it was read); is_cache_stale() only
+# goes back to SQLite once the entry is older than _LAST_SYNC_RECHECK seconds
+_last_sync_cache: tuple[Path, int | None, float] | None = None
+_LAST_SYNC_RECHECK = 30
+
+
+def connect() -> sqlite3.Connection:
+    """Return this thread's connection to METADATA_DB, creating the schema on first use.
+
+    The connection stays open for the life of the thread and is shared with the
+    key/value cache in cache.py. ``with connect() as conn`` only wraps a
+    transaction; it does not close the connection.
+    """
+    cached = getattr(_tls, "conn", None)
+    if cached is not None:
+        if cached[0] == METADATA_DB:
+            return cached[1]
+        cached[1].close()
     METADATA_DB.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(METADATA_DB))
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS series (series TEXT PRIMARY KEY, status TEXT, first_release TEXT, end_of_support TEXT, latest_version TEXT, source TEXT, fetched_at INTEGER)"
-    )
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS versions (version TEXT PRIMARY KEY, url TEXT, source TEXT, fetched_at INTEGER)"
-    )
-    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    # A rebuildable cache: trade fsync-per-commit durability for write speed, and
+    # wait out the background sync instead of failing with "database is locked"
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-8000")
+    conn.execute("PRAGMA busy_timeout=30000")
+    conn.executescript(_SCHEMA_SQL)
+    _tls.conn = (METADATA_DB, conn)
     return conn
 
 
@@ -29,22 +70,31 @@ def _now() -> int:
     return int(time.time())
 
 
+def _remember_last_sync(last_sync: int | None) -> None:
+    global _last_sync_cache
+    _last_sync_cache = (METADATA_DB, last_sync, time.monotonic())
+
+
 def is_cache_stale() -> bool:
     try:
-        with _connect() as conn:
-            cur = conn.execute("SELECT value FROM meta WHERE key='last_sync'")
-            row = cur.fetchone()
-            if not row:
-                return True
-            last_sync = int(row[0])
-            return (_now() - last_sync) > METADATA_TTL_SECONDS
+        cached = _last_sync_cache
+        if cached is not None and cached[0] == METADATA_DB and time.monotonic() - cached[2] < _LAST_SYNC_RECHECK:
+            last_sync = cached[1]
+        else:
+            row = connect().execute("SELECT value FROM meta WHERE key='last_sync'").fetchone()
+            last_sync = int(row[0]) if row else None
+            _remember_last_sync(last_sync)
+        if last_sync is None:
+            return True
+        # Jitter the TTL so clients that synced together do not all expire together
+        return (_now() - last_sync) > METADATA_TTL_SECONDS * random.uniform(0.9, 1.1)
     except Exception:
         return True
 
 
 def get_releases_from_cache() -> list[dict[str, Any]]:
     try:
-        with _connect() as conn:
+        with connect() as conn:
             cur = conn.execute(
                 "SELECT series, status, first_release, end_of_support, latest_version FROM series ORDER BY series DESC"
             )
@@ -63,9 +113,27 @@ def get_releases_from_cache() -> list[dict[str, Any]]:
         return []
 
 
+def get_latest_from_cache() -> tuple[str | None, str | None]:
+    """Return the (version, download URL) of the download button from the last sync.
+
+    Returns (None, None) if the cache is stale or the page had no usable button.
+    """
+    if is_cache_stale():
+        return None, None
+    try:
+        meta = dict(
+            connect().execute("SELECT key, value FROM meta WHERE key IN ('latest_version', 'latest_url')").fetchall()
+        )
+    except Exception:
+        return None, None
+    if not meta.get("latest_version"):
+        return None, None
+    return meta["latest_version"], meta.get("latest_url") or None
+
+
 def get_versions_from_cache(limit: int = 50) -> list[dict[str, str]]:
     try:
-        with _connect() as conn:
+        with connect() as conn:
             cur = conn.execute("SELECT version, url FROM versions ORDER BY fetched_at DESC LIMIT ?", (limit,))
             rows = cur.fetchall()
             return [{"version": r[0], "url": r[1]} for r in rows]
@@ -73,99 +141,131 @@ def get_versions_from_cache(limit: int = 50) -> list[dict[str, str]]:
         return []
 
 
+def _parse_download_button(tree: Any) -> tuple[str, str]:
+    """Read the version and href of the page's download button ("" when missing)."""
+    buttons = tree.xpath(_DOWNLOAD_BUTTON_XPATH)
+    if not buttons:
+        return "", ""
+    words = buttons[0].text_content().split()
+    ver = words[-1] if words else ""
+    if not validate_version_string(ver):
+        return "", ""
+    href = buttons[0].get("href") or ""
+    if href and not href.startswith("http"):
+        href = f"https://www.python.org{href}"
+    return ver, href
+
+
+def _parse_html_stream(resp: Any) -> Any:
+    """Parse a streamed response's HTML body chunk by chunk as it downloads."""
+    try:
+        resp.raise_for_status()
+        parser = lxml.html.HTMLParser()
+        for chunk in resp.iter_content(64 * 1024):
+            parser.feed(chunk)
+        return parser.close()
+    finally:
+        resp.close()
+
+
 def sync_python_org() -> None:
     url = "https://www.python.org/downloads/"
     for attempt in range(MAX_RETRIES):
         try:
-            resp = requests.get(url, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-            text = soup.get_text()
-            lines = [line.strip() for line in text.split("\n") if line.strip()]
-            start_idx = None
-            for i, line in enumerate(lines):
-                if line == "Release schedule":
-                    start_idx = i + 1
-                    break
+            # Revalidate against the validators of the page the cache was built from
+            validators = dict(
+                connect().execute("SELECT key, value FROM meta WHERE key IN ('etag', 'last_modified')").fetchall()
+            )
+            headers = {}
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+            resp = get_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True)
+            if resp.status_code == 304:
+                resp.close()
+                now = _now()
+                with connect() as conn:
+                    conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES('last_sync', ?)", (str(now),))
+                _remember_last_sync(now)
+                return
+            tree = _parse_html_stream(resp)
             releases: list[dict[str, Any]] = []
-            if start_idx:
-                i = start_idx
-                while i < len(lines) - 5:
-                    line = lines[i]
-                    if validate_version_string(line) and line.count(".") == 1:
-                        series = line
-                        status = lines[i + 1] if i + 1 < len(lines) else ""
-                        first_release = lines[i + 3] if i + 3 < len(lines) else ""
-                        end_support = lines[i + 4] if i + 4 < len(lines) else ""
-                        if status and not status.startswith("Looking for"):
-                            releases.append(
-                                {
-                                    "series": series,
-                                    "status": status,
-                                    "first_release": first_release,
-                                    "end_of_support": end_support,
-                                }
-                            )
-                        i += 6
-                    else:
-                        i += 1
-            release_links = soup.find_all("span", class_="release-number")
+            for row in tree.xpath(_RELEASE_ROWS_XPATH):
+                cells = {
+                    (span.get("class") or "").split(" ")[0]: span.text_content().strip()
+                    for span in row.iterchildren("span")
+                }
+                series = cells.get("release-version", "")
+                status = cells.get("release-status", "")
+                if series.count(".") == 1 and validate_version_string(series) and status:
+                    releases.append(
+                        {
+                            "series": series,
+                            "status": status,
+                            "first_release": cells.get("release-start", ""),
+                            "end_of_support": cells.get("release-end", ""),
+                        }
+                    )
+            # One pass over the release links feeds both the per-series latest
+            # version and the versions table
             series_versions: dict[str, str] = {}
-            for release in release_links:
-                link = release.find("a")
-                if link:
-                    version_text = link.get_text(strip=True)
-                    if version_text.startswith("Python "):
-                        ver = version_text.replace("Python ", "")
-                        if validate_version_string(ver):
-                            parts = ver.split(".")
-                            if len(parts) >= 2:
-                                series = f"{parts[0]}.{parts[1]}"
-                                series_versions.setdefault(series, ver)
-            with _connect() as conn:
-                for rel in releases:
-                    lv = series_versions.get(rel["series"])
-                    conn.execute(
-                        "INSERT OR REPLACE INTO series(series, status, first_release, end_of_support, latest_version, source, fetched_at) VALUES(?,?,?,?,?,?,?)",
-                        (
-                            rel["series"],
-                            rel["status"],
-                            rel["first_release"],
-                            rel["end_of_support"],
-                            lv,
-                            "python.org",
-                            _now(),
-                        ),
+            version_urls: dict[str, str] = {}  # first (newest) link per version
+            for link in tree.xpath('//span[@class="release-number"]/a'):
+                version_text = link.text_content().strip()
+                if not version_text.startswith("Python "):
+                    continue
+                ver = version_text.replace("Python ", "")
+                if not validate_version_string(ver):
+                    continue
+                series_versions.setdefault(major_minor(ver), ver)
+                if ver not in version_urls and len(version_urls) < 200:
+                    href_val = link.get("href") or ""
+                    version_urls[ver] = (
+                        f"https://www.python.org{href_val}"
+                        if href_val and not href_val.startswith("http")
+                        else href_val
                     )
-                conn.execute(
-                    "INSERT OR REPLACE INTO meta(key, value) VALUES('last_sync', ?)",
-                    (str(_now()),),
+            now = _now()
+            series_rows = [
+                (
+                    rel["series"],
+                    rel["status"],
+                    rel["first_release"],
+                    rel["end_of_support"],
+                    series_versions.get(rel["series"]),
+                    "python.org",
+                    now,
+                )
+                for rel in releases
+            ]
+            version_rows = [(ver, full, "python.org", now) for ver, full in version_urls.items()]
+            latest_ver, latest_url = _parse_download_button(tree)
+            # One transaction, one prepared statement per table
+            with connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO series(series, status, first_release, end_of_support, latest_version, source, fetched_at) VALUES(?,?,?,?,?,?,?)",
+                    series_rows,
                 )
-                release_links = soup.find_all("span", class_="release-number")
-                for release in release_links[:200]:
-                    link = release.find("a")
-                    if link:
-                        vt = link.get_text(strip=True)
-                        if vt.startswith("Python "):
-                            ver = vt.replace("Python ", "")
-                            if validate_version_string(ver):
-                                href_val = link.get("href")
-                                if isinstance(href_val, str):
-                                    full = (
-                                        f"https://www.python.org{href_val}"
-                                        if not href_val.startswith("http")
-                                        else href_val
-                                    )
-                                else:
-                                    full = ""
-                                conn.execute(
-                                    "INSERT OR REPLACE INTO versions(version, url, source, fetched_at) VALUES(?,?,?,?)",
-                                    (ver, full, "python.org", _now()),
-                                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO versions(version, url, source, fetched_at) VALUES(?,?,?,?)",
+                    version_rows,
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta(key, value) VALUES(?, ?)",
+                    [
+                        ("last_sync", str(now)),
+                        ("etag", resp.headers.get("ETag") or ""),
+                        ("last_modified", resp.headers.get("Last-Modified") or ""),
+                        ("latest_version", latest_ver),
+                        ("latest_url", latest_url),
+                    ],
+                )
+            _remember_last_sync(now)
             return
         except Exception:
             if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+                time.sleep(retry_delay(attempt))
             else:
                 return
 
@@ -176,18 +276,30 @@ _sync_lock = threading.Lock()
 def start_background_sync_if_stale() -> None:
     if not is_cache_stale():
         return
-    if _sync_lock.locked():
+    # Claim the lock here, not in the thread, so concurrent callers cannot both spawn a sync
+    if not _sync_lock.acquire(blocking=False):
         return
 
-    def _run():
+    def _run() -> None:
         try:
-            _sync_lock.acquire()
             sync_python_org()
         finally:
-            try:
-                _sync_lock.release()
-            except Exception:
-                pass
+            _sync_lock.release()
+
+    try:
+        threading.Thread(target=_run, daemon=True).start()
+    except Exception:
+        _sync_lock.release()
+        raise
+
+
+def wait_for_background_sync(timeout: float = -1) -> bool:
+    """Block until a sync started by start_background_sync_if_stale() finishes.
 
-    t = threading.Thread(target=_run, daemon=True)
-    t.start()
+    Returns:
+        False if the sync is still running after timeout seconds.
+    """
+    if not _sync_lock.acquire(timeout=timeout):
+        return False
+    _sync_lock.release()
+    return True
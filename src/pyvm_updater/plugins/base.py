@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import inspect
 from abc import ABC, abstractmethod
 from typing import Any
 
+# Concrete InstallerPlugin subclasses in definition order. PluginManager takes the
+# classes a plugin file defined from here instead of scanning the module.
+_plugin_registry: list[type[InstallerPlugin]] = []
+
 
 class InstallerPlugin(ABC):
     """Base class for all Python installer plugins."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not inspect.isabstract(cls):
+            _plugin_registry.append(cls)
+
     @abstractmethod
     def get_name(self) -> str:
         """Return the unique name of the installer plugin."""
@@ -44,6 +54,20 @@ class InstallerPlugin(ABC):
         """
         pass
 
+    def manages(self, version: str) -> bool | None:
+        """Cheaply report whether this installer owns a version, without running it.
+
+        Lets callers skip uninstall attempts that would spawn a subprocess only
+        to fail. The default of None means the plugin cannot tell.
+
+        Args:
+            version: The version string to look for.
+
+        Returns:
+            True or False if known, None if the plugin has to be asked directly.
+        """
+        return None
+
     def get_priority(self) -> int:
         """Return the priority of this installer (higher is better).
 
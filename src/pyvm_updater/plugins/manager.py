@@ -2,52 +2,59 @@
 
 from __future__ import annotations
 
+import importlib
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ..config import CONFIG_DIR
-from .base import InstallerPlugin
-from .standard import (
-    AptInstaller,
-    AsdfInstaller,
-    BrewInstaller,
-    CondaInstaller,
-    MicrosoftStoreInstaller,
-    MiseInstaller,
-    PyenvInstaller,
-    SourceInstaller,
-    WindowsInstaller,
+from .base import InstallerPlugin, _plugin_registry
+
+# Built-in plugins as (module, class name), imported when the manager is first created
+_BUILTIN_PLUGINS = (
+    ("pyvm_updater.plugins.standard", "MiseInstaller"),
+    ("pyvm_updater.plugins.standard", "AsdfInstaller"),
+    ("pyvm_updater.plugins.standard", "PyenvInstaller"),
+    ("pyvm_updater.plugins.standard", "BrewInstaller"),
+    ("pyvm_updater.plugins.standard", "CondaInstaller"),
+    ("pyvm_updater.plugins.standard", "AptInstaller"),
+    ("pyvm_updater.plugins.standard", "MicrosoftStoreInstaller"),
+    ("pyvm_updater.plugins.standard", "WindowsInstaller"),
+    ("pyvm_updater.plugins.standard", "SourceInstaller"),
 )
 
+# Disk cache of which installers were found on this machine (used by `pyvm config`)
+_DETECTED_CACHE_KEY = "installers_detected"
+_DETECTED_CACHE_TTL = 60 * 60  # 1h
+
 
 class PluginManager:
     """Manages discovery and loading of installer plugins."""
 
     _instance: PluginManager | None = None
-    _plugins: dict[str, InstallerPlugin] = {}
+    _plugins: dict[str, InstallerPlugin]
+    # Plugin file -> mtime when it was last executed, so unchanged files are not re-run
+    _loaded_files: dict[Path, float]
+    _supported: dict[InstallerPlugin, bool]
+    # Supported plugins by descending priority; reset by (un)register_plugin()
+    _sorted_supported: tuple[InstallerPlugin, ...] | None
 
     def __new__(cls) -> PluginManager:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._plugins = {}
+            cls._instance._supported = {}
+            cls._instance._loaded_files = {}
+            cls._instance._sorted_supported = None
             cls._instance._register_builtins()
             cls._instance._load_custom_plugins()
         return cls._instance
 
     def _register_builtins(self) -> None:
         """Register built-in installer plugins."""
-        builtins = [
-            MiseInstaller(),
-            AsdfInstaller(),
-            PyenvInstaller(),
-            BrewInstaller(),
-            CondaInstaller(),
-            AptInstaller(),
-            MicrosoftStoreInstaller(),
-            WindowsInstaller(),
-            SourceInstaller(),
-        ]
-        for plugin in builtins:
-            self.register_plugin(plugin)
+        for module_name, class_name in _BUILTIN_PLUGINS:
+            plugin_cls = getattr(importlib.import_module(module_name), class_name)
+            self.register_plugin(plugin_cls())
 
     def _load_custom_plugins(self) -> None:
         """Load custom plugins from the user's config directory."""
@@ -62,24 +69,36 @@ class PluginManager:
 
     def _load_plugin_from_file(self, file_path: Path) -> None:
         """Load a plugin from a Python file."""
+        start = len(_plugin_registry)
         try:
+            mtime = file_path.stat().st_mtime
+            if self._loaded_files.get(file_path) == mtime:
+                return
             module_name = f"pyvm_plugins.{file_path.stem}"
             spec = importlib.util.spec_from_file_location(module_name, file_path)
             if spec and spec.loader:
                 module = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(module)
+                self._loaded_files[file_path] = mtime
 
-                # Find classes that inherit from InstallerPlugin
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if isinstance(attr, type) and issubclass(attr, InstallerPlugin) and attr is not InstallerPlugin:
-                        self.register_plugin(attr())
+                # Classes defined while the file ran (in it or in helper modules it
+                # imported) registered themselves via __init_subclass__
+                for plugin_cls in _plugin_registry[start:]:
+                    self.register_plugin(plugin_cls())
         except Exception as e:
             print(f"Error loading plugin from {file_path}: {e}")
+        finally:
+            del _plugin_registry[start:]
 
     def register_plugin(self, plugin: InstallerPlugin) -> None:
         """Register a plugin instance."""
         self._plugins[plugin.get_name()] = plugin
+        self._sorted_supported = None
+
+    def unregister_plugin(self, name: str) -> InstallerPlugin | None:
+        """Remove a plugin by name, returning it if it was registered."""
+        self._sorted_supported = None
+        return self._plugins.pop(name, None)
 
     def get_plugin(self, name: str) -> InstallerPlugin | None:
         """Get a plugin by name."""
@@ -89,21 +108,62 @@ class PluginManager:
         """Get all registered plugins."""
         return list(self._plugins.values())
 
+    def is_plugin_supported(self, plugin: InstallerPlugin) -> bool:
+        """Return plugin.is_supported(), probing each plugin at most once per process."""
+        try:
+            return self._supported[plugin]
+        except KeyError:
+            result = self._supported[plugin] = bool(plugin.is_supported())
+            return result
+
+    def _probe_all(self) -> None:
+        """Probe every plugin not probed yet, concurrently.
+
+        The probes are mostly PATH and filesystem lookups, so running them on a
+        small pool costs about as long as the slowest one instead of the sum.
+        """
+        pending = [p for p in self._plugins.values() if p not in self._supported]
+        if len(pending) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            results = list(executor.map(lambda p: bool(p.is_supported()), pending))
+        self._supported.update(zip(pending, results))
+
     def get_supported_plugins(self) -> list[InstallerPlugin]:
         """Get all plugins supported on the current system, sorted by priority."""
-        supported = [p for p in self._plugins.values() if p.is_supported()]
-        return sorted(supported, key=lambda p: p.get_priority(), reverse=True)
+        if self._sorted_supported is None:
+            self._probe_all()
+            supported = [p for p in self._plugins.values() if self.is_plugin_supported(p)]
+            self._sorted_supported = tuple(sorted(supported, key=lambda p: p.get_priority(), reverse=True))
+        return list(self._sorted_supported)
 
     def get_best_installer(self, preferred: str = "auto") -> InstallerPlugin | None:
         """Get the best installer based on preference and support."""
         if preferred != "auto":
             plugin = self.get_plugin(preferred)
-            if plugin and plugin.is_supported():
+            if plugin and self.is_plugin_supported(plugin):
                 return plugin
 
         supported = self.get_supported_plugins()
         return supported[0] if supported else None
 
+    def detect_installers(self) -> dict[str, bool]:
+        """Map every registered plugin name to whether it is supported here.
+
+        The result is kept in the metadata cache for an hour so repeated
+        `pyvm config` runs skip probing PATH for each installer.
+        """
+        from .. import cache
+
+        detected = cache.get(_DETECTED_CACHE_KEY, _DETECTED_CACHE_TTL)
+        if isinstance(detected, dict) and detected.keys() == self._plugins.keys():
+            return detected
+
+        self._probe_all()
+        detected = {name: self.is_plugin_supported(p) for name, p in self._plugins.items()}
+        cache.put(_DETECTED_CACHE_KEY, detected)
+        return detected
+
 
 # Convenience function
 def get_plugin_manager() -> PluginManager:
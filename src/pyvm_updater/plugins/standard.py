@@ -2,18 +2,125 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
 import shutil
 import subprocess
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from ..utils import download_file, validate_version_string, verify_file_checksum
-from ..version import is_python_version_installed
+from ..config import get_config
+from ..logging_config import get_logger
+from ..utils import (
+    download_and_hash,
+    download_to_pipe,
+    fetch_remote_sha256,
+    parse_version,
+    validate_version_string,
+    verify_file_checksum,
+)
 from .base import InstallerPlugin
 
+log = get_logger("plugins")
+
+
+@functools.cache
+def _which(tool: str) -> str | None:
+    """Look up a tool on PATH once per process; the answer is reused by every plugin."""
+    return shutil.which(tool)
+
+
+@functools.cache
+def _find_conda_exe() -> str | None:
+    """Locate mamba or conda on PATH, or conda in a common Windows install location."""
+    if _which("mamba"):
+        return "mamba"
+    if _which("conda"):
+        return "conda"
+
+    if platform.system() == "Windows":
+        user_profile = os.environ.get("USERPROFILE", "")
+        local_appdata = os.environ.get("LOCALAPPDATA", "")
+        common_paths = [
+            Path(user_profile) / "miniconda3" / "Scripts" / "conda.exe",
+            Path(user_profile) / "anaconda3" / "Scripts" / "conda.exe",
+            Path("C:/ProgramData/miniconda3/Scripts/conda.exe"),
+            Path("C:/ProgramData/anaconda3/Scripts/conda.exe"),
+            Path("D:/miniconda3/Scripts/conda.exe"),
+            Path("D:/anaconda3/Scripts/conda.exe"),
+            Path(local_appdata) / "miniconda3" / "Scripts" / "conda.exe",
+            Path(local_appdata) / "anaconda3" / "Scripts" / "conda.exe",
+        ]
+        for path in common_paths:
+            if path.exists():
+                return str(path)
+    return None
+
+
+def _usable_cpus() -> int:
+    """Number of CPUs this process may run on (respects cpusets/affinity, unlike os.cpu_count())."""
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return len(os.sched_getaffinity(0)) or 1
+        except OSError:
+            pass
+    return os.cpu_count() or 2
+
+
+def _version_dir_exists(versions_dir: str, version: str) -> bool | None:
+    """Check for an X.Y.Z install directory; None for partial versions the tool resolves itself."""
+    if version.count(".") < 2:
+        return None
+    return os.path.isdir(os.path.join(versions_dir, version))
+
+
+def _apt_lists_fresh(max_age: float = 3600) -> bool:
+    """Return True if the apt package lists were refreshed within max_age seconds."""
+    try:
+        return time.time() - os.stat("/var/lib/apt/lists").st_mtime < max_age
+    except OSError:
+        return False
+
+
+def _winget_uninstall(major_minor: str, silent: bool = True) -> bool:
+    """Uninstall the winget package providing Python major_minor.
+
+    A single ``winget list`` resolves which of the known package IDs is
+    installed, so only that one is uninstalled. When the listing does not show
+    either ID (winget shortens long IDs with "…", or an older winget rejects
+    the flags), each ID is tried in turn instead.
+    """
+    candidates = [f"Python.Python.{major_minor}", f"PythonSoftwareFoundation.Python.{major_minor}"]
+    flags = ["--accept-source-agreements", "--disable-interactivity"]
+
+    def uninstall(pkg_id: str, extra: list[str]) -> bool:
+        cmd = ["winget", "uninstall", "--exact", "--id", pkg_id] + extra
+        if silent:
+            cmd.append("--silent")
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        return result.returncode == 0
+
+    try:
+        listing = subprocess.run(
+            ["winget", "list", "--id", f"Python.{major_minor}"] + flags,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            check=False,
+        )
+        installed = set(listing.stdout.split())
+        pkg_id = next((c for c in candidates if c in installed), None)
+        if pkg_id is not None:
+            return uninstall(pkg_id, flags)
+        return any(uninstall(c, ["--accept-source-agreements"]) for c in candidates)
+    except Exception:
+        return False
+
 
 class MiseInstaller(InstallerPlugin):
     """Installer using mise-en-place."""
@@ -22,25 +129,25 @@ class MiseInstaller(InstallerPlugin):
         return "mise"
 
     def is_supported(self) -> bool:
-        return bool(shutil.which("mise"))
+        return bool(_which("mise"))
 
     def install(self, version: str, **kwargs: Any) -> bool:
-        print(f"Using mise to install Python {version}...")
+        log.info(f"Using mise to install Python {version}...")
         try:
             result = subprocess.run(["mise", "install", f"python@{version}"], check=False)
             if result.returncode != 0:
                 # Try major.minor if exact version fails
-                parts = version.split(".")
-                if len(parts) >= 2:
+                parts = parse_version(version)
+                if parts:
                     major_minor = f"{parts[0]}.{parts[1]}"
                     result = subprocess.run(["mise", "install", f"python@{major_minor}"], check=False)
 
             if result.returncode == 0:
-                print(f"\n[OK] Python {version} installed via mise!")
-                print(f"\nTo use: mise use python@{version}")
+                log.info(f"\n[OK] Python {version} installed via mise!")
+                log.info(f"\nTo use: mise use python@{version}")
                 return True
         except Exception as e:
-            print(f"mise error: {e}")
+            log.error(f"mise error: {e}")
         return False
 
     def uninstall(self, version: str) -> bool:
@@ -48,13 +155,19 @@ class MiseInstaller(InstallerPlugin):
             result = subprocess.run(
                 ["mise", "uninstall", f"python@{version}"],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             return result.returncode == 0
         except Exception:
             return False
 
+    def manages(self, version: str) -> bool | None:
+        data_dir = os.environ.get("MISE_DATA_DIR") or os.path.join(
+            os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share"), "mise"
+        )
+        return _version_dir_exists(os.path.join(data_dir, "installs", "python"), version)
+
     def get_priority(self) -> int:
         return 100
 
@@ -66,17 +179,17 @@ class PyenvInstaller(InstallerPlugin):
         return "pyenv"
 
     def is_supported(self) -> bool:
-        return bool(shutil.which("pyenv"))
+        return bool(_which("pyenv"))
 
     def install(self, version: str, **kwargs: Any) -> bool:
-        print(f"Using pyenv to install Python {version}...")
+        log.info(f"Using pyenv to install Python {version}...")
         try:
             result = subprocess.run(["pyenv", "install", "-s", version], check=False)
             if result.returncode == 0:
-                print(f"\n[OK] Python {version} installed via pyenv!")
+                log.info(f"\n[OK] Python {version} installed via pyenv!")
                 return True
         except Exception as e:
-            print(f"pyenv error: {e}")
+            log.error(f"pyenv error: {e}")
         return False
 
     def uninstall(self, version: str) -> bool:
@@ -84,13 +197,17 @@ class PyenvInstaller(InstallerPlugin):
             result = subprocess.run(
                 ["pyenv", "uninstall", "-f", version],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             return result.returncode == 0
         except Exception:
             return False
 
+    def manages(self, version: str) -> bool | None:
+        root = os.environ.get("PYENV_ROOT") or os.path.expanduser("~/.pyenv")
+        return _version_dir_exists(os.path.join(root, "versions"), version)
+
     def get_priority(self) -> int:
         return 90
 
@@ -102,28 +219,28 @@ class BrewInstaller(InstallerPlugin):
         return "brew"
 
     def is_supported(self) -> bool:
-        return platform.system() == "Darwin" and bool(shutil.which("brew"))
+        return platform.system() == "Darwin" and bool(_which("brew"))
 
     def install(self, version: str, **kwargs: Any) -> bool:
-        parts = version.split(".")
-        if len(parts) < 2:
+        parts = parse_version(version)
+        if not parts:
             return False
         major_minor = f"{parts[0]}.{parts[1]}"
 
-        print(f"Using Homebrew to install Python {major_minor}...")
+        log.info(f"Using Homebrew to install Python {major_minor}...")
         try:
-            subprocess.run(["brew", "update"], check=False, capture_output=True)
+            subprocess.run(["brew", "update"], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             result = subprocess.run(["brew", "install", f"python@{major_minor}"], check=False)
             if result.returncode == 0:
-                print(f"[OK] Python {version} installed via Homebrew")
+                log.info(f"[OK] Python {version} installed via Homebrew")
                 return True
         except Exception as e:
-            print(f"Homebrew error: {e}")
+            log.error(f"Homebrew error: {e}")
         return False
 
     def uninstall(self, version: str) -> bool:
-        parts = version.split(".")
-        if len(parts) < 2:
+        parts = parse_version(version)
+        if not parts:
             return False
         major_minor = f"{parts[0]}.{parts[1]}"
         pkg_name = f"python@{major_minor}"
@@ -131,8 +248,8 @@ class BrewInstaller(InstallerPlugin):
         try:
             check_brew = subprocess.run(
                 ["brew", "list", pkg_name],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False,
             )
             if check_brew.returncode == 0:
@@ -153,38 +270,48 @@ class AptInstaller(InstallerPlugin):
         return "apt"
 
     def is_supported(self) -> bool:
-        return platform.system() == "Linux" and bool(shutil.which("apt"))
+        return platform.system() == "Linux" and bool(_which("apt"))
 
     def install(self, version: str, **kwargs: Any) -> bool:
-        parts = version.split(".")
-        if len(parts) < 2:
+        parts = parse_version(version)
+        if not parts:
             return False
         major_minor = f"{parts[0]}.{parts[1]}"
 
-        print("Using apt package manager...")
-        sudo_prefix = ["sudo"] if shutil.which("sudo") else []
-        commands = [
-            sudo_prefix + ["apt", "update"],
-            sudo_prefix + ["apt", "install", "-y", "software-properties-common"],
-            sudo_prefix + ["add-apt-repository", "-y", "ppa:deadsnakes/ppa"],
-            sudo_prefix + ["apt", "update"],
-            sudo_prefix + ["apt", "install", "-y", f"python{major_minor}"],
-            sudo_prefix + ["apt", "install", "-y", f"python{major_minor}-venv", f"python{major_minor}-distutils"],
-        ]
+        log.info("Using apt package manager...")
+        sudo_prefix = ["sudo"] if _which("sudo") else []
+        packages = [f"python{major_minor}", f"python{major_minor}-venv"]
+        if (int(parts[0]), int(parts[1])) < (3, 12):  # distutils was removed in 3.12
+            packages.append(f"python{major_minor}-distutils")
+
+        # apt-get rather than apt: its CLI is stable for scripts and never pages.
+        # add-apt-repository refreshes the package lists itself after adding the PPA.
+        setup = []
+        if not _which("add-apt-repository"):
+            if not _apt_lists_fresh():
+                setup.append(sudo_prefix + ["apt-get", "update"])
+            setup.append(sudo_prefix + ["apt-get", "install", "-y", "software-properties-common"])
+        setup.append(sudo_prefix + ["add-apt-repository", "-y", "ppa:deadsnakes/ppa"])
+        install_cmd = sudo_prefix + ["apt-get", "install", "-y", *packages]
 
-        for cmd in commands:
-            print(f"Running: {' '.join(cmd)}")
-            try:
+        try:
+            for cmd in setup:
+                log.debug(f"Running: {' '.join(cmd)}")
                 result = subprocess.run(cmd, check=False)
                 if result.returncode != 0:
-                    print(f"Warning: Command returned {result.returncode}")
-            except Exception as e:
-                print(f"Error: {e}")
-                return False
+                    log.warning(f"Warning: Command returned {result.returncode}")
+            log.debug(f"Running: {' '.join(install_cmd)}")
+            result = subprocess.run(install_cmd, check=False)
+        except Exception as e:
+            log.error(f"Error: {e}")
+            return False
+        if result.returncode != 0:
+            log.error(f"apt-get install failed with exit code {result.returncode}")
+            return False
 
         python_path = f"/usr/bin/python{major_minor}"
         if os.path.exists(python_path):
-            print(f"\n[OK] Python {major_minor} installed at {python_path}")
+            log.info(f"\n[OK] Python {major_minor} installed at {python_path}")
             return True
         return False
 
@@ -206,35 +333,27 @@ class WindowsInstaller(InstallerPlugin):
         return platform.system() == "Windows"
 
     def install(self, version: str, **kwargs: Any) -> bool:
-        print(f"\n🪟 Windows detected - Downloading Python installer for {version}...")
+        log.info(f"\n🪟 Windows detected - Downloading Python installer for {version}...")
 
         if not validate_version_string(version):
-            print(f"Error: Invalid version string: {version}")
+            log.error(f"Error: Invalid version string: {version}")
             return False
 
-        try:
-            parts = version.split(".")
-            if len(parts) < 3:
-                print(f"Error: Version must be major.minor.patch format: {version}")
-                return False
-            major, minor = parts[0], parts[1]
-        except (ValueError, IndexError) as e:
-            print(f"Error parsing version: {e}")
+        parts = parse_version(version)
+        if not parts or parts[2] is None:
+            log.error(f"Error: Version must be major.minor.patch format: {version}")
             return False
+        major, minor, _ = parts
 
         machine = platform.machine().lower()
         if machine in ["amd64", "x86_64"]:
             arch = "amd64"
         elif machine in ["arm64", "aarch64"]:
-            try:
-                major_int, minor_int = int(major), int(minor)
-                if major_int < 3 or (major_int == 3 and minor_int < 11):
-                    print("ARM64 installers are only available for Python 3.11+")
-                    arch = "amd64"
-                else:
-                    arch = "arm64"
-            except (ValueError, TypeError):
+            if (int(major), int(minor)) < (3, 11):
+                log.info("ARM64 installers are only available for Python 3.11+")
                 arch = "amd64"
+            else:
+                arch = "arm64"
         else:
             arch = "win32"
 
@@ -242,21 +361,31 @@ class WindowsInstaller(InstallerPlugin):
         temp_dir = tempfile.gettempdir()
         installer_path = os.path.join(temp_dir, f"python-{version}-installer.exe")
 
-        print(f"Downloading from: {installer_url}")
-        if not download_file(installer_url, installer_path):
+        checksum_url = installer_url + ".sha256"
+        expected = None
+
+        # The checksum file is tiny; fetch it while the installer downloads
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            checksum_future = None
+            if get_config().verify_checksum:
+                checksum_future = executor.submit(fetch_remote_sha256, checksum_url)
+            log.info(f"Downloading from: {installer_url}")
+            actual = download_and_hash(installer_url, installer_path)
+            if checksum_future is not None:
+                expected = checksum_future.result()
+        if actual is None:
             return False
 
-        checksum_url = installer_url + ".sha256"
-        if not verify_file_checksum(installer_path, checksum_url):
-            print("❌ Aborting installation due to integrity check failure")
+        if not verify_file_checksum(installer_path, checksum_url, expected=expected, actual=actual):
+            log.error("❌ Aborting installation due to integrity check failure")
             try:
                 os.remove(installer_path)
             except OSError:
                 pass
             return False
 
-        print("\n⚠️  Starting installer...")
-        print("Please follow the installer prompts.")
+        log.info("\n⚠️  Starting installer...")
+        log.info("Please follow the installer prompts.")
 
         try:
             cmd = [installer_path]
@@ -276,16 +405,16 @@ class WindowsInstaller(InstallerPlugin):
             if result.returncode != 0:
                 # 1602: User cancelled, 1603: Fatal error during installation (common for cancellation)
                 if result.returncode in [1602, 1603]:
-                    print("\n❌ Installation cancelled or interrupted by user.")
+                    log.error("\n❌ Installation cancelled or interrupted by user.")
                 else:
-                    print(f"\n❌ Installer failed with exit code {result.returncode}")
+                    log.error(f"\n❌ Installer failed with exit code {result.returncode}")
                 return False
 
             # Additional check: If it returned 0 but was cancelled, we can't easily tell,
             # but usually returncode is reliable.
             return True
         except Exception as e:
-            print(f"\n❌ Error running installer: {e}")
+            log.error(f"\n❌ Error running installer: {e}")
             return False
         finally:
             try:
@@ -295,29 +424,16 @@ class WindowsInstaller(InstallerPlugin):
                 pass
 
     def uninstall(self, version: str) -> bool:
+        from ..version import is_python_version_installed  # pulls in requests/bs4
+
         if not is_python_version_installed(version):
             return False
 
         # Try winget
-        if shutil.which("winget"):
-            major_minor = ".".join(version.split(".")[:2])
-            potential_ids = [
-                f"Python.Python.{major_minor}",
-                f"PythonSoftwareFoundation.Python.{major_minor}",
-            ]
-
-            for pkg_id in potential_ids:
-                try:
-                    result = subprocess.run(
-                        ["winget", "uninstall", "--id", pkg_id, "--silent"],
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                    )
-                    if result.returncode == 0:
-                        return True
-                except Exception:
-                    continue
+        if _which("winget"):
+            parts = parse_version(version)
+            major_minor = f"{parts[0]}.{parts[1]}" if parts else version
+            return _winget_uninstall(major_minor)
         return False
 
     def get_priority(self) -> int:
@@ -331,16 +447,16 @@ class MicrosoftStoreInstaller(InstallerPlugin):
         return "store"
 
     def is_supported(self) -> bool:
-        return platform.system() == "Windows" and bool(shutil.which("winget"))
+        return platform.system() == "Windows" and bool(_which("winget"))
 
     def install(self, version: str, **kwargs: Any) -> bool:
-        parts = version.split(".")
-        if len(parts) < 2:
-            print("Error: Version must be at least major.minor for Store installation.")
+        parts = parse_version(version)
+        if not parts:
+            log.error("Error: Version must be at least major.minor for Store installation.")
             return False
         major_minor = f"{parts[0]}.{parts[1]}"
 
-        print(f"Using winget to install Python {major_minor} from Microsoft Store...")
+        log.info(f"Using winget to install Python {major_minor} from Microsoft Store...")
         try:
             # Microsoft Store Python packages usually follow this ID pattern
             pkg_id = f"Python.Python.{major_minor}"
@@ -359,7 +475,7 @@ class MicrosoftStoreInstaller(InstallerPlugin):
             )
 
             if result.returncode == 0:
-                print(f"\n[OK] Python {major_minor} installed via Microsoft Store!")
+                log.info(f"\n[OK] Python {major_minor} installed via Microsoft Store!")
                 return True
             else:
                 # Try alternate ID if first one fails
@@ -378,30 +494,18 @@ class MicrosoftStoreInstaller(InstallerPlugin):
                     check=False,
                 )
                 if result.returncode == 0:
-                    print(f"\n[OK] Python {major_minor} installed via Microsoft Store!")
+                    log.info(f"\n[OK] Python {major_minor} installed via Microsoft Store!")
                     return True
 
         except Exception as e:
-            print(f"winget error: {e}")
+            log.error(f"winget error: {e}")
         return False
 
     def uninstall(self, version: str) -> bool:
-        parts = version.split(".")
-        if len(parts) < 2:
-            return False
-        major_minor = f"{parts[0]}.{parts[1]}"
-
-        try:
-            pkg_id = f"Python.Python.{major_minor}"
-            result = subprocess.run(["winget", "uninstall", "--id", pkg_id], check=False, capture_output=True)
-            if result.returncode == 0:
-                return True
-
-            alt_pkg_id = f"PythonSoftwareFoundation.Python.{major_minor}"
-            result = subprocess.run(["winget", "uninstall", "--id", alt_pkg_id], check=False, capture_output=True)
-            return result.returncode == 0
-        except Exception:
+        parts = parse_version(version)
+        if not parts:
             return False
+        return _winget_uninstall(f"{parts[0]}.{parts[1]}", silent=False)
 
     def get_priority(self) -> int:
         return 75  # Higher than standard Windows installer, lower than pyenv/mise
@@ -417,31 +521,60 @@ class SourceInstaller(InstallerPlugin):
         return platform.system() == "Linux"
 
     def install(self, version: str, **kwargs: Any) -> bool:
-        print(f"⚙️ Preparing build environment for {version}...")
-
-        # Ensure dependencies (simplified version of install_pyenv_linux logic)
-        if not self._install_dependencies():
-            return False
+        log.info(f"⚙️ Preparing build environment for {version}...")
 
         source_url = f"https://www.python.org/ftp/python/{version}/Python-{version}.tar.xz"
-        temp_dir = tempfile.gettempdir()
-        source_path = os.path.join(temp_dir, f"Python-{version}.tar.xz")
 
-        if not download_file(source_url, source_path):
-            print("❌ Failed to download source code.")
-            return False
+        # The build needs sudo for `make altinstall` anyway; ask for the password now
+        # so the prompt is not drawn over by the download progress bar
+        if _which("sudo"):
+            subprocess.run(["sudo", "-v"], check=False)
 
-        build_dir = os.path.join(temp_dir, f"Python-{version}")
+        # Extract into a private directory so nothing from an archive that fails
+        # verification is left in the shared temp dir
+        work_dir = tempfile.mkdtemp(prefix="pyvm-src-")
+        build_dir = os.path.join(work_dir, f"Python-{version}")
         try:
-            print("📦 Extracting and Compiling (this will take a few minutes)...")
-            subprocess.run(["tar", "-xf", source_path, "-C", temp_dir], check=True)
+            return self._fetch_and_build(source_url, work_dir, build_dir, **kwargs)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _fetch_and_build(self, source_url: str, work_dir: str, build_dir: str, **kwargs: Any) -> bool:
+        """Download and verify the sources into work_dir, then build them in build_dir."""
+        # Stream the tarball straight into tar (hashing as it goes) and fetch the
+        # checksum while the build dependencies install. The archive never touches
+        # disk; a tree that fails verification is removed before anything is built.
+        # Let xz decompress on all cores; a user-provided XZ_OPT wins.
+        tar_env = {**os.environ, "XZ_OPT": os.environ.get("XZ_OPT", "-T0")}
+        checksum_url = source_url + ".sha256"
+        expected = None
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            download = executor.submit(download_to_pipe, source_url, ["tar", "-xJf", "-"], work_dir, tar_env)
+            checksum_future = None
+            if get_config().verify_checksum:
+                checksum_future = executor.submit(fetch_remote_sha256, checksum_url)
+            deps_ok = self._install_dependencies()
+            actual = download.result()
+            if checksum_future is not None:
+                expected = checksum_future.result()
+
+        if actual is None:
+            log.error("❌ Failed to download source code.")
+        elif deps_ok and not verify_file_checksum(source_url, checksum_url, expected=expected, actual=actual):
+            log.error("❌ Aborting build due to integrity check failure")
+            actual = None
+
+        if not deps_ok or actual is None:
+            return False
 
-            print(f"🔧 Configuring and building with {os.cpu_count() or 2} cores...")
-            cpu_cores = str(os.cpu_count() or 2)
+        try:
+            log.info("📦 Compiling (this will take a few minutes)...")
+            cpu_cores = str(_usable_cpus())
+            log.info(f"🔧 Configuring and building with {cpu_cores} cores...")
 
             configure_cmd = ["./configure"]
             if kwargs.get("optimizations", True):
-                configure_cmd.append("--enable-optimizations")
+                configure_cmd += ["--enable-optimizations", "--with-lto"]
 
             if kwargs.get("install_path"):
                 configure_cmd.append(f"--prefix={kwargs['install_path']}")
@@ -452,13 +585,8 @@ class SourceInstaller(InstallerPlugin):
 
             return True
         except Exception as e:
-            print(f"❌ Build failed: {e}")
+            log.error(f"❌ Build failed: {e}")
             return False
-        finally:
-            if os.path.exists(build_dir):
-                shutil.rmtree(build_dir, ignore_errors=True)
-            if os.path.exists(source_path):
-                os.remove(source_path)
 
     def uninstall(self, version: str) -> bool:
         # Source uninstallation is manual
@@ -469,12 +597,12 @@ class SourceInstaller(InstallerPlugin):
 
     def _install_dependencies(self) -> bool:
         """Install build dependencies on Linux."""
-        if not shutil.which("curl") or not shutil.which("bash"):
+        if not _which("curl") or not _which("bash"):
             return False
 
-        pkg_mgr = "dnf" if shutil.which("dnf") else "yum"
-        if not shutil.which(pkg_mgr):
-            if shutil.which("apt"):
+        pkg_mgr = "dnf" if _which("dnf") else "yum"
+        if not _which(pkg_mgr):
+            if _which("apt"):
                 pkg_mgr = "apt"
             else:
                 return False
@@ -511,16 +639,54 @@ class SourceInstaller(InstallerPlugin):
                 "libffi-dev",
             ]
 
+        if self._dependencies_present(pkg_mgr, deps):
+            return True
+
         try:
-            prefix = ["sudo"] if shutil.which("sudo") else []
+            prefix = ["sudo"] if _which("sudo") else []
+            # Headers and toolchains only: skip recommended/weak packages (tk-dev
+            # alone would otherwise pull in a large X11 stack)
             if pkg_mgr == "apt":
-                subprocess.run(prefix + ["apt", "update"], check=True)
-                subprocess.run(prefix + ["apt", "install", "-y"] + deps, check=True)
+                subprocess.run(prefix + ["apt-get", "update"], check=True)
+                subprocess.run(
+                    prefix + ["apt-get", "install", "-y", "--no-install-recommends", "--no-install-suggests"] + deps,
+                    check=True,
+                )
+            elif pkg_mgr == "dnf":
+                subprocess.run(prefix + ["dnf", "install", "-y", "--setopt=install_weak_deps=False"] + deps, check=True)
             else:
                 subprocess.run(prefix + [pkg_mgr, "install", "-y"] + deps, check=True)
             return True
         except Exception as e:
-            print(f"Error installing dependencies: {e}")
+            log.error(f"Error installing dependencies: {e}")
+            return False
+
+    def _dependencies_present(self, pkg_mgr: str, deps: list[str]) -> bool:
+        """Check with a single package-database query whether all deps are installed.
+
+        On apt systems each package's dpkg status must be "install ok installed";
+        ``dpkg -s`` alone also succeeds for packages that were removed but left
+        their config files behind.
+        """
+        if not _which("dpkg-query" if pkg_mgr == "apt" else "rpm"):
+            return False
+        try:
+            if pkg_mgr == "apt":
+                result = subprocess.run(
+                    ["dpkg-query", "-W", "-f=${Status}\n"] + deps,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    errors="replace",
+                    check=False,
+                )
+                statuses = result.stdout.splitlines()
+                return result.returncode == 0 and bool(statuses) and all(s == "install ok installed" for s in statuses)
+            result = subprocess.run(
+                ["rpm", "-q"] + deps, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+            )
+            return result.returncode == 0
+        except Exception:
             return False
 
 
@@ -531,56 +697,15 @@ class CondaInstaller(InstallerPlugin):
         return "conda"
 
     def is_supported(self) -> bool:
-        if shutil.which("conda") or shutil.which("mamba"):
-            return True
-
-        # On Windows, check common paths
-        if platform.system() == "Windows":
-            user_profile = os.environ.get("USERPROFILE", "")
-            local_appdata = os.environ.get("LOCALAPPDATA", "")
-            common_paths = [
-                Path(user_profile) / "miniconda3" / "Scripts" / "conda.exe",
-                Path(user_profile) / "anaconda3" / "Scripts" / "conda.exe",
-                Path("C:/ProgramData/miniconda3/Scripts/conda.exe"),
-                Path("C:/ProgramData/anaconda3/Scripts/conda.exe"),
-                Path("D:/miniconda3/Scripts/conda.exe"),
-                Path("D:/anaconda3/Scripts/conda.exe"),
-                Path(local_appdata) / "miniconda3" / "Scripts" / "conda.exe",
-                Path(local_appdata) / "anaconda3" / "Scripts" / "conda.exe",
-            ]
-            for path in common_paths:
-                if path.exists():
-                    return True
-        return False
+        return _find_conda_exe() is not None
 
     def _get_exe(self) -> str:
         """Get the executable path for conda/mamba."""
-        if shutil.which("mamba"):
-            return "mamba"
-        if shutil.which("conda"):
-            return "conda"
-
-        if platform.system() == "Windows":
-            user_profile = os.environ.get("USERPROFILE", "")
-            local_appdata = os.environ.get("LOCALAPPDATA", "")
-            common_paths = [
-                Path(user_profile) / "miniconda3" / "Scripts" / "conda.exe",
-                Path(user_profile) / "anaconda3" / "Scripts" / "conda.exe",
-                Path("C:/ProgramData/miniconda3/Scripts/conda.exe"),
-                Path("C:/ProgramData/anaconda3/Scripts/conda.exe"),
-                Path("D:/miniconda3/Scripts/conda.exe"),
-                Path("D:/anaconda3/Scripts/conda.exe"),
-                Path(local_appdata) / "miniconda3" / "Scripts" / "conda.exe",
-                Path(local_appdata) / "anaconda3" / "Scripts" / "conda.exe",
-            ]
-            for path in common_paths:
-                if path.exists():
-                    return str(path)
-        return "conda"
+        return _find_conda_exe() or "conda"
 
     def install(self, version: str, **kwargs: Any) -> bool:
         exe = self._get_exe()
-        print(f"Using {exe} to install Python {version}...")
+        log.info(f"Using {exe} to install Python {version}...")
         try:
             # Conda installs into environments. We'll create one named pyvm-<version>
             env_name = f"pyvm-{version}"
@@ -589,11 +714,11 @@ class CondaInstaller(InstallerPlugin):
                 check=False,
             )
             if result.returncode == 0:
-                print(f"\n[OK] Python {version} installed via {exe} in environment: {env_name}")
-                print(f"To use: {exe} activate {env_name}")
+                log.info(f"\n[OK] Python {version} installed via {exe} in environment: {env_name}")
+                log.info(f"To use: {exe} activate {env_name}")
                 return True
         except Exception as e:
-            print(f"{exe} error: {e}")
+            log.error(f"{exe} error: {e}")
         return False
 
     def uninstall(self, version: str) -> bool:
@@ -603,8 +728,8 @@ class CondaInstaller(InstallerPlugin):
             result = subprocess.run(
                 [exe, "env", "remove", "-y", "-n", env_name],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             return result.returncode == 0
         except Exception:
@@ -621,25 +746,26 @@ class AsdfInstaller(InstallerPlugin):
         return "asdf"
 
     def is_supported(self) -> bool:
-        return bool(shutil.which("asdf"))
+        return bool(_which("asdf"))
 
     def install(self, version: str, **kwargs: Any) -> bool:
-        print(f"Using asdf to install Python {version}...")
+        log.info(f"Using asdf to install Python {version}...")
         try:
             # Ensure python plugin is installed
             subprocess.run(
                 ["asdf", "plugin", "add", "python"],
                 check=False,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
             result = subprocess.run(["asdf", "install", "python", version], check=False)
             if result.returncode == 0:
-                print(f"\n[OK] Python {version} installed via asdf!")
-                print(f"To use: asdf global python {version}")
+                log.info(f"\n[OK] Python {version} installed via asdf!")
+                log.info(f"To use: asdf global python {version}")
                 return True
         except Exception as e:
-            print(f"asdf error: {e}")
+            log.error(f"asdf error: {e}")
         return False
 
     def uninstall(self, version: str) -> bool:
@@ -647,12 +773,16 @@ class AsdfInstaller(InstallerPlugin):
             result = subprocess.run(
                 ["asdf", "uninstall", "python", version],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             return result.returncode == 0
         except Exception:
             return False
 
+    def manages(self, version: str) -> bool | None:
+        data_dir = os.environ.get("ASDF_DATA_DIR") or os.path.expanduser("~/.asdf")
+        return _version_dir_exists(os.path.join(data_dir, "installs", "python"), version)
+
     def get_priority(self) -> int:
         return 95
@@ -22,7 +22,6 @@ except ImportError:
     sys.exit(1)
 
 # Import from new modular structure
-from .constants import HISTORY_FILE
 from .history import HistoryManager
 from .installers import (
     remove_python_linux,
@@ -32,6 +31,7 @@ from .installers import (
     update_python_macos,
     update_python_windows,
 )
+from .metadata_store import wait_for_background_sync
 from .utils import get_os_info
 from .version import check_python_version, get_active_python_releases, get_installed_python_versions
 from .wizard import WizardScreen
@@ -406,9 +406,16 @@ class MainScreen(Screen):
             self.installed_versions = await asyncio.to_thread(get_installed_python_versions)
             await self._populate_installed_list()
 
-            # Get available releases
-            self.available_releases = await asyncio.to_thread(get_active_python_releases)
-            await self._populate_available_list()
+            # Get available releases without waiting on python.org: with a cold
+            # cache the list fills in once the background sync finishes
+            self.available_releases = await asyncio.to_thread(get_active_python_releases, False)
+            if self.available_releases:
+                await self._populate_available_list()
+            else:
+                available_list = self.query_one("#available-list", AvailableList)
+                await available_list.clear()
+                await available_list.append(VersionItem("Refreshing releases in background...", "", False, False))
+                self.load_available_releases()
 
             # Update status panel
             status_info = self.query_one("#status-info", Static)
@@ -433,6 +440,13 @@ class MainScreen(Screen):
         finally:
             loading.remove_class("visible")
 
+    @work(exclusive=True, group="releases")
+    async def load_available_releases(self) -> None:
+        """Fill the available list once the background metadata sync finishes"""
+        await asyncio.to_thread(wait_for_background_sync, 60)
+        self.available_releases = await asyncio.to_thread(get_active_python_releases)
+        await self._populate_available_list()
+
     async def _populate_installed_list(self) -> None:
         """Populate the installed versions list"""
         installed_list = self.query_one("#installed-list", InstalledList)
@@ -734,8 +748,6 @@ class MainScreen(Screen):
 
     def run_rollback_with_suspend(self, version: str) -> None:
         """Run rollback with TUI suspended"""
-        import json
-
         from textual.app import SuspendNotSupported
 
         os_name, _ = get_os_info()
@@ -774,14 +786,7 @@ class MainScreen(Screen):
                         if success:
                             print("\nRollback complete!")
                             # Update history file
-                            history = HistoryManager.get_history()
-                            if history:
-                                history.pop()
-                                try:
-                                    with open(HISTORY_FILE, "w") as f:
-                                        json.dump(history, f, indent=2)
-                                except Exception:
-                                    pass
+                            HistoryManager.remove_last_action()
                         else:
                             print("\nRollback failed.")
                     else:
@@ -2,27 +2,48 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import os
 import platform
+import random
 import re
+import shutil
+import subprocess
+import sys
 import time
+from typing import TYPE_CHECKING
 
 import click
-import requests  # type: ignore
-from rich.progress import (
-    BarColumn,
-    DownloadColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeRemainingColumn,
-    TransferSpeedColumn,
-)
 
-from .constants import DOWNLOAD_TIMEOUT, MAX_RETRIES, REQUEST_TIMEOUT, RETRY_DELAY
+from .constants import DOWNLOAD_TIMEOUT, MAX_RETRIES, MAX_RETRY_DELAY, REQUEST_TIMEOUT, RETRY_DELAY
 
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
+# A complete dotted version such as 3.11 or 3.11.5
+_VERSION_STRING_RE = re.compile(r"\d+\.\d+(?:\.\d+)*")
+
+# Leading X.Y[.Z] of a version string
+_VERSION_PARTS_RE = re.compile(r"^(\d+)\.(\d+)(?:\.(\d+))?")
+
+# A SHA256 hex digest as published in .sha256 files
+_SHA256_HEX_RE = re.compile(rb"[0-9a-fA-F]{64}")
+
+# hashlib.file_digest (Python 3.11+) hashes a file in C with the GIL released
+_file_digest = getattr(hashlib, "file_digest", None)
+
+# Without file_digest, files up to this size are hashed from a single read();
+# larger ones in blocks
+_HASH_WHOLE_FILE_LIMIT = 128 * 1024 * 1024
+_HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Read size and write buffer for downloaded files
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+_DOWNLOAD_WRITE_BUFFER = 1024 * 1024
+
+
+@functools.cache
 def get_os_info() -> tuple[str, str]:
     """Detect the operating system and architecture."""
     os_name = platform.system().lower()
@@ -39,6 +60,7 @@ def get_os_info() -> tuple[str, str]:
     return os_name, arch
 
 
+@functools.cache
 def is_admin() -> bool:
     """Check if script is running with admin/sudo privileges."""
     try:
@@ -54,38 +76,87 @@ def is_admin() -> bool:
 
 def validate_version_string(version_str: str) -> bool:
     """Validate that version string matches expected format (e.g., 3.11.5)."""
-    if not version_str:
-        return False
-    pattern = r"^\d+\.\d+(\.\d+)*$"
-    return bool(re.match(pattern, version_str))
+    return bool(version_str and _VERSION_STRING_RE.fullmatch(version_str))
+
+
+def parse_version(version_str: str) -> tuple[str, str, str | None] | None:
+    """Split a version string into its (major, minor, patch) components.
+
+    Returns:
+        The components as strings (patch is None for "X.Y"), or None if the
+        string does not start with "X.Y".
+    """
+    m = _VERSION_PARTS_RE.match(version_str)
+    return (m.group(1), m.group(2), m.group(3)) if m else None
+
+
+def major_minor(version_str: str) -> str:
+    """Return the "X.Y" prefix of a version string.
+
+    Strings with fewer than two dots are returned unchanged.
+    """
+    second = version_str.find(".", version_str.find(".") + 1)
+    return version_str if second == -1 else version_str[:second]
+
+
+def retry_delay(attempt: int) -> float:
+    """Seconds to wait after failed attempt number attempt (counting from 0).
+
+    The delay doubles per attempt up to MAX_RETRY_DELAY, with +/-20% jitter so
+    clients that failed together do not all retry together.
+    """
+    return min(MAX_RETRY_DELAY, RETRY_DELAY * 2**attempt) * random.uniform(0.8, 1.2)
 
 
 def calculate_sha256(file_path: str) -> str:
     """Calculate SHA256 checksum of a file."""
     sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
+        fd = f.fileno()
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass  # Only a read-ahead hint
+        if _file_digest is not None:
+            return _file_digest(f, "sha256").hexdigest()
+        if os.fstat(fd).st_size <= _HASH_WHOLE_FILE_LIMIT:
+            sha256.update(f.read())
+        else:
+            for chunk in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                sha256.update(chunk)
     return sha256.hexdigest()
 
 
 def fetch_remote_sha256(checksum_url: str) -> str | None:
     """Fetch SHA256 checksum from python.org."""
+    from ._http import get_session
+
     try:
-        response = requests.get(checksum_url, timeout=REQUEST_TIMEOUT)
+        response = get_session().get(checksum_url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        content = str(response.text).strip()
-        parts = content.split()
-        if parts:
-            return parts[0]
+        # The file is "<digest>[  <filename>]"; only the leading token matters,
+        # so skip decoding the whole body and reject anything that is not a digest
+        parts = response.content[:128].split(None, 1)
+        if parts and _SHA256_HEX_RE.fullmatch(parts[0]):
+            return parts[0].decode("ascii")
         return None
     except Exception as e:
         click.echo(f"❌ Failed to fetch checksum: {e}")
         return None
 
 
-def verify_file_checksum(file_path: str, checksum_url: str) -> bool:
-    """Verify downloaded file against python.org SHA256."""
+def verify_file_checksum(
+    file_path: str, checksum_url: str, expected: str | None = None, actual: str | None = None
+) -> bool:
+    """Verify downloaded file against python.org SHA256.
+
+    Args:
+        file_path: Path of the downloaded file; only read if actual is not given.
+        checksum_url: URL of the published .sha256 file.
+        expected: Checksum already fetched from checksum_url, if any.
+        actual: SHA256 of the file computed during download, if any.
+    """
     from .config import get_config
 
     cfg = get_config()
@@ -95,12 +166,14 @@ def verify_file_checksum(file_path: str, checksum_url: str) -> bool:
 
     click.echo("🔐 Verifying file integrity (SHA256)...")
 
-    expected = fetch_remote_sha256(checksum_url)
+    if not expected:
+        expected = fetch_remote_sha256(checksum_url)
     if not expected:
         click.echo("⚠️  Could not retrieve official checksum. Skipping integrity check.")
         return True
 
-    actual = calculate_sha256(file_path)
+    if not actual:
+        actual = calculate_sha256(file_path)
 
     if actual.lower() != expected.lower():
         click.echo("❌ Checksum mismatch!")
@@ -123,55 +196,206 @@ def download_file(url: str, destination: str, max_retries: int = MAX_RETRIES) ->
     - Real-time download speed
     - Estimated time remaining (ETA)
     """
+    return _download(url, destination, max_retries, digest=False) is not None
+
+
+def download_and_hash(url: str, destination: str, max_retries: int = MAX_RETRIES) -> str | None:
+    """Download a file like download_file() and return its SHA256 hex digest.
+
+    The digest is computed from the chunks as they are written, so the file
+    does not have to be read back from disk to verify it.
+
+    Returns:
+        The hex digest, or None if the download failed.
+    """
+    return _download(url, destination, max_retries, digest=True)
+
+
+def download_to_pipe(
+    url: str,
+    dest_cmd: list[str],
+    cwd: str,
+    env: dict[str, str] | None = None,
+    max_retries: int = MAX_RETRIES,
+) -> str | None:
+    """Stream a download into the stdin of a command instead of a file.
+
+    Used to extract a tarball while it downloads (``tar -xJf -``) so the
+    archive is never written to disk. Each attempt starts a fresh process.
+
+    Args:
+        url: URL to download.
+        dest_cmd: Command that reads the payload from stdin.
+        cwd: Working directory for the command.
+        env: Environment for the command, defaults to the current one.
+        max_retries: Number of download attempts.
+
+    Returns:
+        The SHA256 hex digest of the streamed bytes, or None if the download
+        or the command failed.
+    """
+    import requests  # type: ignore
+    import urllib3
+
+    from ._http import get_session
+
     if not url.startswith(("http://", "https://")):
         click.echo(f"❌ Invalid URL: {url}")
-        return False
+        return None
 
     for attempt in range(max_retries):
+        proc = None
         try:
-            response = requests.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT)
+            response = get_session().get(
+                url, stream=True, timeout=DOWNLOAD_TIMEOUT, headers={"Accept-Encoding": "identity"}
+            )
 
             if 400 <= response.status_code < 500:
                 click.echo(f"❌ Download failed with client error {response.status_code}")
-                return False
+                return None
 
             response.raise_for_status()
 
             total_size = int(response.headers.get("content-length", 0))
-            chunk_size = 8192
-
-            # Use Rich for a modern progress bar with speed and ETA
-            with (
-                open(destination, "wb") as f,
-                Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                    DownloadColumn(),
-                    TransferSpeedColumn(),
-                    TimeRemainingColumn(),
-                ) as progress,
-            ):
-                # Add download task to the progress manager
+            response.raw.decode_content = True
+            sha256 = hashlib.sha256()
+            received = 0
+
+            proc = subprocess.Popen(dest_cmd, stdin=subprocess.PIPE, cwd=cwd, env=env)
+            assert proc.stdin is not None
+            with _progress() as progress:
                 task = progress.add_task("⬇ Downloading", total=total_size)
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if chunk:
+                while chunk := response.raw.read(_DOWNLOAD_CHUNK_SIZE):
+                    proc.stdin.write(chunk)
+                    sha256.update(chunk)
+                    received += len(chunk)
+                    progress.update(task, advance=len(chunk))
+            proc.stdin.close()
+            returncode = proc.wait()
+
+            if total_size and received != total_size:
+                click.echo(f"❌ File size mismatch. Expected {total_size}, got {received}")
+                raise OSError("File size mismatch")
+            if returncode != 0:
+                click.echo(f"❌ {dest_cmd[0]} exited with status {returncode}")
+                return None
+
+            return sha256.hexdigest()
+
+        # A command that exits early surfaces as BrokenPipeError (an OSError)
+        except (OSError, requests.RequestException, urllib3.exceptions.HTTPError) as e:
+            if attempt < max_retries - 1:
+                wait_time = retry_delay(attempt)
+                click.echo(f"\n⚠️ Attempt {attempt + 1} failed: {e}")
+                click.echo(f"Retrying in {wait_time:.1f} seconds...")
+                time.sleep(wait_time)
+            else:
+                click.echo(f"\n❌ All download attempts failed: {e}")
+                return None
+        finally:
+            if proc is not None and proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+    return None
+
+
+def _progress() -> Progress:
+    """Rich progress bar with speed and ETA shared by the download helpers.
+
+    The bar is disabled when stdout is not a terminal (CI logs, pipes), where
+    its redraws would only be thrown away.
+    """
+    # rich is only needed while downloading; keep it out of CLI startup
+    from rich.progress import (
+        BarColumn,
+        DownloadColumn,
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        TimeRemainingColumn,
+        TransferSpeedColumn,
+    )
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        TimeRemainingColumn(),
+        refresh_per_second=4,
+        disable=not sys.stdout.isatty(),
+    )
+
+
+def _download(url: str, destination: str, max_retries: int, digest: bool) -> str | None:
+    """Shared download loop.
+
+    Returns:
+        The SHA256 hex digest if digest is set, otherwise an empty string;
+        None if the download failed.
+    """
+    # requests is only needed here; keep it out of CLI startup
+    import requests  # type: ignore
+    import urllib3
+
+    from ._http import get_session
+
+    if not url.startswith(("http://", "https://")):
+        click.echo(f"❌ Invalid URL: {url}")
+        return None
+
+    for attempt in range(max_retries):
+        try:
+            # Ask for the raw bytes: installers and tarballs are already compressed, and
+            # Content-Length then matches what iter_content() yields
+            response = get_session().get(
+                url, stream=True, timeout=DOWNLOAD_TIMEOUT, headers={"Accept-Encoding": "identity"}
+            )
+
+            if 400 <= response.status_code < 500:
+                click.echo(f"❌ Download failed with client error {response.status_code}")
+                return None
+
+            response.raise_for_status()
+
+            total_size = int(response.headers.get("content-length", 0))
+            response.raw.decode_content = True
+            sha256 = hashlib.sha256() if digest else None
+
+            if sha256 is None and not sys.stdout.isatty():
+                # Nothing to hash and no bar to draw: let copyfileobj move the bytes
+                with open(destination, "wb", buffering=0) as f:
+                    shutil.copyfileobj(response.raw, f, _DOWNLOAD_CHUNK_SIZE)
+            else:
+                # Use Rich for a modern progress bar with speed and ETA. The 1 MiB write
+                # buffer turns the small network chunks into few large write() calls.
+                with open(destination, "wb", buffering=_DOWNLOAD_WRITE_BUFFER) as f, _progress() as progress:
+                    # Add download task to the progress manager
+                    task = progress.add_task("⬇ Downloading", total=total_size)
+                    # Read urllib3's stream directly in large chunks: one write, hash
+                    # update and progress refresh per MiB instead of per 8 KiB
+                    while chunk := response.raw.read(_DOWNLOAD_CHUNK_SIZE):
                         f.write(chunk)
+                        if sha256 is not None:
+                            sha256.update(chunk)
                         # Update progress by the number of bytes downloaded
                         progress.update(task, advance=len(chunk))
 
             if not os.path.exists(destination):
                 click.echo("❌ Download failed: file not found")
-                return False
+                return None
 
             if total_size and os.path.getsize(destination) != total_size:
                 click.echo(f"❌ File size mismatch. Expected {total_size}, got {os.path.getsize(destination)}")
                 raise OSError("File size mismatch")
 
-            return True
+            return sha256.hexdigest() if sha256 is not None else ""
 
-        except (OSError, requests.RequestException) as e:
+        # Reading response.raw surfaces urllib3's errors unwrapped
+        except (OSError, requests.RequestException, urllib3.exceptions.HTTPError) as e:
             if os.path.exists(destination):
                 try:
                     os.remove(destination)
@@ -179,12 +403,12 @@ def download_file(url: str, destination: str, max_retries: int = MAX_RETRIES) ->
                     pass
 
             if attempt < max_retries - 1:
-                wait_time = RETRY_DELAY * (attempt + 1)
+                wait_time = retry_delay(attempt)
                 click.echo(f"\n⚠️ Attempt {attempt + 1} failed: {e}")
-                click.echo(f"Retrying in {wait_time} seconds...")
+                click.echo(f"Retrying in {wait_time:.1f} seconds...")
                 time.sleep(wait_time)
             else:
                 click.echo(f"\n❌ All download attempts failed: {e}")
-                return False
+                return None
 
-    return False
+    return None
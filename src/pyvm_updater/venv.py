@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import copy
 import os
 import shutil
 import subprocess
@@ -10,9 +10,10 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from ._json import dumps, loads
 from .logging_config import get_logger
-from .utils import get_os_info
-from .version import get_installed_python_versions
+from .utils import get_os_info, major_minor
+from .version import get_installed_python_versions, windows_registry_pythons
 
 log = get_logger("venv")
 
@@ -20,31 +21,66 @@ log = get_logger("venv")
 DEFAULT_VENV_DIR = Path.home() / ".pyvm" / "venvs"
 VENV_REGISTRY = Path.home() / ".pyvm" / "venvs.json"
 
+# Interpreters found by find_python_executable(), keyed by requested version.
+# Misses are not cached so a version installed later in the run is still found.
+_PY_EXE_CACHE: dict[str, str] = {}
+
+# (registry path, (st_ino, st_size, st_mtime_ns), parsed registry) of the last
+# registry read or written; reused while the file is unchanged
+_registry_cache: tuple[Path, tuple[int, int, int], dict[str, Any]] | None = None
+
 
 def get_venv_dir() -> Path:
     """Get the directory where venvs are stored."""
     return DEFAULT_VENV_DIR
 
 
+def _registry_signature(path: Path) -> tuple[int, int, int]:
+    st = path.stat()
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
 def get_venv_registry() -> dict[str, Any]:
-    """Load the venv registry from disk."""
-    if not VENV_REGISTRY.exists():
+    """Load the venv registry from disk.
+
+    The parsed registry is kept in memory and reused until the file changes;
+    callers always receive their own copy.
+    """
+    global _registry_cache
+
+    try:
+        signature = _registry_signature(VENV_REGISTRY)
+    except OSError:
         return {}
+    cache = _registry_cache
+    if cache is not None and cache[0] == VENV_REGISTRY and cache[1] == signature:
+        return copy.deepcopy(cache[2])
     try:
-        with open(VENV_REGISTRY) as f:
-            data = json.load(f)
-            return dict(data) if isinstance(data, dict) else {}
-    except (json.JSONDecodeError, OSError):
+        with open(VENV_REGISTRY, "rb") as f:
+            data = loads(f.read())
+    except (ValueError, OSError):
         return {}
+    registry = dict(data) if isinstance(data, dict) else {}
+    _registry_cache = (VENV_REGISTRY, signature, registry)
+    return copy.deepcopy(registry)
 
 
 def save_venv_registry(registry: dict[str, Any]) -> None:
-    """Save the venv registry to disk."""
+    """Save the venv registry to disk.
+
+    The registry is written to a temporary file and moved into place, so a
+    crash mid-write never leaves a truncated registry behind.
+    """
+    global _registry_cache
+
     try:
         VENV_REGISTRY.parent.mkdir(parents=True, exist_ok=True)
-        with open(VENV_REGISTRY, "w") as f:
-            json.dump(registry, f, indent=2)
+        tmp = VENV_REGISTRY.with_name(VENV_REGISTRY.name + ".tmp")
+        tmp.write_text(dumps(registry))
+        os.replace(tmp, VENV_REGISTRY)
+        _registry_cache = (VENV_REGISTRY, _registry_signature(VENV_REGISTRY), copy.deepcopy(registry))
     except OSError as e:
+        _registry_cache = None
         log.warning(f"Could not save venv registry: {e}")
 
 
@@ -57,27 +93,52 @@ def find_python_executable(version: str) -> str | None:
     Returns:
         Path to Python executable, or None if not found.
     """
+    cached = _PY_EXE_CACHE.get(version)
+    if cached is not None and os.path.exists(cached):
+        return cached
+
+    found = _find_python_executable(version)
+    if found:
+        _PY_EXE_CACHE[version] = found
+    else:
+        _PY_EXE_CACHE.pop(version, None)
+    return found
+
+
+def _find_python_executable(version: str) -> str | None:
+    """Uncached lookup behind find_python_executable()."""
     os_name, _ = get_os_info()
 
-    # Parse version
-    parts = version.split(".")
-    major_minor = f"{parts[0]}.{parts[1]}" if len(parts) >= 2 else version
+    series = major_minor(version)
+
+    # Prefer a mise or pyenv install of exactly the requested version: the scan
+    # below only matches the series and returns its newest patch release
+    if os_name != "windows":
+        pyenv_root = os.environ.get("PYENV_ROOT", os.path.expanduser("~/.pyenv"))
+        for candidate in (
+            os.path.expanduser(f"~/.local/share/mise/installs/python/{version}/bin/python3"),
+            os.path.join(pyenv_root, "versions", version, "bin", "python3"),
+        ):
+            if os.access(candidate, os.X_OK):
+                return candidate
 
     # Check installed versions
     installed = get_installed_python_versions()
     for v in installed:
-        v_parts = v["version"].split(".")
-        v_major_minor = f"{v_parts[0]}.{v_parts[1]}" if len(v_parts) >= 2 else v["version"]
-        if v_major_minor == major_minor and v.get("path"):
+        if major_minor(v["version"]) == series and v.get("path"):
             path = v["path"]
             return str(path) if path else None
 
     # Try common paths
     if os_name == "windows":
-        # Try py launcher
+        exe = _windows_registered_python(series)
+        if exe:
+            return exe
+
+        # Fall back to the py launcher, which starts a whole interpreter
         try:
             result = subprocess.run(
-                ["py", f"-{major_minor}", "-c", "import sys; print(sys.executable)"],
+                ["py", f"-{series}", "-c", "import sys; print(sys.executable)"],
                 capture_output=True,
                 text=True,
                 check=True,
@@ -88,22 +149,29 @@ def find_python_executable(version: str) -> str | None:
             pass
     else:
         # Try common Unix paths
-        candidates = [
-            f"python{major_minor}",
-            f"python{parts[0]}",
-            os.path.expanduser(f"~/.local/share/mise/installs/python/{version}/bin/python3"),
-            os.path.expanduser(f"~/.pyenv/versions/{version}/bin/python3"),
-        ]
+        for candidate in (f"python{series}", f"python{version.partition('.')[0]}"):
+            path = shutil.which(candidate)
+            if path:
+                return str(path)
+
+    return None
 
-        for candidate in candidates:
-            if os.path.isabs(candidate):
-                if os.path.exists(candidate) and os.access(candidate, os.X_OK):
-                    return candidate
-            else:
-                path = shutil.which(candidate)
-                if path:
-                    return str(path)
 
+def _windows_registered_python(major_minor: str) -> str | None:
+    """Look up a python.org install of major_minor without starting an interpreter.
+
+    Reads the PEP 514 registry entries (per-user, then machine-wide 64- and
+    32-bit views) and falls back to the default per-user install directory.
+    """
+    exe = windows_registry_pythons().get(major_minor)
+    if exe:
+        return exe
+
+    local_appdata = os.environ.get("LOCALAPPDATA", "")
+    if local_appdata:
+        exe = os.path.join(local_appdata, "Programs", "Python", f"Python{major_minor.replace('.', '')}", "python.exe")
+        if os.path.isfile(exe):
+            return exe
     return None
 
 
@@ -226,6 +294,17 @@ def list_venvs() -> list[dict[str, Any]]:
     registry = get_venv_registry()
     venvs = []
 
+    # One pass over the default directory answers "exists" for every venv
+    # stored there, so only registry entries elsewhere need their own stat.
+    dirs: dict[str, os.DirEntry[str]] = {}
+    try:
+        with os.scandir(get_venv_dir()) as it:
+            for entry in it:
+                if entry.is_dir():
+                    dirs[entry.path] = entry
+    except OSError:
+        pass
+
     for name, info in registry.items():
         venv_path = Path(info.get("path", ""))
         venvs.append(
@@ -233,28 +312,27 @@ def list_venvs() -> list[dict[str, Any]]:
                 "name": name,
                 "path": str(venv_path),
                 "python_version": info.get("python_version", "unknown"),
-                "exists": venv_path.exists(),
+                "exists": str(venv_path) in dirs or venv_path.exists(),
             }
         )
 
-    # Also check for unregistered venvs in default directory
-    venv_dir = get_venv_dir()
-    if venv_dir.exists():
-        for entry in venv_dir.iterdir():
-            if entry.is_dir() and entry.name not in registry:
-                # Check if it's a venv
-                activate = entry / "bin" / "activate"
-                if not activate.exists():
-                    activate = entry / "Scripts" / "activate.bat"
-                if activate.exists():
-                    venvs.append(
-                        {
-                            "name": entry.name,
-                            "path": str(entry),
-                            "python_version": "unknown",
-                            "exists": True,
-                        }
-                    )
+    # Also check for unregistered venvs in default directory, probing the
+    # platform's own activation script first
+    scripts = (("bin", "activate"), ("Scripts", "activate.bat"))
+    if sys.platform == "win32":
+        scripts = scripts[::-1]
+    for entry in dirs.values():
+        if entry.name in registry:
+            continue
+        if any(os.path.exists(os.path.join(entry.path, *script)) for script in scripts):
+            venvs.append(
+                {
+                    "name": entry.name,
+                    "path": entry.path,
+                    "python_version": "unknown",
+                    "exists": True,
+                }
+            )
 
     return sorted(venvs, key=lambda x: x["name"])
 
@@ -286,7 +364,7 @@ def remove_venv(name: str, force: bool = False) -> tuple[bool, str]:
         return False, f"Venv '{name}' not found"
 
     try:
-        shutil.rmtree(venv_path)
+        _remove_tree(venv_path)
 
         # Remove from registry
         if name in registry:
@@ -299,6 +377,27 @@ def remove_venv(name: str, force: bool = False) -> tuple[bool, str]:
         return False, f"Failed to remove venv: {e}"
 
 
+def _remove_tree(path: Path) -> None:
+    """Delete a directory tree.
+
+    A venv holds thousands of small files; on POSIX `rm -rf` walks and unlinks
+    them in C, which is much faster than shutil.rmtree. shutil.rmtree is used
+    on Windows, without rm, or to finish (and report errors for) a failed rm.
+
+    Raises:
+        OSError: If the tree could not be removed.
+    """
+    rm = shutil.which("rm") if os.name != "nt" else None
+    if rm:
+        try:
+            subprocess.run([rm, "-rf", "--", str(path)], stderr=subprocess.DEVNULL, check=False)
+        except OSError:
+            pass
+        if not os.path.lexists(path):
+            return
+    shutil.rmtree(path)
+
+
 def get_venv_activate_command(name: str) -> str | None:
     """Get the command to activate a venv.
 
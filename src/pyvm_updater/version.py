@@ -2,57 +2,134 @@
 
 from __future__ import annotations
 
+import itertools
 import os
 import platform
 import re
 import subprocess
 import sys
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import lxml.etree
 import requests  # type: ignore
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from packaging import version as pkg_version
 
-from .constants import MAX_RETRIES, REQUEST_TIMEOUT, RETRY_DELAY
+from ._http import get_session
+from .cache import cached
+from .constants import MAX_RETRIES, REQUEST_TIMEOUT
 from .metadata_store import (
+    get_latest_from_cache,
     get_releases_from_cache,
     get_versions_from_cache,
     start_background_sync_if_stale,
     sync_python_org,
 )
-from .utils import get_os_info, validate_version_string
+from .utils import get_os_info, major_minor, retry_delay, validate_version_string
+
+# Everything the release-schedule fallback reads (the schedule rows and the
+# release-number links) sits inside an <ol>, so the rest of the page is skipped
+_RELEASE_LISTS_STRAINER = SoupStrainer("ol")
+
+# Version tag in a `py --list` line, e.g. " -V:3.12 *" or " -3.12-64"
+_PY_LIST_RE = re.compile(r"-(?:V:)?(\d+\.\d+)")
+
+# Store app execution alias, e.g. python3.12.exe
+_STORE_EXE_RE = re.compile(r"python(3\.\d+)\.exe", re.IGNORECASE)
+
+# pythonX.Y binaries in the system search paths
+_PYBIN_RE = re.compile(r"^python(\d+\.\d+)$")
+
+# Full X.Y.Z versions embedded in a path; group 1 is X.Y
+_PATH_VERSION_RE = re.compile(r"(?<![\d.])(\d+\.\d+)\.\d+(?![\d.])")
+
+# PEP 514 PythonCore tag: X.Y, optionally suffixed with the platform (-32, -arm64)
+_REGISTRY_TAG_RE = re.compile(r"^(\d+\.\d+)(?:-\w+)?$")
+
+# A bare release series such as 3.12
+_SERIES_RE = re.compile(r"^\d+\.\d+$")
+
+
+# Seconds a get_installed_python_versions() scan is reused within the process
+_INSTALLED_TTL = 30.0
+
+# (time.monotonic() of the scan, result, its version strings), filled by _installed_snapshot()
+_installed_cache: tuple[float, list[dict[str, Any]], frozenset[str]] | None = None
+
+
+def _installed_snapshot() -> tuple[list[dict[str, Any]], frozenset[str]]:
+    """Return the cached scan and its version set, rescanning once the TTL has passed.
+
+    The returned list is shared; callers must not modify it.
+    """
+    global _installed_cache
+
+    snapshot = _installed_cache
+    if snapshot is not None and time.monotonic() - snapshot[0] < _INSTALLED_TTL:
+        return snapshot[1], snapshot[2]
+    versions = _scan_installed_python_versions()
+    version_set = frozenset(v["version"] for v in versions)
+    _installed_cache = (time.monotonic(), versions, version_set)
+    return versions, version_set
 
 
 def get_installed_python_versions() -> list[dict[str, Any]]:
-    """Detect Python versions installed on the system."""
-    versions: list[dict[str, Any]] = []
+    """Detect Python versions installed on the system.
+
+    The scan spawns py/--version probes and walks several directories, so its
+    result is reused for _INSTALLED_TTL seconds; call invalidate_installed_cache()
+    after installing or removing an interpreter.
+    """
+    versions, _ = _installed_snapshot()
+    return [dict(v) for v in versions]
+
+
+def invalidate_installed_cache() -> None:
+    """Forget the cached get_installed_python_versions() result."""
+    global _installed_cache
+    _installed_cache = None
+
+
+def _scan_installed_python_versions() -> list[dict[str, Any]]:
+    """Uncached scan behind get_installed_python_versions()."""
     os_name, _ = get_os_info()
-    found: set[str] = set()
+    # Keyed by version (Windows) or scan key (Unix) so later sources can
+    # update an entry in place
+    found: dict[str, dict[str, Any]] = {}
 
     if os_name == "windows":
-        try:
-            result = subprocess.run(["py", "--list"], capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                for line in result.stdout.strip().split("\n"):
-                    line = line.strip()
-                    match = re.search(r"-(?:V:)?(\d+\.\d+)", line)
-                    if match:
-                        ver = match.group(1)
-                        is_default = "*" in line
-                        is_store = "(Store)" in line
-                        if ver not in found:
-                            found.add(ver)
-                            versions.append(
+        # The py launcher reads the same PEP 514 registry keys; read them directly
+        # and only spawn `py --list` if the registry has nothing
+        for ver, exe in windows_registry_pythons().items():
+            found[ver] = {
+                "version": ver,
+                "path": exe,
+                "default": os.path.normcase(exe) == os.path.normcase(sys.executable),
+                "store": False,
+            }
+        if not found:
+            try:
+                result = subprocess.run(["py", "--list"], capture_output=True, text=True, check=False)
+                if result.returncode == 0:
+                    for line in result.stdout.strip().split("\n"):
+                        line = line.strip()
+                        match = _PY_LIST_RE.search(line)
+                        if match:
+                            ver = match.group(1)
+                            found.setdefault(
+                                ver,
                                 {
                                     "version": ver,
                                     "path": None,
-                                    "default": is_default,
-                                    "store": is_store,
-                                }
+                                    "default": "*" in line,
+                                    "store": "(Store)" in line,
+                                },
                             )
-        except FileNotFoundError:
-            pass
+            except FileNotFoundError:
+                pass
 
         # Explicitly check for Store versions if py --list didn't catch them or to get paths
         try:
@@ -60,167 +137,307 @@ def get_installed_python_versions() -> list[dict[str, Any]]:
             apps_dir = os.path.expandvars(r"%LOCALAPPDATA%\Microsoft\WindowsApps")
             if os.path.isdir(apps_dir):
                 for entry in os.listdir(apps_dir):
-                    match = re.match(r"python(3\.\d+)\.exe", entry, re.IGNORECASE)
+                    match = _STORE_EXE_RE.match(entry)
                     if match:
                         ver = match.group(1)
-                        if ver not in found:
-                            found.add(ver)
-                            full_path = os.path.join(apps_dir, entry)
-                            versions.append(
-                                {
-                                    "version": ver,
-                                    "path": full_path,
-                                    "default": full_path == sys.executable,
-                                    "store": True,
-                                }
-                            )
+                        full_path = os.path.join(apps_dir, entry)
+                        existing = found.get(ver)
+                        if existing is None:
+                            found[ver] = {
+                                "version": ver,
+                                "path": full_path,
+                                "default": full_path == sys.executable,
+                                "store": True,
+                            }
                         else:
                             # Update existing entry with path if it's a store version
-                            for v in versions:
-                                if v["version"] == ver:
-                                    v["store"] = True
-                                    if not v["path"]:
-                                        v["path"] = os.path.join(apps_dir, entry)
-                                    break
+                            existing["store"] = True
+                            if not existing["path"]:
+                                existing["path"] = full_path
         except Exception:
             pass
     else:
-        # mise
+        # The three sources are independent and mostly wait on the filesystem or
+        # --version probes, so scan them concurrently and merge in priority order
         mise_python_dir = os.path.expanduser("~/.local/share/mise/installs/python")
-        if os.path.isdir(mise_python_dir):
-            try:
-                for entry in os.listdir(mise_python_dir):
-                    if re.match(r"^\d+\.\d+", entry):
-                        ver = entry
-                        if ver not in found:
-                            full_path = os.path.join(mise_python_dir, entry, "bin", "python3")
-                            if os.path.exists(full_path):
-                                found.add(ver)
-                                versions.append(
-                                    {
-                                        "version": ver,
-                                        "path": full_path,
-                                        "default": full_path == sys.executable
-                                        or sys.executable.startswith(os.path.join(mise_python_dir, entry)),
-                                    }
-                                )
-            except PermissionError:
-                pass
-
-        # pyenv
         pyenv_root = os.environ.get("PYENV_ROOT", os.path.expanduser("~/.pyenv"))
         pyenv_versions_dir = os.path.join(pyenv_root, "versions")
-        if os.path.isdir(pyenv_versions_dir):
-            try:
-                for entry in os.listdir(pyenv_versions_dir):
-                    if re.match(r"^\d+\.\d+", entry):
-                        ver = entry
-                        if ver not in found:
-                            full_path = os.path.join(pyenv_versions_dir, entry, "bin", "python3")
-                            if os.path.exists(full_path):
-                                found.add(ver)
-                                versions.append(
-                                    {"version": ver, "path": full_path, "default": full_path == sys.executable}
-                                )
-            except PermissionError:
-                pass
-
-        # system paths
-        search_paths = [
-            "/usr/bin",
-            "/usr/local/bin",
-            "/opt/homebrew/bin",
-            os.path.expanduser("~/.local/bin"),
-        ]
-        for path in search_paths:
-            if os.path.isdir(path):
-                try:
-                    for entry in os.listdir(path):
-                        match = re.match(r"^python(\d+\.\d+)$", entry)
-                        if match:
-                            ver = match.group(1)
-                            if ver not in found:
-                                found.add(ver)
-                                full_path = os.path.join(path, entry)
-                                if os.access(full_path, os.X_OK):
-                                    try:
-                                        result = subprocess.run(
-                                            [full_path, "--version"],
-                                            capture_output=True,
-                                            text=True,
-                                            check=False,
-                                            timeout=5,
-                                        )
-                                        if result.returncode == 0:
-                                            full_ver = result.stdout.strip().replace("Python ", "")
-                                            versions.append(
-                                                {
-                                                    "version": full_ver,
-                                                    "path": full_path,
-                                                    "default": full_path == sys.executable,
-                                                }
-                                            )
-                                    except Exception:
-                                        versions.append({"version": ver, "path": full_path, "default": False})
-                except PermissionError:
-                    pass
-
-    def version_key(x: dict[str, Any]) -> list[int]:
-        try:
-            return [int(p) for p in x["version"].split(".")[:3]]
-        except ValueError:
-            return [0, 0, 0]
-
-    versions.sort(key=version_key, reverse=True)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            scans = [
+                executor.submit(_scan_versions_dir, mise_python_dir, True),
+                executor.submit(_scan_versions_dir, pyenv_versions_dir, False),
+                executor.submit(_scan_system_paths),
+            ]
+            for scan in scans:
+                for key, info in scan.result():
+                    found.setdefault(key, info)
+
+    # Parse each version once; packaging also orders pre-releases and treats
+    # "3.12" and "3.12.0" as equal
+    keyed = sorted(((_parse_version_key(v["version"]), v) for v in found.values()), key=lambda kv: kv[0], reverse=True)
+    versions = [v for _, v in keyed]
 
     current_ver = platform.python_version()
-    found_current = any(v["version"] == current_ver for v in versions)
+    current_key = _parse_version_key(current_ver)
+    current = next((v for key, v in keyed if key == current_key), None)
 
-    if not found_current:
+    if current is None:
         versions.insert(0, {"version": current_ver, "path": sys.executable, "default": True})
     else:
-        for v in versions:
-            if v["version"] == current_ver:
-                v["default"] = True
-                break
+        current["default"] = True
 
     return versions
 
 
+def _parse_version_key(ver: str) -> pkg_version.Version:
+    """Sort key for an installed version; unparseable strings sort last."""
+    try:
+        return pkg_version.Version(ver)
+    except pkg_version.InvalidVersion:
+        return pkg_version.Version("0")
+
+
+def windows_registry_pythons() -> dict[str, str]:
+    """Map X.Y to python.exe for every PEP 514 PythonCore registration.
+
+    Per-user entries win over machine-wide ones, then 64-bit over 32-bit.
+    Returns an empty dict off Windows.
+    """
+    try:
+        import winreg
+    except ImportError:
+        return {}
+
+    pythons: dict[str, str] = {}
+    locations = [
+        (winreg.HKEY_CURRENT_USER, 0),
+        (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_64KEY),
+        (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_32KEY),
+    ]
+    for hive, view in locations:
+        try:
+            with winreg.OpenKey(hive, r"Software\Python\PythonCore", 0, winreg.KEY_READ | view) as core:
+                index = 0
+                while True:
+                    try:
+                        tag = winreg.EnumKey(core, index)
+                    except OSError:
+                        break  # no more subkeys
+                    index += 1
+                    match = _REGISTRY_TAG_RE.match(tag)
+                    if not match or match.group(1) in pythons:
+                        continue
+                    try:
+                        with winreg.OpenKey(core, rf"{tag}\InstallPath", 0, winreg.KEY_READ | view) as key:
+                            try:
+                                exe = str(winreg.QueryValueEx(key, "ExecutablePath")[0])
+                            except OSError:
+                                exe = os.path.join(str(winreg.QueryValueEx(key, "")[0]), "python.exe")
+                    except OSError:
+                        continue
+                    if os.path.isfile(exe):
+                        pythons[match.group(1)] = exe
+        except OSError:
+            continue
+    return pythons
+
+
+def _scan_versions_dir(versions_dir: str, owns_prefix: bool) -> list[tuple[str, dict[str, Any]]]:
+    """List the interpreters in a mise or pyenv versions directory.
+
+    Args:
+        versions_dir: Directory holding one subdirectory per installed version.
+        owns_prefix: Treat the running interpreter as the default if it lives
+                     anywhere under a version's directory (mise), not only if
+                     it is that version's bin/python3.
+
+    Returns:
+        (dedup key, version info) pairs; the key is the directory name.
+    """
+    results: list[tuple[str, dict[str, Any]]] = []
+    # A missing directory is just an OSError, and entry types come from the
+    # directory listing itself
+    try:
+        with os.scandir(versions_dir) as it:
+            for entry in it:
+                if _starts_with_major_minor(entry.name) and entry.is_dir():
+                    full_path = os.path.join(entry.path, "bin", "python3")
+                    if os.path.exists(full_path):
+                        is_default = full_path == sys.executable or (
+                            owns_prefix and sys.executable.startswith(entry.path)
+                        )
+                        results.append((entry.name, {"version": entry.name, "path": full_path, "default": is_default}))
+    except OSError:
+        pass
+    return results
+
+
+def _starts_with_major_minor(name: str) -> bool:
+    """Whether name begins with "X.Y", as mise/pyenv install directories do.
+
+    Most non-matching names (miniconda3-..., pypy3.10-...) are rejected by
+    the first isdigit() without starting the regex engine.
+    """
+    major, dot, rest = name.partition(".")
+    return bool(dot) and major.isdigit() and rest[:1].isdigit()
+
+
+def _scan_system_paths() -> list[tuple[str, dict[str, Any]]]:
+    """List the pythonX.Y binaries in the usual system bin directories.
+
+    Returns:
+        (dedup key, version info) pairs; the key is the binary's X.Y.
+    """
+    search_paths = [
+        "/usr/bin",
+        "/usr/local/bin",
+        "/opt/homebrew/bin",
+        os.path.expanduser("~/.local/bin"),
+    ]
+    results: list[tuple[str, dict[str, Any]]] = []
+    seen: set[str] = set()
+    # (major.minor, path) of interpreters whose patch version needs a --version probe
+    to_probe: list[tuple[str, str]] = []
+    for path in search_paths:
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    match = _PYBIN_RE.match(entry.name)
+                    if match:
+                        ver = match.group(1)
+                        if ver not in seen:
+                            seen.add(ver)
+                            full_path = entry.path
+                            if os.access(full_path, os.X_OK):
+                                full_ver = _patch_version_from_path(full_path, ver)
+                                if full_ver:
+                                    info = {
+                                        "version": full_ver,
+                                        "path": full_path,
+                                        "default": full_path == sys.executable,
+                                    }
+                                    results.append((ver, info))
+                                else:
+                                    to_probe.append((ver, full_path))
+        except OSError:
+            pass
+
+    probed: list[dict[str, Any] | None] = []
+    if len(to_probe) == 1:
+        probed = [_probe_python_version(*to_probe[0])]
+    elif to_probe:
+        # Each probe mostly waits on process start-up, so run them side by side
+        with ThreadPoolExecutor(max_workers=min(8, len(to_probe))) as executor:
+            probed = list(executor.map(lambda c: _probe_python_version(*c), to_probe))
+    for (ver, _), entry_info in zip(to_probe, probed):
+        if entry_info is not None:
+            results.append((ver, entry_info))
+    return results
+
+
+def _patch_version_from_path(full_path: str, major_minor: str) -> str | None:
+    """Read the full version of a pythonX.Y binary from where it resolves to.
+
+    Homebrew, pyenv and similar layouts link pythonX.Y into a directory such
+    as .../python@3.12/3.12.1/bin, which spares a --version subprocess.
+    """
+    for match in _PATH_VERSION_RE.finditer(os.path.realpath(full_path)):
+        if match.group(1) == major_minor:
+            return match.group(0)
+    return None
+
+
+def _probe_python_version(major_minor: str, full_path: str) -> dict[str, Any] | None:
+    """Run ``full_path --version`` to find its full version."""
+    try:
+        # An absolute path, no cwd and close_fds=False let subprocess use
+        # posix_spawn where available
+        result = subprocess.run(
+            [full_path, "--version"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=False,
+            timeout=5,
+            close_fds=False,
+        )
+    except Exception:
+        return {"version": major_minor, "path": full_path, "default": False}
+    if result.returncode != 0:
+        return None
+    full_ver = result.stdout.strip().replace("Python ", "")
+    return {"version": full_ver, "path": full_path, "default": full_path == sys.executable}
+
+
 def get_latest_python_info_with_retry() -> tuple[str | None, str | None]:
-    """Fetch the latest Python version with retry logic."""
+    """Fetch the latest Python version with retry logic.
+
+    Successful lookups are cached on disk for METADATA_TTL_SECONDS. A fresh
+    metadata store sync already recorded the download button, so that is
+    used first and the page is not fetched again.
+    """
+    latest_ver, download_url = get_latest_from_cache()
+    if latest_ver:
+        return latest_ver, download_url
+    latest_ver, download_url = _fetch_latest_python_info()
+    return latest_ver, download_url
+
+
+@cached(cache_if=lambda result: bool(result[0]), decode=tuple)
+def _fetch_latest_python_info() -> tuple[str | None, str | None]:
     for attempt in range(MAX_RETRIES):
         try:
             result = get_latest_python_info()
             if result[0]:
                 return result
             if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+                time.sleep(retry_delay(attempt))
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
                 print(f"Attempt {attempt + 1} failed, retrying...")
-                time.sleep(RETRY_DELAY * (attempt + 1))
+                time.sleep(retry_delay(attempt))
             else:
                 print(f"All retry attempts failed: {e}")
     return None, None
 
 
+def _stream_html_elements(url: str, tag: str) -> Iterator[Any]:
+    """Yield each tag element of the page at url as soon as it has been parsed.
+
+    The body is fed to lxml's pull parser in chunks as it downloads, so a
+    caller that stops iterating early also stops the download.
+    """
+    response = get_session().get(url, stream=True, timeout=REQUEST_TIMEOUT)
+    try:
+        response.raise_for_status()
+        parser = lxml.etree.HTMLPullParser(events=("end",), tag=tag)
+        for chunk in response.iter_content(64 * 1024):
+            parser.feed(chunk)
+            for _event, element in parser.read_events():
+                yield element
+        parser.close()
+        for _event, element in parser.read_events():
+            yield element
+    finally:
+        response.close()
+
+
 def get_latest_python_info() -> tuple[str | None, str | None]:
     """Fetch the latest Python version and download URLs."""
     URL = "https://www.python.org/downloads/"
 
     try:
-        response = requests.get(URL, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        download_button = soup.find("a", class_="button")
-        if not download_button:
+        # The download button sits in the page header; stop reading once it is parsed
+        download_button = next(
+            (a for a in _stream_html_elements(URL, "a") if "button" in (a.get("class") or "").split()), None
+        )
+        if download_button is None:
             print("Error: Could not find download button on Python.org")
             return None, None
 
-        latest_ver_string = download_button.get_text(strip=True)
-        latest_ver = latest_ver_string.split()[-1]
+        latest_ver_string = " ".join("".join(download_button.itertext()).split())
+        latest_ver = latest_ver_string.split()[-1] if latest_ver_string else ""
 
         if not validate_version_string(latest_ver):
             print(f"Error: Invalid version format retrieved: {latest_ver}")
@@ -247,11 +464,21 @@ def get_latest_python_info() -> tuple[str | None, str | None]:
         return None, None
 
 
-def get_active_python_releases() -> list[dict[str, Any]]:
-    cached = get_releases_from_cache()
-    if cached:
+def get_active_python_releases(wait: bool = True) -> list[dict[str, Any]]:
+    """Return the active release series, served from the metadata cache.
+
+    Args:
+        wait: With an empty cache, fetch from python.org before returning. If
+              False, start a background sync and return an empty list so the
+              caller is never blocked on the network.
+    """
+    rows = get_releases_from_cache()
+    if rows:
+        start_background_sync_if_stale()
+        return rows
+    if not wait:
         start_background_sync_if_stale()
-        return cached
+        return []
     try:
         sync_python_org()
         data = get_releases_from_cache()
@@ -268,63 +495,54 @@ def get_active_python_releases() -> list[dict[str, Any]]:
 def _fetch_active_python_releases_fallback() -> list[dict[str, Any]]:
     url = "https://www.python.org/downloads/"
     releases: list[dict[str, Any]] = []
-    response = requests.get(url, timeout=REQUEST_TIMEOUT)
+    response = get_session().get(url, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
-    text = soup.get_text()
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-    start_idx = None
-    for i, line in enumerate(lines):
-        if line == "Release schedule":
-            start_idx = i + 1
-            break
-    if start_idx:
-        i = start_idx
-        while i < len(lines) - 5:
-            line = lines[i]
-            if re.match(r"^\d+\.\d+$", line):
-                series = line
-                status = lines[i + 1] if i + 1 < len(lines) else ""
-                first_release = lines[i + 3] if i + 3 < len(lines) else ""
-                end_support = lines[i + 4] if i + 4 < len(lines) else ""
-                if not status or status.startswith("Looking for"):
-                    break
-                releases.append(
-                    {
-                        "series": series,
-                        "status": status,
-                        "first_release": first_release,
-                        "end_of_support": end_support,
-                        "latest_version": None,
-                    }
-                )
-                i += 6
-            else:
-                i += 1
-    release_links = soup.find_all("span", class_="release-number")
+    soup = BeautifulSoup(response.content, "lxml", parse_only=_RELEASE_LISTS_STRAINER)
+    # Each release is an <li> of class-tagged spans (the same rows metadata_store
+    # reads); only schedule rows carry both a release-version and a release-status
+    for row in soup.find_all("li"):
+        cells = {span["class"][0]: span.get_text(strip=True) for span in row.find_all("span", class_=True)}
+        series = cells.get("release-version", "")
+        status = cells.get("release-status", "")
+        if _SERIES_RE.match(series) and status:
+            releases.append(
+                {
+                    "series": series,
+                    "status": status,
+                    "first_release": cells.get("release-start", ""),
+                    "end_of_support": cells.get("release-end", ""),
+                    "latest_version": None,
+                }
+            )
     series_versions: dict[str, str] = {}
-    for release in release_links:
-        link = release.find("a")
-        if link:
-            version_text = link.get_text(strip=True)
-            if version_text.startswith("Python "):
-                ver = version_text.replace("Python ", "")
-                if validate_version_string(ver):
-                    parts = ver.split(".")
-                    if len(parts) >= 2:
-                        series = f"{parts[0]}.{parts[1]}"
-                        series_versions.setdefault(series, ver)
+    for link in soup.select("span.release-number > a"):
+        version_text = link.get_text(strip=True)
+        if version_text.startswith("Python "):
+            ver = version_text.replace("Python ", "")
+            if validate_version_string(ver):
+                series_versions.setdefault(major_minor(ver), ver)
     for rel in releases:
         if rel["series"] in series_versions:
             rel["latest_version"] = series_versions[rel["series"]]
     return releases
 
 
-def get_available_python_versions(limit: int = 50) -> list[dict[str, str]]:
-    cached = get_versions_from_cache(limit)
-    if cached:
+def get_available_python_versions(limit: int = 50, wait: bool = True) -> list[dict[str, str]]:
+    """Return up to limit recent Python releases, served from the metadata cache.
+
+    Args:
+        limit: Maximum number of versions to return.
+        wait: With an empty cache, fetch from python.org before returning. If
+              False, start a background sync and return an empty list so the
+              caller is never blocked on the network.
+    """
+    rows = get_versions_from_cache(limit)
+    if rows:
         start_background_sync_if_stale()
-        return cached
+        return rows
+    if not wait:
+        start_background_sync_if_stale()
+        return []
     try:
         sync_python_org()
         data = get_versions_from_cache(limit)
@@ -335,14 +553,14 @@ def get_available_python_versions(limit: int = 50) -> list[dict[str, str]]:
     try:
         url = "https://www.python.org/downloads/"
         versions: list[dict[str, str]] = []
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        release_links = soup.find_all("span", class_="release-number")
-        for release in release_links[:limit]:
+        release_spans = (
+            span for span in _stream_html_elements(url, "span") if "release-number" in (span.get("class") or "").split()
+        )
+        # Stop downloading and parsing after the first limit release rows
+        for release in itertools.islice(release_spans, limit):
             link = release.find("a")
-            if link:
-                version_text = link.get_text(strip=True)
+            if link is not None:
+                version_text = "".join(link.itertext()).strip()
                 if version_text.startswith("Python "):
                     ver = version_text.replace("Python ", "")
                     if validate_version_string(ver):
@@ -402,22 +620,32 @@ def check_python_version(silent: bool = False) -> tuple[str, str | None, bool]:
         return local_ver, latest_ver, False
 
 
-def is_python_version_installed(version_str: str) -> bool:
-    """Check if a specific Python version is installed on the system."""
-    installed = get_installed_python_versions()
+def is_python_version_installed(version_str: str, exact: bool = False) -> bool:
+    """Check if a specific Python version is installed on the system.
 
-    if any(v["version"] == version_str for v in installed):
+    Args:
+        version_str: Version to look for (e.g., "3.12.1").
+        exact: Only accept an installation reporting exactly version_str,
+               not just the same major.minor series.
+    """
+    installed = get_installed_version_set()
+
+    if version_str in installed:
         return True
+    if exact:
+        return False
 
-    try:
-        parts = version_str.split(".")
-        if len(parts) >= 2:
-            major_minor = f"{parts[0]}.{parts[1]}"
-            return any(v["version"] == major_minor for v in installed)
-    except (ValueError, IndexError):
-        pass
+    series = major_minor(version_str)
+    return series != version_str and series in installed
+
+
+def get_installed_version_set() -> frozenset[str]:
+    """Return the version strings reported by get_installed_python_versions().
 
-    return False
+    Use this to test many versions against one scan with set lookups. The set
+    is built once per scan, not per call.
+    """
+    return _installed_snapshot()[1]
 
 
 def _normalize_status(text: str) -> str:
@@ -435,10 +663,9 @@ def _normalize_status(text: str) -> str:
 
 def is_version_security_supported(ver: str) -> bool:
     try:
-        parts = ver.split(".")
-        if len(parts) < 2:
+        if ver.count(".") < 1:
             return False
-        series = f"{parts[0]}.{parts[1]}"
+        series = major_minor(ver)
         for rel in get_active_python_releases():
             if rel.get("series") == series:
                 status = _normalize_status(str(rel.get("status", "")))
@@ -452,17 +679,19 @@ def get_versions_filtered(
     min_version: str | None = None, security_supported_only: bool = False
 ) -> list[dict[str, Any]]:
     releases = get_active_python_releases()
+    min_v = None
+    if min_version:
+        try:
+            min_v = pkg_version.parse(min_version)
+        except Exception:
+            pass
     out: list[dict[str, Any]] = []
     for rel in releases:
         version = rel.get("latest_version")
         if not version or not validate_version_string(str(version)):
             continue
-        if min_version:
-            try:
-                if pkg_version.parse(str(version)) < pkg_version.parse(min_version):
-                    continue
-            except Exception:
-                pass
+        if min_v is not None and pkg_version.parse(str(version)) < min_v:
+            continue
         status = _normalize_status(str(rel.get("status", "")))
         if security_supported_only and status not in {"security", "active"}:
             continue
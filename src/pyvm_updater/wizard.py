@@ -23,6 +23,13 @@ from textual.widgets import (
 
 from .plugins.manager import get_plugin_manager
 
+# The wizard only accepts a full X.Y.Z version
+_FULL_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
+# The OS cannot change while the app runs; the wizard checks it on every render
+_IS_LINUX = platform.system() == "Linux"
+_IS_WINDOWS = platform.system() == "Windows"
+
 
 class WizardScreen(ModalScreen[dict[str, Any]]):
     """A guided installation wizard for Python versions."""
@@ -118,7 +125,7 @@ class WizardScreen(ModalScreen[dict[str, Any]]):
                 with Vertical(id="step-options", classes="step-container"):
                     yield Label("Advanced Installation Options:", classes="step-label")
 
-                    if platform.system() == "Linux":
+                    if _IS_LINUX:
                         yield Checkbox("Build from source (Recommended for performance)", id="opt-source", value=False)
                         yield Checkbox(
                             "Enable optimizations (--enable-optimizations)", id="opt-optimizations", value=True
@@ -127,7 +134,7 @@ class WizardScreen(ModalScreen[dict[str, Any]]):
                     yield Label("Custom Installation Path (Optional):", classes="step-label")
                     yield Input(placeholder="/usr/local/custom-python", id="opt-path")
 
-                    if platform.system() == "Windows":
+                    if _IS_WINDOWS:
                         yield Checkbox("Add Python to PATH", id="opt-add-path", value=True)
 
                 # Step 4: Confirmation
@@ -165,14 +172,14 @@ class WizardScreen(ModalScreen[dict[str, Any]]):
         details = f"Version: [cyan]{self.options['version']}[/cyan]\n"
         details += f"Installer: [cyan]{self.options['installer']}[/cyan]\n"
 
-        if platform.system() == "Linux" and self.options.get("build_from_source"):
+        if _IS_LINUX and self.options.get("build_from_source"):
             details += "Build: [cyan]From Source[/cyan]\n"
             details += f"Optimizations: [cyan]{'Enabled' if self.options.get('optimizations') else 'Disabled'}[/cyan]\n"
 
         if self.options.get("install_path"):
             details += f"Path: [cyan]{self.options['install_path']}[/cyan]\n"
 
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             details += f"Add to PATH: [cyan]{'Yes' if self.options.get('add_to_path') else 'No'}[/cyan]\n"
 
         self.query_one("#confirm-details", Static).update(details)
@@ -193,7 +200,7 @@ class WizardScreen(ModalScreen[dict[str, Any]]):
         # Validate current step
         if self.current_step_idx == 0:
             ver = self.query_one("#version-input", Input).value.strip()
-            if not ver or not re.match(r"^\d+\.\d+\.\d+$", ver):
+            if not ver or not _FULL_VERSION_RE.match(ver):
                 self.query_one("#version-input", Input).styles.border = ("solid", "red")
                 return
             self.query_one("#version-input", Input).styles.border = None
@@ -211,7 +218,7 @@ class WizardScreen(ModalScreen[dict[str, Any]]):
 
         elif self.current_step_idx == 2:
             # Collect options
-            if platform.system() == "Linux":
+            if _IS_LINUX:
                 try:
                     self.options["build_from_source"] = self.query_one("#opt-source", Checkbox).value
                     self.options["optimizations"] = self.query_one("#opt-optimizations", Checkbox).value
@@ -221,7 +228,7 @@ class WizardScreen(ModalScreen[dict[str, Any]]):
             path_input = self.query_one("#opt-path", Input).value.strip()
             self.options["install_path"] = path_input
 
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 try:
                     self.options["add_to_path"] = self.query_one("#opt-add-path", Checkbox).value
                 except Exception:
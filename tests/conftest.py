@@ -0,0 +1,84 @@
+"""Shared fixtures for the pyvm_updater tests."""
+
+import pytest
+
+from pyvm_updater.plugins.manager import PluginManager
+from pyvm_updater.version import invalidate_installed_cache
+
+DOWNLOADS_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Download Python</title></head>
+<body>
+<div class="download-os-source"><a class="button" href="/ftp/python/3.13.1/Python-3.13.1.tar.xz">Download Python 3.13.1</a></div>
+<div class="active-release-list-widget">
+<h2 class="widget-title">Active Python Releases</h2>
+<div class="list-row-headings">
+<span class="release-version">Python version</span>
+<span class="release-status">Maintenance status</span>
+<span class="release-dl">Download</span>
+<span class="release-start">First released</span>
+<span class="release-end">End of support</span>
+<span class="release-pep">Release schedule</span>
+</div>
+<ol class="list-row-container menu">
+<li>
+<span class="release-version">3.13</span>
+<span class="release-status">bugfix</span>
+<span class="release-dl"><a href="/downloads/release/python-3131/">Download</a></span>
+<span class="release-start">2024-10-07</span>
+<span class="release-end">2029-10</span>
+<span class="release-pep"><a href="https://peps.python.org/pep-0719/">PEP 719</a></span>
+</li>
+<li>
+<span class="release-version">3.12</span>
+<span class="release-status">security</span>
+<span class="release-dl"><a href="/downloads/release/python-3128/">Download</a></span>
+<span class="release-start">2023-10-02</span>
+<span class="release-end">2028-10</span>
+<span class="release-pep"><a href="https://peps.python.org/pep-0693/">PEP 693</a></span>
+</li>
+</ol>
+</div>
+<div class="row download-list-widget">
+<ol class="list-row-container menu">
+<li><span class="release-number"><a href="/downloads/release/python-3131/">Python 3.13.1</a></span>
+<span class="release-date">Dec. 3, 2024</span></li>
+<li><span class="release-number"><a href="/downloads/release/python-3128/">Python 3.12.8</a></span>
+<span class="release-date">Dec. 3, 2024</span></li>
+<li><span class="release-number"><a href="/downloads/release/python-3130/">Python 3.13.0</a></span>
+<span class="release-date">Oct. 7, 2024</span></li>
+<li><span class="release-number"><a href="/downloads/release/python-3131-mirror/">Python 3.13.1</a></span>
+<span class="release-date">Dec. 3, 2024</span></li>
+<li><span class="release-number"><a href="/downloads/release/pymanager/">Python install manager</a></span>
+<span class="release-date">Oct. 7, 2024</span></li>
+</ol>
+</div>
+</body></html>
+"""
+
+
+@pytest.fixture
+def downloads_page():
+    """A trimmed copy of https://www.python.org/downloads/ (release schedule, recent releases, download button)."""
+    return DOWNLOADS_PAGE
+
+
+@pytest.fixture(scope="session")
+def plugin_manager():
+    """The process-wide PluginManager, with built-ins registered once for the session."""
+    return PluginManager()
+
+
+@pytest.fixture(autouse=True)
+def isolated_metadata_db(tmp_path, monkeypatch):
+    """Keep every test away from the real ~/.pyvm_metadata.sqlite (also used by pyvm_updater.cache)."""
+    db = tmp_path / "pyvm_metadata.sqlite"
+    monkeypatch.setattr("pyvm_updater.metadata_store.METADATA_DB", db)
+    return db
+
+
+@pytest.fixture(autouse=True)
+def fresh_installed_versions():
+    """Rescan installed interpreters in every test instead of reusing another test's result."""
+    invalidate_installed_cache()
+    yield
+    invalidate_installed_cache()
@@ -0,0 +1,93 @@
+"""Tests for pyvm_updater.cache module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pyvm_updater import cache
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Point the cache at a temporary database."""
+    with patch("pyvm_updater.metadata_store.METADATA_DB", tmp_path / "metadata.sqlite"):
+        yield
+
+
+class TestCached:
+    """Tests for the cached decorator."""
+
+    def test_hit_skips_call(self, temp_db):
+        """Test that a second call is served from the cache."""
+        func = MagicMock(return_value=["3.12.1", "https://example.invalid"])
+        func.__qualname__ = "fetch"
+        wrapped = cache.cached(ttl=60)(func)
+
+        assert wrapped() == ["3.12.1", "https://example.invalid"]
+        assert wrapped() == ["3.12.1", "https://example.invalid"]
+        assert func.call_count == 1
+
+    def test_expired_entry_refetches(self, temp_db):
+        """Test that entries older than the TTL are ignored."""
+        func = MagicMock(return_value={"version": "3.12.1"})
+        func.__qualname__ = "fetch_expired"
+        wrapped = cache.cached(ttl=0)(func)
+
+        wrapped()
+        wrapped()
+        assert func.call_count == 2
+
+    def test_failed_result_not_cached(self, temp_db):
+        """Test that results rejected by cache_if are not stored."""
+        func = MagicMock(return_value=(None, None))
+        func.__qualname__ = "fetch_failed"
+        wrapped = cache.cached(ttl=60, cache_if=lambda r: bool(r[0]))(func)
+
+        wrapped()
+        wrapped()
+        assert func.call_count == 2
+
+    def test_arguments_are_part_of_key(self, temp_db):
+        """Test that different arguments are cached separately."""
+        func = MagicMock(side_effect=lambda limit: list(range(limit)))
+        func.__qualname__ = "fetch_args"
+        wrapped = cache.cached(ttl=60)(func)
+
+        assert wrapped(2) == [0, 1]
+        assert wrapped(3) == [0, 1, 2]
+        assert func.call_count == 2
+
+    def test_repeat_calls_skip_database(self, temp_db):
+        """Test that a result is served from memory without another SQLite read."""
+        func = MagicMock(return_value={"version": "3.12.1"})
+        func.__qualname__ = "fetch_memo"
+        wrapped = cache.cached(ttl=60)(func)
+
+        first = wrapped()
+        first["version"] = "mutated"
+        with patch("pyvm_updater.cache.get") as mock_get:
+            assert wrapped() == {"version": "3.12.1"}
+        mock_get.assert_not_called()
+        assert func.call_count == 1
+
+    def test_disk_hit_is_decoded(self, temp_db):
+        """Test that decode restores tuples that JSON stored as lists."""
+        func = MagicMock(return_value=("3.12.1", "https://example.invalid"))
+        func.__qualname__ = "fetch_tuple"
+
+        assert cache.cached(ttl=60, decode=tuple)(func)() == ("3.12.1", "https://example.invalid")
+        # A fresh decorator has an empty memo, so this one reads the row back from disk
+        assert cache.cached(ttl=60, decode=tuple)(func)() == ("3.12.1", "https://example.invalid")
+        assert func.call_count == 1
+
+
+class TestStorage:
+    """Tests for the get/put key/value store."""
+
+    def test_shares_metadata_store_connection(self, temp_db):
+        """Test that get and put reuse the metadata store's per-thread connection."""
+        cache.put("key", {"a": 1})
+        with patch("pyvm_updater.metadata_store.sqlite3.connect") as mock_connect:
+            cache.put("key", {"a": 2})
+            assert cache.get("key") == {"a": 2}
+        mock_connect.assert_not_called()
@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from pyvm_updater.cli import cli
+
+
+class TestCliDispatch:
+    @pytest.fixture
+    def runner(self):
+        return CliRunner()
+
+    @patch("pyvm_updater.history.HistoryManager.save_history")
+    @patch("pyvm_updater.installers.show_python_usage_instructions")
+    def test_install_dispatches_on_os(self, mock_usage, mock_save, runner):
+        mock_linux = MagicMock(return_value=True)
+        with (
+            patch("pyvm_updater.cli.get_os_info", return_value=("linux", "amd64")),
+            patch("pyvm_updater.version.is_python_version_installed", return_value=False),
+            patch.dict("pyvm_updater.installers.INSTALLERS", {"linux": mock_linux}),
+        ):
+            result = runner.invoke(cli, ["install", "3.11.5", "--yes", "--build-from-source"])
+
+        assert result.exit_code == 0
+        mock_linux.assert_called_once_with("3.11.5", preferred="auto", build_from_source=True)
+        mock_save.assert_called_once_with("install", "3.11.5")
+
+    @patch("pyvm_updater.history.HistoryManager.save_history")
+    def test_install_already_installed_is_noop(self, mock_save, runner):
+        mock_linux = MagicMock(return_value=True)
+        with (
+            patch("pyvm_updater.cli.get_os_info", return_value=("linux", "amd64")),
+            patch("pyvm_updater.version.is_python_version_installed", return_value=True),
+            patch.dict("pyvm_updater.installers.INSTALLERS", {"linux": mock_linux}),
+        ):
+            result = runner.invoke(cli, ["install", "3.11.5", "--yes"])
+
+        assert result.exit_code == 0
+        assert "already installed" in result.output
+        mock_linux.assert_not_called()
+        mock_save.assert_not_called()
+
+    def test_remove_unsupported_os(self, runner):
+        with patch("pyvm_updater.cli.get_os_info", return_value=("plan9", "amd64")):
+            result = runner.invoke(cli, ["remove", "3.11.5", "--yes"])
+
+        assert result.exit_code == 1
+        assert "Unsupported operating system: plan9" in result.output
@@ -0,0 +1,49 @@
+"""Tests for pyvm_updater.config module."""
+
+from unittest.mock import patch
+
+import pytest
+
+from pyvm_updater import config as config_module
+from pyvm_updater.config import DEFAULT_CONFIG, Config, get_config
+
+
+@pytest.fixture
+def fresh_config(tmp_path):
+    """Provide a Config instance backed by a temporary config file."""
+    config_file = tmp_path / "config.toml"
+    get_config.cache_clear()
+    with (
+        patch("pyvm_updater.config.CONFIG_DIR", tmp_path),
+        patch("pyvm_updater.config.CONFIG_FILE", config_file),
+    ):
+        yield config_file
+    get_config.cache_clear()
+
+
+class TestConfig:
+    """Tests for Config class."""
+
+    def test_set_does_not_mutate_defaults(self, fresh_config):
+        """Test that runtime changes don't leak into DEFAULT_CONFIG."""
+        cfg = Config()
+        cfg.set("general", "preferred_installer", "pyenv")
+        assert cfg.preferred_installer == "pyenv"
+        assert DEFAULT_CONFIG["general"]["preferred_installer"] == "auto"
+
+    def test_save_and_reload(self, fresh_config):
+        """Test that saved values are read back by a new instance."""
+        if config_module.tomllib is None:
+            pytest.skip("TOML parser not available")
+        cfg = Config()
+        cfg.set("download", "timeout", 30)
+        assert cfg.save() is True
+
+        assert Config().download_timeout == 30
+
+    def test_get_config_is_shared(self, fresh_config):
+        """Test that get_config returns one instance until the cache is cleared."""
+        cfg = get_config()
+        assert get_config() is cfg
+        get_config.cache_clear()
+        assert get_config() is not cfg
@@ -1,7 +1,6 @@
 """Tests for pyvm_updater.history module."""
 
-import tempfile
-from pathlib import Path
+import json
 from unittest.mock import patch
 
 import pytest
@@ -9,19 +8,24 @@ import pytest
 from pyvm_updater.history import HistoryManager
 
 
+def _seed(path, entries):
+    """Write entries to a history file in one go, one JSON object per line."""
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+
+
 class TestHistoryManager:
     """Tests for HistoryManager class."""
 
     @pytest.fixture
-    def temp_history_file(self):
-        """Create a temporary history file for testing."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("[]")
-            temp_path = Path(f.name)
-        yield temp_path
-        # Cleanup
-        if temp_path.exists():
-            temp_path.unlink()
+    def temp_history_file(self, tmp_path):
+        """Create an empty history file, with the legacy file and cache isolated too."""
+        temp_path = tmp_path / "history.jsonl"
+        temp_path.touch()
+        with (
+            patch("pyvm_updater.history.LEGACY_HISTORY_FILE", tmp_path / "history.json"),
+            patch.object(HistoryManager, "_cache", None),
+        ):
+            yield temp_path
 
     def test_get_history_empty_file(self, temp_history_file):
         """Test get_history with empty file."""
@@ -45,6 +49,14 @@ class TestHistoryManager:
             assert history[0]["action"] == "install"
             assert history[0]["version"] == "3.12.1"
 
+    def test_entries_are_written_compactly(self, temp_history_file):
+        """Test that each entry is one compact JSON line."""
+        with patch("pyvm_updater.history.HISTORY_FILE", temp_history_file):
+            HistoryManager.save_history("install", "3.12.1")
+        line = temp_history_file.read_text()
+        assert line.count("\n") == 1
+        assert ", " not in line and '": ' not in line
+
     def test_get_last_action_empty(self, temp_history_file):
         """Test get_last_action with empty history."""
         with patch("pyvm_updater.history.HISTORY_FILE", temp_history_file):
@@ -53,9 +65,11 @@ class TestHistoryManager:
 
     def test_get_last_action(self, temp_history_file):
         """Test get_last_action returns most recent entry."""
+        _seed(
+            temp_history_file,
+            [{"action": "install", "version": "3.11.5"}, {"action": "update", "version": "3.12.1"}],
+        )
         with patch("pyvm_updater.history.HISTORY_FILE", temp_history_file):
-            HistoryManager.save_history("install", "3.11.5")
-            HistoryManager.save_history("update", "3.12.1")
             result = HistoryManager.get_last_action()
             assert result is not None
             assert result["action"] == "update"
@@ -63,8 +77,84 @@ class TestHistoryManager:
 
     def test_history_limit(self, temp_history_file):
         """Test that history is limited to 10 entries."""
+        _seed(temp_history_file, [{"action": "install", "version": f"3.{i}.0"} for i in range(15)])
         with patch("pyvm_updater.history.HISTORY_FILE", temp_history_file):
-            for i in range(15):
-                HistoryManager.save_history("install", f"3.{i}.0")
             history = HistoryManager.get_history()
             assert len(history) == 10
+            assert history[-1]["version"] == "3.14.0"
+
+            HistoryManager.save_history("install", "3.15.0")
+            history = HistoryManager.get_history()
+            assert len(history) == 10
+            assert history[-1]["version"] == "3.15.0"
+
+    def test_get_last_action_ignores_trailing_newlines(self, temp_history_file):
+        """Test that the last entry is found without a final newline or with extra ones."""
+        first = json.dumps({"action": "install", "version": "3.11.5"})
+        last = json.dumps({"action": "update", "version": "3.12.1"})
+        with patch("pyvm_updater.history.HISTORY_FILE", temp_history_file):
+            for tail in ("", "\n\n"):
+                temp_history_file.write_text(f"{first}\n{last}{tail}")
+                assert HistoryManager.get_last_action()["version"] == "3.12.1"
+
+    def test_history_is_compacted(self, temp_history_file):
+        """Test that the log is trimmed once it grows past the compaction threshold."""
+        with (
+            patch("pyvm_updater.history.HISTORY_FILE", temp_history_file),
+            patch("pyvm_updater.history._COMPACT_THRESHOLD", 1024),
+        ):
+            for i in range(30):
+                HistoryManager.save_history("install", f"3.{i}.0")
+            assert temp_history_file.stat().st_size <= 1024 + 200
+            assert HistoryManager.get_history()[-1]["version"] == "3.29.0"
+
+    def test_get_history_served_from_memory(self, temp_history_file):
+        """Test that history is read from disk once and kept current by save_history."""
+        with patch("pyvm_updater.history.HISTORY_FILE", temp_history_file):
+            HistoryManager.save_history("install", "3.11.5")
+            assert len(HistoryManager.get_history()) == 1
+            HistoryManager.save_history("update", "3.12.1")
+            with patch("builtins.open", side_effect=AssertionError("history re-read")):
+                history = HistoryManager.get_history()
+                assert [h["version"] for h in history] == ["3.11.5", "3.12.1"]
+                assert HistoryManager.get_last_action()["version"] == "3.12.1"
+
+    def test_remove_last_action(self, temp_history_file):
+        """Test that remove_last_action drops only the most recent entry."""
+        _seed(
+            temp_history_file,
+            [{"action": "install", "version": "3.11.5"}, {"action": "update", "version": "3.12.1"}],
+        )
+        with patch("pyvm_updater.history.HISTORY_FILE", temp_history_file):
+            assert HistoryManager.remove_last_action() is True
+            history = HistoryManager.get_history()
+            assert [h["version"] for h in history] == ["3.11.5"]
+            assert HistoryManager.remove_last_action() is True
+            assert HistoryManager.remove_last_action() is False
+
+    def test_legacy_json_array_is_migrated(self, temp_history_file):
+        """Test that a history file in the old JSON array format is carried over."""
+        from pyvm_updater import history
+
+        legacy = [{"action": "install", "version": f"3.{i}.0", "timestamp": 0} for i in range(3)]
+        history.LEGACY_HISTORY_FILE.write_text(json.dumps(legacy, indent=2))
+        temp_history_file.unlink()
+        with patch("pyvm_updater.history.HISTORY_FILE", temp_history_file):
+            assert HistoryManager.get_last_action()["version"] == "3.2.0"
+            assert not history.LEGACY_HISTORY_FILE.exists()
+            HistoryManager.save_history("update", "3.12.1")
+            history = HistoryManager.get_history()
+            assert [h["version"] for h in history] == ["3.0.0", "3.1.0", "3.2.0", "3.12.1"]
+
+    def test_corrupt_legacy_file_is_kept(self, temp_history_file):
+        """Test that a legacy file that fails to parse is neither migrated nor deleted."""
+        from pyvm_updater import history
+
+        for corrupt in ('[{"action": "install", "version"', "not json\n"):
+            history.LEGACY_HISTORY_FILE.write_text(corrupt)
+            temp_history_file.unlink(missing_ok=True)
+            with patch("pyvm_updater.history.HISTORY_FILE", temp_history_file):
+                assert HistoryManager._migrate_legacy() is False
+                assert HistoryManager.get_history() == []
+            assert history.LEGACY_HISTORY_FILE.read_text() == corrupt
+            assert not temp_history_file.exists()
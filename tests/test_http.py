@@ -0,0 +1,16 @@
+"""Tests for pyvm_updater._http module."""
+
+from pyvm_updater import __version__
+from pyvm_updater._http import get_session
+
+
+class TestGetSession:
+    """Tests for the shared HTTP session."""
+
+    def test_session_shared(self):
+        """Test that every caller gets the same pooled session."""
+        assert get_session() is get_session()
+
+    def test_user_agent_names_pyvm(self):
+        """Test that requests identify pyvm-updater and its version."""
+        assert get_session().headers["User-Agent"].startswith(f"pyvm-updater/{__version__} ")
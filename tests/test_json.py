@@ -0,0 +1,48 @@
+"""Tests for pyvm_updater._json module."""
+
+from unittest.mock import patch
+
+import pytest
+
+from pyvm_updater import _json
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+class TestJsonHelpers:
+    """Tests for dumps/loads with and without orjson."""
+
+    def test_round_trip(self, use_orjson):
+        """Test that dumps output parses back to the same value."""
+        data = {"name": "env", "versions": ["3.12.1", "3.13.0"], "exists": True}
+        backend = _json.orjson if use_orjson else None
+        if use_orjson and backend is None:
+            pytest.skip("orjson not installed")
+        with patch("pyvm_updater._json.orjson", backend):
+            assert _json.loads(_json.dumps(data)) == data
+            assert _json.loads(_json.dumps(data, indent=True).encode()) == data
+
+    def test_compact_output_is_single_line(self, use_orjson):
+        """Test that non-indented output fits on one line for JSONL files."""
+        backend = _json.orjson if use_orjson else None
+        if use_orjson and backend is None:
+            pytest.skip("orjson not installed")
+        with patch("pyvm_updater._json.orjson", backend):
+            assert "\n" not in _json.dumps({"a": [1, 2], "b": {"c": None}})
+
+    def test_dumps_line_is_one_record(self, use_orjson):
+        """Test that dumps_line emits exactly one newline-terminated line."""
+        backend = _json.orjson if use_orjson else None
+        if use_orjson and backend is None:
+            pytest.skip("orjson not installed")
+        with patch("pyvm_updater._json.orjson", backend):
+            line = _json.dumps_line({"action": "install", "version": "3.12.1"})
+            assert line.endswith(b"\n") and line.count(b"\n") == 1
+            assert _json.loads(line) == {"action": "install", "version": "3.12.1"}
+
+    def test_malformed_input_raises_value_error(self, use_orjson):
+        """Test that callers can catch ValueError regardless of backend."""
+        backend = _json.orjson if use_orjson else None
+        if use_orjson and backend is None:
+            pytest.skip("orjson not installed")
+        with patch("pyvm_updater._json.orjson", backend), pytest.raises(ValueError):
+            _json.loads("{not json")
@@ -0,0 +1,228 @@
+"""Tests for pyvm_updater.metadata_store module."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pyvm_updater import metadata_store
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Point the metadata store at a temporary database."""
+    with patch("pyvm_updater.metadata_store.METADATA_DB", tmp_path / "metadata.sqlite"):
+        yield
+
+
+def _response(text, status_code=200, headers=None):
+    body = text.encode()
+    resp = MagicMock(status_code=status_code, text=text, content=body, headers=headers or {})
+    resp.raise_for_status.return_value = None
+    resp.iter_content.side_effect = lambda size: [body[i : i + size] for i in range(0, len(body), size)]
+    return resp
+
+
+class TestSyncPythonOrg:
+    """Tests for sync_python_org."""
+
+    def test_parses_release_table_and_links(self, temp_db, downloads_page):
+        """Test that series and version rows are stored from the downloads page."""
+        with patch("pyvm_updater.metadata_store.get_session") as mock_session:
+            mock_session.return_value.get.return_value = _response(downloads_page)
+            metadata_store.sync_python_org()
+
+        releases = {r["series"]: r for r in metadata_store.get_releases_from_cache()}
+        assert set(releases) == {"3.13", "3.12"}
+        assert releases["3.13"]["status"] == "bugfix"
+        assert releases["3.13"]["first_release"] == "2024-10-07"
+        assert releases["3.13"]["end_of_support"] == "2029-10"
+        assert releases["3.13"]["latest_version"] == "3.13.1"
+        assert releases["3.12"]["latest_version"] == "3.12.8"
+
+        versions = {v["version"]: v["url"] for v in metadata_store.get_versions_from_cache()}
+        assert versions == {
+            "3.13.1": "https://www.python.org/downloads/release/python-3131/",
+            "3.12.8": "https://www.python.org/downloads/release/python-3128/",
+            "3.13.0": "https://www.python.org/downloads/release/python-3130/",
+        }
+        assert metadata_store.is_cache_stale() is False
+
+    def test_not_modified_skips_parse(self, temp_db, downloads_page):
+        """Test that a 304 revalidation refreshes last_sync without touching the data."""
+        with patch("pyvm_updater.metadata_store.get_session") as mock_session:
+            mock_session.return_value.get.return_value = _response(downloads_page, headers={"ETag": '"abc"'})
+            metadata_store.sync_python_org()
+            mock_session.return_value.get.return_value = _response("", status_code=304)
+            with patch("pyvm_updater.metadata_store._parse_html_stream") as mock_parse:
+                metadata_store.sync_python_org()
+
+        mock_parse.assert_not_called()
+        assert mock_session.return_value.get.call_args[1]["headers"] == {"If-None-Match": '"abc"'}
+        assert len(metadata_store.get_versions_from_cache()) == 3
+
+    def test_failed_fetch_leaves_cache_stale(self, temp_db):
+        """Test that a sync that never succeeds does not mark the cache fresh."""
+        with (
+            patch("pyvm_updater.metadata_store.get_session") as mock_session,
+            patch("pyvm_updater.metadata_store.time.sleep"),
+        ):
+            mock_session.return_value.get.side_effect = OSError("offline")
+            metadata_store.sync_python_org()
+
+        assert metadata_store.is_cache_stale() is True
+        assert metadata_store.get_versions_from_cache() == []
+        assert metadata_store.get_latest_from_cache() == (None, None)
+
+    def test_records_download_button(self, temp_db, downloads_page):
+        """Test that the header download button is stored for latest-version lookups."""
+        with patch("pyvm_updater.metadata_store.get_session") as mock_session:
+            mock_session.return_value.get.return_value = _response(downloads_page)
+            metadata_store.sync_python_org()
+
+        assert metadata_store.get_latest_from_cache() == (
+            "3.13.1",
+            "https://www.python.org/ftp/python/3.13.1/Python-3.13.1.tar.xz",
+        )
+
+    def test_page_streamed_and_closed(self, temp_db, downloads_page):
+        """Test that the page is parsed from the streamed body and the response is closed."""
+        resp = _response(downloads_page)
+        with patch("pyvm_updater.metadata_store.get_session") as mock_session:
+            mock_session.return_value.get.return_value = resp
+            metadata_store.sync_python_org()
+
+        assert mock_session.return_value.get.call_args[1]["stream"] is True
+        resp.close.assert_called_once()
+        assert len(metadata_store.get_versions_from_cache()) == 3
+
+
+class TestIsCacheStale:
+    """Tests for is_cache_stale."""
+
+    def _set_last_sync(self, age):
+        with metadata_store.connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES('last_sync', ?)", (str(metadata_store._now() - age),)
+            )
+
+    def test_missing_sync_is_stale(self, temp_db):
+        """Test that a never-synced store is stale."""
+        assert metadata_store.is_cache_stale() is True
+
+    def test_ttl_is_jittered(self, temp_db):
+        """Test that the TTL window is scaled by a random factor."""
+        self._set_last_sync(metadata_store.METADATA_TTL_SECONDS + 10)
+        with patch("pyvm_updater.metadata_store.random.uniform", return_value=1.1):
+            assert metadata_store.is_cache_stale() is False
+        with patch("pyvm_updater.metadata_store.random.uniform", return_value=0.9):
+            assert metadata_store.is_cache_stale() is True
+
+    def test_last_sync_read_once_per_recheck_window(self, temp_db):
+        """Test that repeated checks reuse the in-process last_sync."""
+        self._set_last_sync(0)
+        metadata_store.is_cache_stale()
+        with patch("pyvm_updater.metadata_store.connect") as mock_connect:
+            assert metadata_store.is_cache_stale() is False
+        mock_connect.assert_not_called()
+
+    def test_sync_refreshes_in_process_last_sync(self, temp_db, downloads_page):
+        """Test that a completed sync is visible without rereading SQLite."""
+        assert metadata_store.is_cache_stale() is True
+        with patch("pyvm_updater.metadata_store.get_session") as mock_session:
+            mock_session.return_value.get.return_value = _response(downloads_page)
+            metadata_store.sync_python_org()
+        assert metadata_store.is_cache_stale() is False
+
+
+class TestConnect:
+    """Tests for the per-thread connection cache."""
+
+    def test_connection_reused_within_thread(self, temp_db):
+        """Test that repeated calls share one connection."""
+        assert metadata_store.connect() is metadata_store.connect()
+
+    def test_each_thread_gets_own_connection(self, temp_db):
+        """Test that another thread opens its own connection."""
+        main_conn = metadata_store.connect()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(metadata_store.connect()))
+        thread.start()
+        thread.join()
+        assert other and other[0] is not main_conn
+
+    def test_new_database_path_reconnects(self, tmp_path):
+        """Test that pointing METADATA_DB elsewhere opens a fresh connection."""
+        with patch("pyvm_updater.metadata_store.METADATA_DB", tmp_path / "a.sqlite"):
+            first = metadata_store.connect()
+        with patch("pyvm_updater.metadata_store.METADATA_DB", tmp_path / "b.sqlite"):
+            second = metadata_store.connect()
+        assert first is not second
+        assert (tmp_path / "b.sqlite").exists()
+
+    def test_connection_uses_wal(self, temp_db):
+        """Test that the store runs in WAL mode with a busy timeout."""
+        conn = metadata_store.connect()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+
+    def test_recent_versions_query_uses_index(self, temp_db):
+        """Test that listing recent versions is an index scan, not a sort."""
+        plan = metadata_store.connect().execute(
+            "EXPLAIN QUERY PLAN SELECT version, url FROM versions ORDER BY fetched_at DESC LIMIT 50"
+        )
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_versions_fetched_at" in details
+        assert "TEMP B-TREE" not in details
+
+
+class TestBackgroundSync:
+    """Tests for start_background_sync_if_stale."""
+
+    def test_only_one_sync_runs_at_a_time(self):
+        """Test that a second call while a sync is running does not start another."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_sync():
+            started.set()
+            release.wait(5)
+
+        with (
+            patch("pyvm_updater.metadata_store.is_cache_stale", return_value=True),
+            patch("pyvm_updater.metadata_store.sync_python_org", side_effect=slow_sync) as mock_sync,
+        ):
+            metadata_store.start_background_sync_if_stale()
+            assert started.wait(5)
+            metadata_store.start_background_sync_if_stale()
+            release.set()
+            for _ in range(50):
+                if not metadata_store._sync_lock.locked():
+                    break
+                time.sleep(0.01)
+
+        assert mock_sync.call_count == 1
+        assert not metadata_store._sync_lock.locked()
+
+    def test_wait_for_background_sync(self):
+        """Test that waiting returns once the running sync finishes, or False on timeout."""
+        release = threading.Event()
+        with (
+            patch("pyvm_updater.metadata_store.is_cache_stale", return_value=True),
+            patch("pyvm_updater.metadata_store.sync_python_org", side_effect=lambda: release.wait(5)),
+        ):
+            metadata_store.start_background_sync_if_stale()
+            assert metadata_store.wait_for_background_sync(timeout=0.01) is False
+            release.set()
+            assert metadata_store.wait_for_background_sync(timeout=5) is True
+        assert not metadata_store._sync_lock.locked()
+
+    def test_fresh_cache_does_not_sync(self):
+        """Test that no thread is started when the cache is fresh."""
+        with (
+            patch("pyvm_updater.metadata_store.is_cache_stale", return_value=False),
+            patch("pyvm_updater.metadata_store.threading.Thread") as mock_thread,
+        ):
+            metadata_store.start_background_sync_if_stale()
+        mock_thread.assert_not_called()
@@ -1,27 +1,86 @@
 """Tests for the plugin system."""
 
+import importlib.util
+import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from pyvm_updater.plugins import standard
 from pyvm_updater.plugins.base import InstallerPlugin
 from pyvm_updater.plugins.manager import PluginManager
-from pyvm_updater.plugins.standard import MiseInstaller
+from pyvm_updater.plugins.standard import (
+    AptInstaller,
+    CondaInstaller,
+    MiseInstaller,
+    PyenvInstaller,
+    SourceInstaller,
+)
+
+CUSTOM_PLUGIN_SOURCE = """
+from pyvm_updater.plugins.base import InstallerPlugin
+from typing import Any
+
+class CustomTestPlugin(InstallerPlugin):
+    def get_name(self) -> str:
+        return "custom-test"
+    def is_supported(self) -> bool:
+        return True
+    def install(self, version: str, **kwargs: Any) -> bool:
+        return True
+    def uninstall(self, version: str) -> bool:
+        return True
+    def get_priority(self) -> int:
+        return 500
+"""
+
+
+@pytest.fixture(scope="module")
+def custom_plugin_file(tmp_path_factory):
+    """A custom plugin file written once for the module's tests."""
+    plugin_file = tmp_path_factory.mktemp("plugins") / "custom_plugin.py"
+    plugin_file.write_text(CUSTOM_PLUGIN_SOURCE)
+    return plugin_file
+
+
+class _StubPlugin:
+    """Minimal stand-in for an installer plugin: a name, a priority, always supported."""
+
+    def __init__(self, name, priority):
+        self.name = name
+        self.priority = priority
+
+    def get_name(self):
+        return self.name
+
+    def get_priority(self):
+        return self.priority
+
+    def is_supported(self):
+        return True
 
 
 class TestPluginManager:
     """Tests for PluginManager class."""
 
-    def test_singleton(self):
+    @pytest.fixture(autouse=True)
+    def reset_sorted_cache(self, plugin_manager):
+        """Tests swap _plugins directly, so drop the sorted cache around each one."""
+        plugin_manager._sorted_supported = None
+        yield
+        plugin_manager._sorted_supported = None
+
+    def test_singleton(self, plugin_manager):
         """Test that PluginManager is a singleton."""
-        pm1 = PluginManager()
-        pm2 = PluginManager()
-        assert pm1 is pm2
+        assert PluginManager() is plugin_manager
 
-    def test_builtin_registration(self):
+    def test_builtin_registration(self, plugin_manager):
         """Test that built-in plugins are registered automatically."""
-        pm = PluginManager()
-        plugins = pm.get_all_plugins()
+        plugins = plugin_manager.get_all_plugins()
 
         # Verify common built-ins are present
         plugin_names = [p.get_name() for p in plugins]
@@ -31,72 +90,562 @@ class TestPluginManager:
         assert "conda" in plugin_names
         assert "source" in plugin_names
 
-    def test_get_plugin(self):
+    def test_get_plugin(self, plugin_manager):
         """Test getting a plugin by name."""
-        pm = PluginManager()
-        plugin = pm.get_plugin("mise")
+        plugin = plugin_manager.get_plugin("mise")
         assert isinstance(plugin, MiseInstaller)
 
-        assert pm.get_plugin("non-existent") is None
+        assert plugin_manager.get_plugin("non-existent") is None
 
-    def test_priority_ordering(self):
+    def test_priority_ordering(self, plugin_manager):
         """Test that supported plugins are returned sorted by priority."""
-        pm = PluginManager()
-
-        # Create some mock plugins with different priorities
-        p1 = MagicMock(spec=InstallerPlugin)
-        p1.get_name.return_value = "low-priority"
-        p1.get_priority.return_value = 10
-        p1.is_supported.return_value = True
-
-        p2 = MagicMock(spec=InstallerPlugin)
-        p2.get_name.return_value = "high-priority"
-        p2.get_priority.return_value = 100
-        p2.is_supported.return_value = True
+        # Create some stub plugins with different priorities
+        p1 = _StubPlugin("low-priority", 10)
+        p2 = _StubPlugin("high-priority", 100)
 
         # Clear existing plugins for this test
-        with patch.dict(pm._plugins, {"low": p1, "high": p2}, clear=True):
-            supported = pm.get_supported_plugins()
+        with patch.dict(plugin_manager._plugins, {"low": p1, "high": p2}, clear=True):
+            supported = plugin_manager.get_supported_plugins()
             assert len(supported) == 2
             assert supported[0].get_name() == "high-priority"
             assert supported[1].get_name() == "low-priority"
 
-    def test_custom_plugin_loading(self):
+    def test_custom_plugin_loading(self, custom_plugin_file, plugin_manager):
         """Test loading a custom plugin from a file."""
-        pm = PluginManager()
+        # The manager is shared by the whole session, so never leave the plugin behind
+        try:
+            plugin_manager._load_plugin_from_file(custom_plugin_file)
 
-        # Create a temporary plugin file
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            plugin_file = temp_path / "custom_plugin.py"
+            plugin = plugin_manager.get_plugin("custom-test")
+            assert plugin is not None
+            assert plugin.get_name() == "custom-test"
+            assert plugin.get_priority() == 500
 
-            plugin_code = """
-from pyvm_updater.plugins.base import InstallerPlugin
-from typing import Any
+            assert plugin_manager.unregister_plugin("custom-test") is plugin
+            assert plugin_manager.get_plugin("custom-test") is None
+        finally:
+            plugin_manager.unregister_plugin("custom-test")
+            plugin_manager._loaded_files.pop(custom_plugin_file, None)
 
-class CustomTestPlugin(InstallerPlugin):
+    def test_unchanged_plugin_file_loaded_once(self, custom_plugin_file, plugin_manager):
+        """Test that loading the same unchanged file again does not re-import it."""
+        try:
+            with patch(
+                "pyvm_updater.plugins.manager.importlib.util.spec_from_file_location",
+                wraps=importlib.util.spec_from_file_location,
+            ) as mock_spec:
+                plugin_manager._load_plugin_from_file(custom_plugin_file)
+                plugin_manager._load_plugin_from_file(custom_plugin_file)
+            assert mock_spec.call_count == 1
+            assert plugin_manager.get_plugin("custom-test") is not None
+        finally:
+            plugin_manager.unregister_plugin("custom-test")
+            plugin_manager._loaded_files.pop(custom_plugin_file, None)
+
+    def test_plugin_file_registers_only_its_own_classes(self, tmp_path, plugin_manager):
+        """Test that imported plugin classes are not re-registered and unchanged files are not re-run."""
+        plugin_file = tmp_path / "own_plugin.py"
+        plugin_file.write_text(
+            """
+from pyvm_updater.plugins.standard import PyenvInstaller
+
+LOADS = []
+LOADS.append(1)
+
+class OwnPlugin(PyenvInstaller):
     def get_name(self) -> str:
-        return "custom-test"
-    def is_supported(self) -> bool:
-        return True
-    def install(self, version: str, **kwargs: Any) -> bool:
-        return True
-    def uninstall(self, version: str) -> bool:
-        return True
-    def get_priority(self) -> int:
-        return 500
+        return "own-test"
 """
-            plugin_file.write_text(plugin_code)
+        )
+        builtin_pyenv = plugin_manager.get_plugin("pyenv")
+        try:
+            with patch.object(plugin_manager, "register_plugin", wraps=plugin_manager.register_plugin) as mock_register:
+                plugin_manager._load_plugin_from_file(plugin_file)
+                plugin_manager._load_plugin_from_file(plugin_file)
 
-            # Use _load_plugin_from_file to load it
-            pm._load_plugin_from_file(plugin_file)
+            assert mock_register.call_count == 1
+            assert plugin_manager.get_plugin("own-test") is not None
+            assert plugin_manager.get_plugin("pyenv") is builtin_pyenv
+        finally:
+            plugin_manager.unregister_plugin("own-test")
+            plugin_manager._loaded_files.pop(plugin_file, None)
 
-            # Verify it's registered
-            plugin = pm.get_plugin("custom-test")
-            assert plugin is not None
-            assert plugin.get_name() == "custom-test"
-            assert plugin.get_priority() == 500
+    def test_plugin_file_registers_classes_from_helper_modules(self, tmp_path, monkeypatch, plugin_manager):
+        """Test that plugin classes a plugin file imports from its own helper module are registered."""
+        helpers = tmp_path / "helpers"
+        helpers.mkdir()
+        (helpers / "pyvm_test_helper_plugins.py").write_text(CUSTOM_PLUGIN_SOURCE)
+        plugin_file = tmp_path / "uses_helper.py"
+        plugin_file.write_text("from pyvm_test_helper_plugins import CustomTestPlugin  # noqa: F401\n")
+        monkeypatch.syspath_prepend(str(helpers))
+        try:
+            plugin_manager._load_plugin_from_file(plugin_file)
+            assert plugin_manager.get_plugin("custom-test") is not None
+        finally:
+            plugin_manager.unregister_plugin("custom-test")
+            plugin_manager._loaded_files.pop(plugin_file, None)
+            sys.modules.pop("pyvm_test_helper_plugins", None)
+
+    def test_support_probed_once(self, plugin_manager):
+        """Test that a plugin's is_supported() is only called once per process."""
+        plugin = MagicMock(spec=InstallerPlugin)
+        plugin.get_name.return_value = "probe-once"
+        plugin.get_priority.return_value = 10
+        plugin.is_supported.return_value = True
+
+        with patch.dict(plugin_manager._plugins, {"probe-once": plugin}, clear=True):
+            plugin_manager.get_supported_plugins()
+            plugin_manager.get_best_installer()
+            assert plugin.is_supported.call_count == 1
+
+    def test_plugins_probed_concurrently(self, plugin_manager):
+        """Test that unprobed plugins run is_supported() in parallel."""
+        barrier = threading.Barrier(2, timeout=5)
+        plugins = {}
+        for name in ("first", "second"):
+            plugin = MagicMock(spec=InstallerPlugin)
+            plugin.get_name.return_value = name
+            plugin.get_priority.return_value = 10
+            # Each probe only returns once the other one is running too
+            plugin.is_supported.side_effect = lambda: barrier.wait() is not None
+            plugins[name] = plugin
+
+        with patch.dict(plugin_manager._plugins, plugins, clear=True):
+            assert len(plugin_manager.get_supported_plugins()) == 2
+
+    def test_supported_order_cached_until_register(self, plugin_manager):
+        """Test that the sorted list is reused until a plugin is registered."""
+        low = MagicMock(spec=InstallerPlugin)
+        low.get_name.return_value = "low"
+        low.get_priority.return_value = 10
+        low.is_supported.return_value = True
+        high = MagicMock(spec=InstallerPlugin)
+        high.get_name.return_value = "high"
+        high.get_priority.return_value = 100
+        high.is_supported.return_value = True
+
+        with patch.dict(plugin_manager._plugins, {"low": low}, clear=True):
+            assert plugin_manager.get_supported_plugins() == [low]
+            plugin_manager.get_supported_plugins()
+            assert low.get_priority.call_count <= 1
+
+            plugin_manager.register_plugin(high)
+            assert plugin_manager.get_supported_plugins() == [high, low]
+
+    def test_detect_installers_uses_disk_cache(self, tmp_path, plugin_manager):
+        """Test that detected installers are served from the metadata cache."""
+        plugin = MagicMock(spec=InstallerPlugin)
+        plugin.is_supported.return_value = True
+
+        with (
+            patch("pyvm_updater.metadata_store.METADATA_DB", tmp_path / "metadata.sqlite"),
+            patch.dict(plugin_manager._plugins, {"cached": plugin}, clear=True),
+            patch.dict(plugin_manager._supported, clear=True),
+        ):
+            assert plugin_manager.detect_installers() == {"cached": True}
+            plugin_manager._supported.clear()
+            assert plugin_manager.detect_installers() == {"cached": True}
+            assert plugin.is_supported.call_count == 1
+
+
+class TestSourceInstaller:
+    """Tests for SourceInstaller."""
+
+    @pytest.fixture(autouse=True)
+    def clear_which_cache(self):
+        """Drop PATH lookups cached by other tests."""
+        standard._which.cache_clear()
+        yield
+        standard._which.cache_clear()
+
+    @pytest.fixture
+    def published_checksum(self):
+        """Control the .sha256 published next to the tarball (None when missing)."""
+        cfg = MagicMock(verify_checksum=True)
+        with (
+            patch("pyvm_updater.plugins.standard.get_config", return_value=cfg),
+            patch("pyvm_updater.config.get_config", return_value=cfg),
+            patch("pyvm_updater.plugins.standard.fetch_remote_sha256", return_value=None) as mock_fetch,
+        ):
+            yield mock_fetch
+
+    @pytest.fixture
+    def work_root(self, tmp_path):
+        """Create the private extraction directory under tmp_path instead of /tmp."""
+        mkdtemp = tempfile.mkdtemp
+        with patch(
+            "pyvm_updater.plugins.standard.tempfile.mkdtemp",
+            side_effect=lambda prefix: mkdtemp(prefix=prefix, dir=tmp_path),
+        ):
+            yield tmp_path
+
+    def test_dependencies_already_present_skips_install(self):
+        """Test that no package-manager install runs when all deps are present."""
+        which = {
+            "curl": "/usr/bin/curl",
+            "bash": "/bin/bash",
+            "apt": "/usr/bin/apt",
+            "dpkg-query": "/usr/bin/dpkg-query",
+        }
+        with (
+            patch("pyvm_updater.plugins.standard.shutil.which", side_effect=which.get),
+            patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout="install ok installed\n" * 14)
+            assert SourceInstaller()._install_dependencies() is True
+
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0][:3] == ["dpkg-query", "-W", "-f=${Status}\n"]
+
+    def test_config_files_only_package_is_reinstalled(self):
+        """Test that a package removed with its config files kept still gets installed."""
+        which = {
+            "curl": "/usr/bin/curl",
+            "bash": "/bin/bash",
+            "apt": "/usr/bin/apt",
+            "dpkg-query": "/usr/bin/dpkg-query",
+        }
+        statuses = "install ok installed\n" * 13 + "deinstall ok config-files\n"
+        with (
+            patch("pyvm_updater.plugins.standard.shutil.which", side_effect=which.get),
+            patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run,
+        ):
+            mock_run.side_effect = [
+                MagicMock(returncode=0, stdout=statuses),
+                MagicMock(returncode=0),
+                MagicMock(returncode=0),
+            ]
+            assert SourceInstaller()._install_dependencies() is True
+
+        assert mock_run.call_count == 3
+        assert mock_run.call_args_list[2][0][0][:3] == ["apt-get", "install", "-y"]
+
+    def test_missing_dependencies_are_installed(self):
+        """Test that a failed presence query falls through to installing."""
+        which = {"curl": "/usr/bin/curl", "bash": "/bin/bash", "dnf": "/usr/bin/dnf", "rpm": "/usr/bin/rpm"}
+        with (
+            patch("pyvm_updater.plugins.standard.shutil.which", side_effect=which.get),
+            patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run,
+        ):
+            mock_run.side_effect = [MagicMock(returncode=1), MagicMock(returncode=0)]
+            assert SourceInstaller()._install_dependencies() is True
+
+        assert mock_run.call_args_list[0][0][0][:2] == ["rpm", "-q"]
+        assert mock_run.call_args_list[1][0][0][:4] == ["dnf", "install", "-y", "--setopt=install_weak_deps=False"]
+
+    def test_apt_dependencies_skip_recommends(self):
+        """Test that apt installs build deps without recommended packages."""
+        which = {
+            "curl": "/usr/bin/curl",
+            "bash": "/bin/bash",
+            "apt": "/usr/bin/apt",
+            "dpkg-query": "/usr/bin/dpkg-query",
+        }
+        with (
+            patch("pyvm_updater.plugins.standard.shutil.which", side_effect=which.get),
+            patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run,
+        ):
+            mock_run.side_effect = [
+                MagicMock(returncode=1, stdout=""),
+                MagicMock(returncode=0),
+                MagicMock(returncode=0),
+            ]
+            assert SourceInstaller()._install_dependencies() is True
+
+        assert mock_run.call_args_list[1][0][0] == ["apt-get", "update"]
+        install = mock_run.call_args_list[2][0][0]
+        assert install[:3] == ["apt-get", "install", "-y"]
+        assert "--no-install-recommends" in install and "--no-install-suggests" in install
+
+    def test_source_extract_uses_parallel_xz(self, monkeypatch, published_checksum):
+        """Test that the tarball is streamed into tar with multi-threaded xz."""
+        monkeypatch.delenv("XZ_OPT", raising=False)
+        with (
+            patch.object(SourceInstaller, "_install_dependencies", return_value=True),
+            patch("pyvm_updater.plugins.standard.download_to_pipe", return_value="0" * 64) as mock_pipe,
+            patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0)
+            assert SourceInstaller().install("3.12.1") is True
+
+        url, cmd, _cwd, env = mock_pipe.call_args[0]
+        assert url.endswith("/3.12.1/Python-3.12.1.tar.xz")
+        assert cmd == ["tar", "-xJf", "-"]
+        assert env["XZ_OPT"] == "-T0"
+        assert all(c[0][0][0] != "tar" for c in mock_run.call_args_list)
+
+    def test_download_overlaps_dependency_install(self, work_root, published_checksum):
+        """Test that the tarball download runs while dependencies install."""
+        download_started = threading.Event()
+
+        def fake_download(url, cmd, cwd, env):
+            download_started.set()
+            Path(cwd, "Python-3.12.1").mkdir()
+            return "0" * 64
+
+        def fake_deps(_self):
+            # Only returns once the download has started on the other thread
+            return download_started.wait(5)
+
+        with (
+            patch.object(SourceInstaller, "_install_dependencies", fake_deps),
+            patch("pyvm_updater.plugins.standard.download_to_pipe", side_effect=fake_download),
+            patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0)
+            assert SourceInstaller().install("3.12.1") is True
+        assert not list(work_root.iterdir())
+
+    def test_failed_dependencies_discard_extracted_tree(self, work_root, published_checksum):
+        """Test that the extracted sources are removed when dependencies fail."""
+
+        def fake_download(url, cmd, cwd, env):
+            Path(cwd, "Python-3.12.1").mkdir()
+            return "0" * 64
+
+        with (
+            patch.object(SourceInstaller, "_install_dependencies", return_value=False),
+            patch("pyvm_updater.plugins.standard.download_to_pipe", side_effect=fake_download),
+            patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run,
+        ):
+            assert SourceInstaller().install("3.12.1") is False
+        assert not list(work_root.iterdir())
+        assert all(c[0][0][0] != "./configure" for c in mock_run.call_args_list)
+
+    def test_checksum_mismatch_aborts_build(self, work_root, published_checksum):
+        """Test that sources whose streamed digest does not match are discarded unbuilt."""
+
+        def fake_download(url, cmd, cwd, env):
+            Path(cwd, "Python-3.12.1").mkdir()
+            return "0" * 64
+
+        published_checksum.return_value = "f" * 64
+        with (
+            patch.object(SourceInstaller, "_install_dependencies", return_value=True),
+            patch("pyvm_updater.plugins.standard.download_to_pipe", side_effect=fake_download),
+            patch("pyvm_updater.utils.calculate_sha256") as mock_hash,
+            patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run,
+        ):
+            assert SourceInstaller().install("3.12.1") is False
+        assert not list(work_root.iterdir())
+        mock_hash.assert_not_called()
+        assert all(c[0][0][0] != "./configure" for c in mock_run.call_args_list)
+
+    def test_checksum_mismatch_leaves_nothing_behind(self, work_root, published_checksum):
+        """Test that archive members outside Python-<ver>/ are removed when verification fails."""
+        extracted_into = []
+
+        def fake_download(url, cmd, cwd, env):
+            extracted_into.append(cwd)
+            Path(cwd, "Python-3.12.1").mkdir()
+            Path(cwd, "stray.txt").write_text("outside the source tree")
+            return "0" * 64
+
+        published_checksum.return_value = "f" * 64
+        with (
+            patch.object(SourceInstaller, "_install_dependencies", return_value=True),
+            patch("pyvm_updater.plugins.standard.download_to_pipe", side_effect=fake_download),
+            patch("pyvm_updater.plugins.standard.subprocess.run"),
+        ):
+            assert SourceInstaller().install("3.12.1") is False
+        assert Path(extracted_into[0]).parent == work_root
+        assert Path(extracted_into[0]).name.startswith("pyvm-src-")
+        assert not list(work_root.iterdir())
+
+    def test_make_jobs_follow_cpu_affinity(self, monkeypatch):
+        """Test that make -j uses the CPUs the process may run on, not the host count."""
+        monkeypatch.setattr(standard.os, "sched_getaffinity", lambda pid: {0, 1, 2}, raising=False)
+        monkeypatch.setattr(standard.os, "cpu_count", lambda: 64)
+        assert standard._usable_cpus() == 3
+
+        monkeypatch.delattr(standard.os, "sched_getaffinity", raising=False)
+        assert standard._usable_cpus() == 64
+
+    def test_which_is_memoized(self):
+        """Test that each tool is looked up on PATH only once."""
+        with patch("pyvm_updater.plugins.standard.shutil.which", return_value="/usr/bin/git") as mock_which:
+            assert standard._which("git") == "/usr/bin/git"
+            assert standard._which("git") == "/usr/bin/git"
+        mock_which.assert_called_once_with("git")
+
+
+class TestAptInstaller:
+    """Tests for AptInstaller."""
+
+    @pytest.fixture(autouse=True)
+    def clear_which_cache(self):
+        """Drop PATH lookups cached by other tests."""
+        standard._which.cache_clear()
+        yield
+        standard._which.cache_clear()
+
+    def _run_install(self, version, which, lists_fresh):
+        with (
+            patch("pyvm_updater.plugins.standard.shutil.which", side_effect=which.get),
+            patch("pyvm_updater.plugins.standard._apt_lists_fresh", return_value=lists_fresh),
+            patch("pyvm_updater.plugins.standard.os.path.exists", return_value=True),
+            patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0)
+            assert AptInstaller().install(version) is True
+        return [c[0][0] for c in mock_run.call_args_list]
+
+    def test_fresh_lists_skip_initial_update(self):
+        """Test that recently refreshed apt lists skip the first apt update."""
+        cmds = self._run_install("3.11.5", {"apt": "/usr/bin/apt"}, lists_fresh=True)
+        assert cmds == [
+            ["apt-get", "install", "-y", "software-properties-common"],
+            ["add-apt-repository", "-y", "ppa:deadsnakes/ppa"],
+            ["apt-get", "install", "-y", "python3.11", "python3.11-venv", "python3.11-distutils"],
+        ]
+
+    def test_existing_add_apt_repository_skips_bootstrap(self):
+        """Test that software-properties-common is not reinstalled when present."""
+        which = {"apt": "/usr/bin/apt", "add-apt-repository": "/usr/bin/add-apt-repository"}
+        cmds = self._run_install("3.12.1", which, lists_fresh=False)
+        assert cmds == [
+            ["add-apt-repository", "-y", "ppa:deadsnakes/ppa"],
+            ["apt-get", "install", "-y", "python3.12", "python3.12-venv"],
+        ]
+
+    def test_stale_lists_are_updated_first(self):
+        """Test that old package lists are refreshed before bootstrapping."""
+        cmds = self._run_install("3.12.1", {"apt": "/usr/bin/apt"}, lists_fresh=False)
+        assert cmds[:2] == [["apt-get", "update"], ["apt-get", "install", "-y", "software-properties-common"]]
+
+    def test_failed_install_step_returns_false(self):
+        """Test that a failing apt-get install aborts without checking for the binary."""
+        which = {"apt": "/usr/bin/apt", "add-apt-repository": "/usr/bin/add-apt-repository"}
+        with (
+            patch("pyvm_updater.plugins.standard.shutil.which", side_effect=which.get),
+            patch("pyvm_updater.plugins.standard.os.path.exists", return_value=True) as mock_exists,
+            patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run,
+        ):
+            mock_run.side_effect = [MagicMock(returncode=0), MagicMock(returncode=100)]
+            assert AptInstaller().install("3.12.1") is False
+        mock_exists.assert_not_called()
+
+    def test_apt_lists_fresh_reads_mtime(self):
+        """Test the freshness check against the lists directory mtime."""
+        with patch("pyvm_updater.plugins.standard.os.stat") as mock_stat:
+            mock_stat.return_value = MagicMock(st_mtime=time.time() - 60)
+            assert standard._apt_lists_fresh() is True
+            mock_stat.return_value = MagicMock(st_mtime=time.time() - 7200)
+            assert standard._apt_lists_fresh() is False
+            mock_stat.side_effect = FileNotFoundError
+            assert standard._apt_lists_fresh() is False
+
+
+class TestCondaInstaller:
+    """Tests for CondaInstaller."""
+
+    @pytest.fixture(autouse=True)
+    def clear_lookup_caches(self):
+        """Drop PATH and conda lookups cached by other tests."""
+        standard._which.cache_clear()
+        standard._find_conda_exe.cache_clear()
+        yield
+        standard._which.cache_clear()
+        standard._find_conda_exe.cache_clear()
+
+    def test_prefers_mamba(self):
+        """Test that mamba is used when both are on PATH."""
+        which = {"conda": "/opt/conda/bin/conda", "mamba": "/opt/conda/bin/mamba"}
+        with patch("pyvm_updater.plugins.standard.shutil.which", side_effect=which.get):
+            plugin = CondaInstaller()
+            assert plugin.is_supported() is True
+            assert plugin._get_exe() == "mamba"
+
+    def test_windows_install_locations_probed_once(self, tmp_path, monkeypatch):
+        """Test that the fallback install locations are searched once per process."""
+        exe = tmp_path / "miniconda3" / "Scripts" / "conda.exe"
+        exe.parent.mkdir(parents=True)
+        exe.touch()
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+        with (
+            patch("pyvm_updater.plugins.standard.shutil.which", return_value=None),
+            patch("pyvm_updater.plugins.standard.platform.system", return_value="Windows") as mock_system,
+        ):
+            plugin = CondaInstaller()
+            assert plugin.is_supported() is True
+            assert plugin._get_exe() == str(exe)
+            assert plugin._get_exe() == str(exe)
+        assert mock_system.call_count == 1
+
+
+class TestWingetUninstall:
+    """Tests for resolving the winget package before uninstalling."""
+
+    LISTING = (
+        "Name         Id                                    Version Source\n"
+        "-----------------------------------------------------------------\n"
+        "Python 3.12  PythonSoftwareFoundation.Python.3.12  3.12.1  winget\n"
+    )
+
+    def test_uninstalls_only_the_installed_id(self):
+        """Test that one listing picks the ID and one uninstall runs."""
+        with patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run:
+            mock_run.side_effect = [MagicMock(stdout=self.LISTING), MagicMock(returncode=0)]
+            assert standard._winget_uninstall("3.12") is True
+
+        assert mock_run.call_count == 2
+        uninstall = mock_run.call_args_list[1][0][0]
+        assert uninstall[:5] == ["winget", "uninstall", "--exact", "--id", "PythonSoftwareFoundation.Python.3.12"]
+        assert "--disable-interactivity" in uninstall and "--silent" in uninstall
+
+    def test_truncated_listing_tries_each_id(self):
+        """Test that IDs shortened in the listing fall back to trying each candidate."""
+        listing = (
+            "Name         Id                               Version Source\n"
+            "------------------------------------------------------------\n"
+            "Python 3.12  PythonSoftwareFoundation.Pyth…  3.12.1  winget\n"
+        )
+        with patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run:
+            mock_run.side_effect = [MagicMock(stdout=listing), MagicMock(returncode=1), MagicMock(returncode=0)]
+            assert standard._winget_uninstall("3.12") is True
+
+        tried = [c[0][0][4] for c in mock_run.call_args_list[1:]]
+        assert tried == ["Python.Python.3.12", "PythonSoftwareFoundation.Python.3.12"]
+
+    def test_nothing_installed_returns_false(self):
+        """Test that a failed uninstall of every candidate reports failure."""
+        with patch("pyvm_updater.plugins.standard.subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                MagicMock(stdout="No installed package found matching input criteria."),
+                MagicMock(returncode=1),
+                MagicMock(returncode=1),
+            ]
+            assert standard._winget_uninstall("3.12") is False
+        assert mock_run.call_count == 3
+
+
+class TestUninstallProbe:
+    """Tests for the cheap manages() probe used before uninstalling."""
+
+    def test_pyenv_manages_checks_versions_dir(self, tmp_path, monkeypatch):
+        """Test that pyenv ownership is read from $PYENV_ROOT/versions."""
+        monkeypatch.setenv("PYENV_ROOT", str(tmp_path))
+        (tmp_path / "versions" / "3.12.1").mkdir(parents=True)
+        plugin = PyenvInstaller()
+        assert plugin.manages("3.12.1") is True
+        assert plugin.manages("3.11.5") is False
+        assert plugin.manages("3.12") is None
+
+    def test_uninstall_skips_plugins_that_do_not_own_version(self):
+        """Test that plugins reporting False are never asked to uninstall."""
+        from pyvm_updater.installers import _uninstall_with_plugins
+
+        not_owner = MagicMock(spec=InstallerPlugin)
+        not_owner.manages.return_value = False
+        unknown = MagicMock(spec=InstallerPlugin)
+        unknown.manages.return_value = None
+        unknown.uninstall.return_value = True
+        unknown.get_name.return_value = "unknown"
+
+        pm = MagicMock()
+        pm.get_supported_plugins.return_value = [not_owner, unknown]
+        with patch("pyvm_updater.installers.get_plugin_manager", return_value=pm):
+            assert _uninstall_with_plugins("3.12.1") is True
 
-            # Clean up (remove from registered plugins)
-            if "custom-test" in pm._plugins:
-                del pm._plugins["custom-test"]
+        not_owner.uninstall.assert_not_called()
+        unknown.uninstall.assert_called_once_with("3.12.1")
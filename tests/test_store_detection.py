@@ -1,31 +1,38 @@
 """Tests for Microsoft Store Python detection logic."""
 
+import types
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from pyvm_updater.version import get_installed_python_versions
 
 
+@pytest.fixture
+def py_list(monkeypatch, tmp_path):
+    """Pretend to run on Windows, with WindowsApps at tmp_path / "WindowsApps" (not created).
+
+    Returns a function that sets the `py --list` output and return code and
+    gives back the subprocess.run mock.
+    """
+    monkeypatch.setattr("pyvm_updater.version.get_os_info", lambda: ("windows", "10"))
+    monkeypatch.setattr("os.path.expandvars", lambda path: str(tmp_path / "WindowsApps"))
+    run = MagicMock()
+    monkeypatch.setattr("subprocess.run", run)
+
+    def set_output(stdout: str = "", returncode: int = 0) -> MagicMock:
+        run.return_value = MagicMock(returncode=returncode, stdout=stdout)
+        return run
+
+    return set_output
+
+
 class TestStoreDetection:
     """Tests for Microsoft Store Python detection in version.py."""
 
-    @patch("pyvm_updater.version.get_os_info")
-    @patch("subprocess.run")
-    @patch("os.path.isdir")
-    @patch("os.listdir")
-    @patch("os.path.expandvars")
-    def test_detect_via_py_list(self, mock_expandvars, mock_listdir, mock_isdir, mock_run, mock_get_os):
+    def test_detect_via_py_list(self, py_list):
         """Test detection via 'py --list' output."""
-        mock_get_os.return_value = ("windows", "10")
-
-        # Mock py --list output
-        mock_run_result = MagicMock()
-        mock_run_result.returncode = 0
-        mock_run_result.stdout = " -3.12-64 (Store) *\n -3.11-64\n"
-        mock_run.return_value = mock_run_result
-
-        # Mock other Windows checks to return nothing
-        mock_expandvars.return_value = "C:\\Apps"
-        mock_isdir.return_value = False
+        py_list(" -3.12-64 (Store) *\n -3.11-64\n")
 
         versions = get_installed_python_versions()
 
@@ -35,29 +42,13 @@ class TestStoreDetection:
         assert store_v12["store"] is True
         assert store_v12["default"] is True
 
-    @patch("pyvm_updater.version.get_os_info")
-    @patch("subprocess.run")
-    @patch("os.path.isdir")
-    @patch("os.listdir")
-    @patch("os.path.expandvars")
-    @patch("os.path.join")
-    def test_detect_via_windowsapps_path(
-        self, mock_join, mock_expandvars, mock_listdir, mock_isdir, mock_run, mock_get_os
-    ):
+    def test_detect_via_windowsapps_path(self, py_list, tmp_path):
         """Test detection via %LOCALAPPDATA%\\Microsoft\\WindowsApps path."""
-        mock_get_os.return_value = ("windows", "10")
-
-        # Mock py --list to fail or return nothing
-        mock_run_result = MagicMock()
-        mock_run_result.returncode = 1
-        mock_run.return_value = mock_run_result
-
-        # Mock WindowsApps directory
-        apps_dir = "C:\\Users\\User\\AppData\\Local\\Microsoft\\WindowsApps"
-        mock_expandvars.return_value = apps_dir
-        mock_isdir.return_value = True
-        mock_listdir.return_value = ["python3.11.exe", "python3.12.exe", "something_else.exe"]
-        mock_join.side_effect = lambda *args: "\\".join(args)
+        py_list(returncode=1)
+        apps_dir = tmp_path / "WindowsApps"
+        apps_dir.mkdir()
+        for name in ("python3.11.exe", "python3.12.exe", "something_else.exe"):
+            (apps_dir / name).touch()
 
         versions = get_installed_python_versions()
 
@@ -67,37 +58,52 @@ class TestStoreDetection:
 
         assert v11 is not None
         assert v11["store"] is True
-        assert v11["path"] == f"{apps_dir}\\python3.11.exe"
+        assert v11["path"] == str(apps_dir / "python3.11.exe")
 
         assert v12 is not None
         assert v12["store"] is True
-        assert v12["path"] == f"{apps_dir}\\python3.12.exe"
-
-    @patch("pyvm_updater.version.get_os_info")
-    @patch("subprocess.run")
-    @patch("os.path.isdir")
-    @patch("os.listdir")
-    @patch("os.path.expandvars")
-    def test_merge_py_list_and_path_info(self, mock_expandvars, mock_listdir, mock_isdir, mock_run, mock_get_os):
-        """Test that info from py --list and path scanning are merged correctly."""
-        mock_get_os.return_value = ("windows", "10")
-
-        # py --list finds 3.12 but doesn't know path
-        mock_run_result = MagicMock()
-        mock_run_result.returncode = 0
-        mock_run_result.stdout = " -3.12-64 (Store)\n"
-        mock_run.return_value = mock_run_result
+        assert v12["path"] == str(apps_dir / "python3.12.exe")
 
-        # Path scanning finds 3.12 path
-        apps_dir = "C:\\StoreApps"
-        mock_expandvars.return_value = apps_dir
-        mock_isdir.return_value = True
-        mock_listdir.return_value = ["python3.12.exe"]
+    def test_merge_py_list_and_path_info(self, py_list, tmp_path):
+        """Test that info from py --list and path scanning are merged correctly."""
+        # py --list finds 3.12 but doesn't know path; path scanning finds it
+        py_list(" -3.12-64 (Store)\n")
+        apps_dir = tmp_path / "WindowsApps"
+        apps_dir.mkdir()
+        (apps_dir / "python3.12.exe").touch()
 
         versions = get_installed_python_versions()
 
         v12 = next((v for v in versions if v["version"] == "3.12"), None)
         assert v12 is not None
         assert v12["store"] is True
-        assert v12["path"] is not None
-        assert "StoreApps" in v12["path"]
+        assert v12["path"] == str(apps_dir / "python3.12.exe")
+
+    def test_registry_entries_skip_py_list(self, py_list, tmp_path):
+        """Test that PEP 514 registrations are used without spawning 'py --list'."""
+        mock_run = py_list()
+        exe = tmp_path / "python.exe"
+        exe.touch()
+        tags = ["3.12", "3.11-32", "not-a-version"]
+
+        def enum_key(key, index):
+            if index >= len(tags):
+                raise OSError("no more items")
+            return tags[index]
+
+        fake_winreg = types.SimpleNamespace(
+            HKEY_CURRENT_USER=1,
+            HKEY_LOCAL_MACHINE=2,
+            KEY_READ=0x20019,
+            KEY_WOW64_64KEY=0x100,
+            KEY_WOW64_32KEY=0x200,
+            OpenKey=MagicMock(),
+            EnumKey=enum_key,
+            QueryValueEx=lambda key, name: (str(exe), 1),
+        )
+        with patch.dict("sys.modules", {"winreg": fake_winreg}):
+            versions = get_installed_python_versions()
+
+        mock_run.assert_not_called()
+        registered = {v["version"]: v["path"] for v in versions if v.get("store") is False}
+        assert registered == {"3.12": str(exe), "3.11": str(exe)}
@@ -1,48 +1,82 @@
 """Tests for pyvm_updater.utils module."""
 
-from pyvm_updater.utils import get_os_info, validate_version_string
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pyvm_updater.utils import (
+    calculate_sha256,
+    download_and_hash,
+    download_file,
+    download_to_pipe,
+    fetch_remote_sha256,
+    get_os_info,
+    major_minor,
+    parse_version,
+    retry_delay,
+    validate_version_string,
+    verify_file_checksum,
+)
 
 
 class TestValidateVersionString:
     """Tests for validate_version_string function."""
 
-    def test_valid_major_minor_patch(self):
-        """Test valid X.Y.Z format."""
-        assert validate_version_string("3.11.5") is True
-        assert validate_version_string("3.12.1") is True
-        assert validate_version_string("2.7.18") is True
+    @pytest.mark.parametrize("version", ["3.11.5", "3.12.1", "2.7.18", "3.11", "3.9", "3.11.5.1"])
+    def test_valid(self, version):
+        """Test that X.Y, X.Y.Z and longer dotted versions are accepted."""
+        assert validate_version_string(version) is True
+
+    @pytest.mark.parametrize(
+        "version",
+        ["", "3", "latest", "stable", "3.11.5a", "3.11rc1", "3.11-5", "3.11_5", "3.11.5\n"],
+    )
+    def test_invalid(self, version):
+        """Test that empty, bare, lettered, punctuated and newline-terminated strings are rejected."""
+        assert validate_version_string(version) is False
+
+
+class TestParseVersion:
+    """Tests for parse_version function."""
 
-    def test_valid_major_minor(self):
-        """Test valid X.Y format."""
-        assert validate_version_string("3.11") is True
-        assert validate_version_string("3.9") is True
+    def test_full_and_partial_versions(self):
+        """Test X.Y.Z and X.Y splitting."""
+        assert parse_version("3.12.1") == ("3", "12", "1")
+        assert parse_version("3.12") == ("3", "12", None)
 
-    def test_valid_extended_version(self):
-        """Test valid X.Y.Z.A format."""
-        assert validate_version_string("3.11.5.1") is True
+    def test_invalid_versions(self):
+        """Test that strings without a leading X.Y are rejected."""
+        assert parse_version("3") is None
+        assert parse_version("latest") is None
 
-    def test_invalid_empty_string(self):
-        """Test empty string returns False."""
-        assert validate_version_string("") is False
 
-    def test_invalid_single_number(self):
-        """Test single number is invalid."""
-        assert validate_version_string("3") is False
+class TestMajorMinor:
+    """Tests for major_minor function."""
 
-    def test_invalid_text(self):
-        """Test text strings are invalid."""
-        assert validate_version_string("latest") is False
-        assert validate_version_string("stable") is False
+    def test_strips_patch_and_suffix(self):
+        """Test that everything after the second dot is dropped."""
+        assert major_minor("3.12.1") == "3.12"
+        assert major_minor("3.13.0.rc1") == "3.13"
 
-    def test_invalid_with_letters(self):
-        """Test versions with letters are invalid."""
-        assert validate_version_string("3.11.5a") is False
-        assert validate_version_string("3.11rc1") is False
+    def test_short_versions_unchanged(self):
+        """Test that strings with fewer than two dots are returned as-is."""
+        assert major_minor("3.12") == "3.12"
+        assert major_minor("3") == "3"
 
-    def test_invalid_with_special_chars(self):
-        """Test versions with special characters are invalid."""
-        assert validate_version_string("3.11-5") is False
-        assert validate_version_string("3.11_5") is False
+
+class TestRetryDelay:
+    """Tests for retry_delay function."""
+
+    def test_doubles_with_jitter(self):
+        """Test that delays double per attempt within +/-20%."""
+        with patch("pyvm_updater.utils.random.uniform", side_effect=lambda lo, hi: hi):
+            assert [retry_delay(a) for a in range(3)] == pytest.approx([2.4, 4.8, 9.6])
+        assert 1.6 <= retry_delay(0) <= 2.4
+
+    def test_capped(self):
+        """Test that late attempts never wait longer than MAX_RETRY_DELAY plus jitter."""
+        assert retry_delay(20) <= 30 * 1.2
 
 
 class TestGetOsInfo:
@@ -63,3 +97,187 @@ class TestGetOsInfo:
         """Test that architecture is normalized to amd64, arm64, or x86."""
         _, arch = get_os_info()
         assert arch in ["amd64", "arm64", "x86"]
+
+
+class TestCalculateSha256:
+    """Tests for calculate_sha256 function."""
+
+    def test_matches_hashlib(self, tmp_path):
+        """Test digest of a file read in one go."""
+        data = b"pyvm" * 100_000
+        path = tmp_path / "installer.bin"
+        path.write_bytes(data)
+        assert calculate_sha256(str(path)) == hashlib.sha256(data).hexdigest()
+
+    def test_uses_file_digest_when_available(self, tmp_path):
+        """Test that hashlib.file_digest is used on Pythons that have it."""
+        path = tmp_path / "installer.bin"
+        path.write_bytes(b"pyvm")
+        digest = MagicMock()
+        digest.return_value.hexdigest.return_value = "abc"
+        with patch("pyvm_updater.utils._file_digest", digest):
+            assert calculate_sha256(str(path)) == "abc"
+        assert digest.call_args[0][1] == "sha256"
+
+    def test_fallback_without_file_digest(self, tmp_path):
+        """Test the single-read path used before Python 3.11."""
+        data = b"pyvm" * 100_000
+        path = tmp_path / "installer.bin"
+        path.write_bytes(data)
+        with patch("pyvm_updater.utils._file_digest", None):
+            assert calculate_sha256(str(path)) == hashlib.sha256(data).hexdigest()
+
+    def test_large_file_read_in_blocks(self, tmp_path):
+        """Test digest of a file above the single-read limit."""
+        data = bytes(range(256)) * 1000
+        path = tmp_path / "installer.bin"
+        path.write_bytes(data)
+        with (
+            patch("pyvm_updater.utils._file_digest", None),
+            patch("pyvm_updater.utils._HASH_WHOLE_FILE_LIMIT", 1024),
+            patch("pyvm_updater.utils._HASH_BLOCK_SIZE", 4096),
+        ):
+            assert calculate_sha256(str(path)) == hashlib.sha256(data).hexdigest()
+
+
+class TestVerifyFileChecksum:
+    """Tests for verify_file_checksum function."""
+
+    def test_prefetched_checksum_skips_fetch(self, tmp_path):
+        """Test that a checksum passed in is used instead of fetching it again."""
+        path = tmp_path / "installer.exe"
+        path.write_bytes(b"installer")
+        expected = hashlib.sha256(b"installer").hexdigest()
+        with patch("pyvm_updater.utils.fetch_remote_sha256") as mock_fetch:
+            assert verify_file_checksum(str(path), "https://example.invalid/x.sha256", expected=expected) is True
+            assert verify_file_checksum(str(path), "https://example.invalid/x.sha256", expected="0" * 64) is False
+            mock_fetch.assert_not_called()
+
+
+class TestFetchRemoteSha256:
+    """Tests for fetch_remote_sha256 function."""
+
+    def _fetch(self, body):
+        session = MagicMock()
+        session.get.return_value = MagicMock(content=body)
+        with patch("pyvm_updater._http.get_session", return_value=session):
+            return fetch_remote_sha256("https://example.invalid/src.tar.xz.sha256")
+
+    def test_returns_leading_digest(self):
+        """Test that the digest is taken from the first token."""
+        digest = "A" * 64
+        assert self._fetch(f"{digest}  Python-3.12.1.tar.xz\n".encode()) == digest
+        assert self._fetch(f"{digest}\n".encode()) == digest
+
+    def test_rejects_non_digest(self):
+        """Test that an HTML error page or empty body yields None."""
+        assert self._fetch(b"<html>Not Found</html>") is None
+        assert self._fetch(b"") is None
+
+
+class TestDownloadAndHash:
+    """Tests for download_and_hash function."""
+
+    @staticmethod
+    def _response(chunks):
+        response = MagicMock(status_code=200, headers={"content-length": str(sum(map(len, chunks)))})
+        response.raw.read.side_effect = [*chunks, b""]
+        return response
+
+    def test_returns_digest_of_written_bytes(self, tmp_path):
+        """Test that the digest matches the file written to disk."""
+        chunks = [b"a" * 5000, b"b" * 5000, b"c"]
+        dest = tmp_path / "installer.exe"
+        session = MagicMock()
+        session.get.return_value = self._response(chunks)
+        with patch("pyvm_updater._http.get_session", return_value=session):
+            digest = download_and_hash("https://example.invalid/installer.exe", str(dest))
+        assert dest.read_bytes() == b"".join(chunks)
+        assert digest == hashlib.sha256(b"".join(chunks)).hexdigest()
+        assert session.get.call_args[1]["headers"] == {"Accept-Encoding": "identity"}
+
+    def test_plain_download_without_terminal_copies_stream(self, tmp_path):
+        """Test that an unhashed, non-interactive download bypasses the progress loop."""
+        import io
+
+        payload = b"x" * 3000
+        response = MagicMock(status_code=200, headers={"content-length": str(len(payload))})
+        response.raw = io.BytesIO(payload)
+        session = MagicMock()
+        session.get.return_value = response
+        dest = tmp_path / "installer.exe"
+        with (
+            patch("pyvm_updater._http.get_session", return_value=session),
+            patch("pyvm_updater.utils.sys.stdout") as stdout,
+            patch("pyvm_updater.utils._progress") as mock_progress,
+        ):
+            stdout.isatty.return_value = False
+            assert download_file("https://example.invalid/installer.exe", str(dest)) is True
+        assert dest.read_bytes() == payload
+        mock_progress.assert_not_called()
+
+    def test_dropped_connection_is_retried(self, tmp_path):
+        """Test that a urllib3 error raised mid-stream triggers a retry."""
+        import urllib3
+
+        chunks = [b"a" * 10]
+        broken = self._response(chunks)
+        broken.raw.read.side_effect = urllib3.exceptions.ProtocolError("connection reset")
+        session = MagicMock()
+        session.get.side_effect = [broken, self._response(chunks)]
+        with (
+            patch("pyvm_updater._http.get_session", return_value=session),
+            patch("pyvm_updater.utils.time.sleep"),
+        ):
+            digest = download_and_hash("https://example.invalid/installer.exe", str(tmp_path / "x"))
+        assert digest == hashlib.sha256(b"a" * 10).hexdigest()
+        assert session.get.call_count == 2
+
+    def test_client_error_returns_none(self, tmp_path):
+        """Test that a 4xx response fails without retrying."""
+        session = MagicMock()
+        session.get.return_value = MagicMock(status_code=404)
+        with patch("pyvm_updater._http.get_session", return_value=session):
+            assert download_and_hash("https://example.invalid/missing", str(tmp_path / "x")) is None
+            assert download_file("https://example.invalid/missing", str(tmp_path / "x")) is False
+        assert session.get.call_count == 2
+
+
+class TestDownloadToPipe:
+    """Tests for download_to_pipe function."""
+
+    def test_streams_into_command(self, tmp_path):
+        """Test that the payload reaches the command's stdin and is hashed."""
+        chunks = [b"a" * 5000, b"b"]
+        session = MagicMock()
+        session.get.return_value = TestDownloadAndHash._response(chunks)
+        with patch("pyvm_updater._http.get_session", return_value=session):
+            digest = download_to_pipe("https://example.invalid/src.tar.xz", ["sh", "-c", "cat > out"], str(tmp_path))
+        assert (tmp_path / "out").read_bytes() == b"".join(chunks)
+        assert digest == hashlib.sha256(b"".join(chunks)).hexdigest()
+
+    def test_failing_command_returns_none(self, tmp_path):
+        """Test that a nonzero exit of the command fails the download."""
+        session = MagicMock()
+        session.get.return_value = TestDownloadAndHash._response([b"x"])
+        with patch("pyvm_updater._http.get_session", return_value=session):
+            assert (
+                download_to_pipe(
+                    "https://example.invalid/src.tar.xz", ["sh", "-c", "cat >/dev/null; exit 2"], str(tmp_path)
+                )
+                is None
+            )
+
+
+class TestProgress:
+    """Tests for the download progress bar."""
+
+    def test_disabled_without_terminal(self):
+        """Test that the bar is not drawn when stdout is not a TTY."""
+        from pyvm_updater import utils
+
+        with patch("pyvm_updater.utils.sys.stdout") as stdout:
+            stdout.isatty.return_value = False
+            assert utils._progress().disable is True
+            stdout.isatty.return_value = True
+            assert utils._progress().disable is False
@@ -0,0 +1,30 @@
+"""Property-based tests for pyvm_updater.utils (needs hypothesis from the dev extra)."""
+
+import pytest
+
+pytest.importorskip("hypothesis")
+
+from hypothesis import given  # noqa: E402
+from hypothesis import strategies as st  # noqa: E402
+
+from pyvm_updater.utils import validate_version_string  # noqa: E402
+
+
+def _is_dotted_version(text: str) -> bool:
+    """Reference check: two or more dot-separated runs of decimal digits."""
+    parts = text.split(".")
+    return len(parts) >= 2 and all(part.isdecimal() for part in parts)
+
+
+class TestValidateVersionStringFuzz:
+    """Generated inputs for validate_version_string."""
+
+    @given(st.from_regex(r"\A\d+(\.\d+)+\Z", fullmatch=True))
+    def test_accepts_generated(self, version):
+        """Test that any dotted run of digits is accepted."""
+        assert validate_version_string(version) is True
+
+    @given(st.text().filter(lambda text: not _is_dotted_version(text)))
+    def test_rejects_generated(self, text):
+        """Test that anything else is rejected."""
+        assert validate_version_string(text) is False
@@ -1,13 +1,17 @@
 """Tests for pyvm_updater.venv module."""
 
-import tempfile
+import shutil
+import sys
+import types
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from pyvm_updater import venv
 from pyvm_updater.venv import (
     create_venv,
+    find_python_executable,
     get_venv_activate_command,
     list_venvs,
     remove_venv,
@@ -17,27 +21,27 @@ from pyvm_updater.venv import (
 class TestCreateVenv:
     """Tests for create_venv function."""
 
-    @pytest.fixture
-    def temp_venv_dir(self):
-        """Create a temporary directory for venvs."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
-    def test_create_venv_success(self, temp_venv_dir):
+    def test_create_venv_success(self, tmp_path, monkeypatch):
         """Test successful venv creation."""
-        venv_path = temp_venv_dir / "test_venv"
+        venv_path = tmp_path / "test_venv"
+
+        def fake_venv(cmd, **kwargs):
+            Path(cmd[-1], "bin").mkdir(parents=True)
 
-        with patch("pyvm_updater.venv.get_venv_dir", return_value=temp_venv_dir):
-            with patch("pyvm_updater.venv.save_venv_registry"):
-                success, message = create_venv("test_venv", path=venv_path)
+        mock_run = MagicMock(side_effect=fake_venv)
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_dir", lambda: tmp_path)
+        monkeypatch.setattr("pyvm_updater.venv.save_venv_registry", lambda registry: None)
+        monkeypatch.setattr("pyvm_updater.venv.subprocess.run", mock_run)
+        success, message = create_venv("test_venv", path=venv_path)
 
         assert success is True
         assert "Created" in message
         assert venv_path.exists()
+        assert mock_run.call_args[0][0] == [sys.executable, "-m", "venv", str(venv_path)]
 
-    def test_create_venv_already_exists(self, temp_venv_dir):
+    def test_create_venv_already_exists(self, tmp_path):
         """Test creating venv that already exists."""
-        venv_path = temp_venv_dir / "existing_venv"
+        venv_path = tmp_path / "existing_venv"
         venv_path.mkdir()
 
         success, message = create_venv("existing_venv", path=venv_path)
@@ -45,16 +49,17 @@ class TestCreateVenv:
         assert success is False
         assert "already exists" in message
 
-    def test_create_venv_with_requirements(self, temp_venv_dir):
+    def test_create_venv_with_requirements(self, tmp_path, monkeypatch):
         """Test venv creation with requirements file."""
-        venv_path = temp_venv_dir / "req_venv"
-        req_file = temp_venv_dir / "requirements.txt"
+        venv_path = tmp_path / "req_venv"
+        req_file = tmp_path / "requirements.txt"
         req_file.write_text("requests==2.25.0")
 
-        with patch("pyvm_updater.venv.get_venv_dir", return_value=temp_venv_dir):
-            with patch("pyvm_updater.venv.save_venv_registry"):
-                with patch("pyvm_updater.venv.subprocess.run") as mock_run:
-                    success, message = create_venv("req_venv", path=venv_path, requirements_file=req_file)
+        mock_run = MagicMock()
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_dir", lambda: tmp_path)
+        monkeypatch.setattr("pyvm_updater.venv.save_venv_registry", lambda registry: None)
+        monkeypatch.setattr("pyvm_updater.venv.subprocess.run", mock_run)
+        success, message = create_venv("req_venv", path=venv_path, requirements_file=req_file)
 
         assert success is True
         assert "Installed requirements" in message
@@ -72,88 +77,264 @@ class TestCreateVenv:
 class TestListVenvs:
     """Tests for list_venvs function."""
 
-    def test_list_venvs_empty(self):
+    def test_list_venvs_empty(self, monkeypatch):
         """Test list_venvs when no venvs exist."""
-        with patch("pyvm_updater.venv.get_venv_registry", return_value={}):
-            with patch("pyvm_updater.venv.get_venv_dir") as mock_dir:
-                mock_dir.return_value = Path("/nonexistent")
-                result = list_venvs()
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_registry", lambda: {})
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_dir", lambda: Path("/nonexistent"))
+        result = list_venvs()
 
         assert isinstance(result, list)
 
-    def test_list_venvs_returns_list(self):
+    def test_list_venvs_returns_list(self, monkeypatch):
         """Test list_venvs returns a list."""
-        with patch("pyvm_updater.venv.get_venv_registry", return_value={}):
-            with patch("pyvm_updater.venv.get_venv_dir") as mock_dir:
-                mock_dir.return_value = Path("/nonexistent")
-                result = list_venvs()
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_registry", lambda: {})
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_dir", lambda: Path("/nonexistent"))
+        result = list_venvs()
 
         assert isinstance(result, list)
 
+    def test_list_venvs_finds_unregistered(self, tmp_path, monkeypatch):
+        """Test that venv directories in the default location are listed without registration."""
+        (tmp_path / "unix_env" / "bin").mkdir(parents=True)
+        (tmp_path / "unix_env" / "bin" / "activate").touch()
+        (tmp_path / "win_env" / "Scripts").mkdir(parents=True)
+        (tmp_path / "win_env" / "Scripts" / "activate.bat").touch()
+        (tmp_path / "not_a_venv").mkdir()
+        (tmp_path / "stray_file").touch()
+
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_registry", lambda: {})
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_dir", lambda: tmp_path)
+        result = list_venvs()
+
+        assert [v["name"] for v in result] == ["unix_env", "win_env"]
+        assert result[0]["path"] == str(tmp_path / "unix_env")
+
+    def test_list_venvs_registered_existence_from_scan(self, tmp_path, monkeypatch):
+        """Test that registered venvs in the default directory are not stat'ed individually."""
+        (tmp_path / "env").mkdir()
+        registry = {
+            "env": {"path": str(tmp_path / "env"), "python_version": "3.12"},
+            "gone": {"path": str(tmp_path / "elsewhere" / "gone"), "python_version": "3.11"},
+        }
+
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_registry", lambda: registry)
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_dir", lambda: tmp_path)
+        with patch.object(Path, "exists", autospec=True, side_effect=lambda p: False) as mock_exists:
+            result = list_venvs()
+
+        assert [(v["name"], v["exists"]) for v in result] == [("env", True), ("gone", False)]
+        mock_exists.assert_called_once()
+
+
+class TestVenvRegistry:
+    """Tests for reading and writing the venv registry."""
+
+    def test_save_replaces_registry_atomically(self, tmp_path):
+        """Test that the registry round-trips and no temporary file is left behind."""
+        registry_file = tmp_path / "venvs.json"
+        registry_file.write_text('{"old": {}}')
+        with patch("pyvm_updater.venv.VENV_REGISTRY", registry_file):
+            venv.save_venv_registry({"env": {"path": "/tmp/env", "python_version": "3.12"}})
+            assert venv.get_venv_registry() == {"env": {"path": "/tmp/env", "python_version": "3.12"}}
+        assert [p.name for p in tmp_path.iterdir()] == ["venvs.json"]
+
+    def test_unchanged_registry_is_not_reparsed(self, tmp_path):
+        """Test that repeated reads reuse the parsed registry until the file changes."""
+        registry_file = tmp_path / "venvs.json"
+        registry_file.write_text('{"a": {"path": "/a"}}')
+        with (
+            patch("pyvm_updater.venv.VENV_REGISTRY", registry_file),
+            patch("pyvm_updater.venv.loads", wraps=venv.loads) as mock_loads,
+        ):
+            first = venv.get_venv_registry()
+            first["a"]["path"] = "mutated"
+            assert venv.get_venv_registry() == {"a": {"path": "/a"}}
+            assert mock_loads.call_count == 1
+
+            registry_file.write_text('{"bb": {"path": "/bb"}}')
+            assert venv.get_venv_registry() == {"bb": {"path": "/bb"}}
+            assert mock_loads.call_count == 2
+
+            venv.save_venv_registry({"c": {}})
+            assert venv.get_venv_registry() == {"c": {}}
+            assert mock_loads.call_count == 2
+
+    def test_failed_write_keeps_previous_registry(self, tmp_path):
+        """Test that an error while writing leaves the existing registry intact."""
+        registry_file = tmp_path / "venvs.json"
+        registry_file.write_text('{"old": {}}')
+        with (
+            patch("pyvm_updater.venv.VENV_REGISTRY", registry_file),
+            patch("pyvm_updater.venv.os.replace", side_effect=OSError("disk full")),
+        ):
+            venv.save_venv_registry({"new": {}})
+            assert venv.get_venv_registry() == {"old": {}}
+
 
 class TestRemoveVenv:
     """Tests for remove_venv function."""
 
-    @pytest.fixture
-    def temp_venv_dir(self):
-        """Create a temporary directory for venvs."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
-    def test_remove_nonexistent_venv(self, temp_venv_dir):
+    def test_remove_nonexistent_venv(self, tmp_path, monkeypatch):
         """Test removing venv that doesn't exist."""
-        with patch("pyvm_updater.venv.get_venv_registry", return_value={}):
-            with patch("pyvm_updater.venv.get_venv_dir", return_value=temp_venv_dir):
-                success, message = remove_venv("nonexistent")
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_registry", lambda: {})
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_dir", lambda: tmp_path)
+        success, message = remove_venv("nonexistent")
 
         assert success is False
         assert "not found" in message
 
-    def test_remove_existing_venv(self, temp_venv_dir):
+    def test_remove_existing_venv(self, tmp_path, monkeypatch):
         """Test removing existing venv."""
-        venv_path = temp_venv_dir / "to_remove"
+        venv_path = tmp_path / "to_remove"
         venv_path.mkdir()
 
         registry = {"to_remove": {"path": str(venv_path)}}
 
-        with patch("pyvm_updater.venv.get_venv_registry", return_value=registry):
-            with patch("pyvm_updater.venv.save_venv_registry"):
-                success, message = remove_venv("to_remove")
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_registry", lambda: registry)
+        monkeypatch.setattr("pyvm_updater.venv.save_venv_registry", lambda registry: None)
+        success, message = remove_venv("to_remove")
 
         assert success is True
         assert "Removed" in message
         assert not venv_path.exists()
 
+    def test_remove_tree_uses_rm_when_available(self, tmp_path, monkeypatch):
+        """Test that the tree is deleted by a single rm -rf process."""
+        tree = tmp_path / "env"
+        (tree / "lib").mkdir(parents=True)
+        (tree / "lib" / "module.py").touch()
+        mock_run = MagicMock(side_effect=lambda cmd, **kwargs: shutil.rmtree(cmd[-1]))
+        monkeypatch.setattr("pyvm_updater.venv.os.name", "posix")
+        monkeypatch.setattr("pyvm_updater.venv.shutil.which", lambda name: "/bin/rm")
+        monkeypatch.setattr("pyvm_updater.venv.subprocess.run", mock_run)
+        venv._remove_tree(tree)
+        assert not tree.exists()
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["/bin/rm", "-rf", "--", str(tree)]
+
+    def test_remove_tree_falls_back_to_rmtree(self, tmp_path):
+        """Test that shutil.rmtree finishes the job when rm leaves the tree behind."""
+        tree = tmp_path / "env"
+        tree.mkdir()
+        with (
+            patch("pyvm_updater.venv.shutil.which", return_value="/bin/rm"),
+            patch("pyvm_updater.venv.subprocess.run") as mock_run,
+        ):
+            venv._remove_tree(tree)
+        assert not tree.exists()
+        assert mock_run.call_count == (0 if venv.os.name == "nt" else 1)
+
 
 class TestGetVenvActivateCommand:
     """Tests for get_venv_activate_command function."""
 
-    @pytest.fixture
-    def temp_venv_dir(self):
-        """Create a temporary directory for venvs."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
-    def test_activate_nonexistent_venv(self, temp_venv_dir):
+    def test_activate_nonexistent_venv(self, tmp_path, monkeypatch):
         """Test getting activate command for nonexistent venv."""
-        with patch("pyvm_updater.venv.get_venv_registry", return_value={}):
-            with patch("pyvm_updater.venv.get_venv_dir", return_value=temp_venv_dir):
-                result = get_venv_activate_command("nonexistent")
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_registry", lambda: {})
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_dir", lambda: tmp_path)
+        result = get_venv_activate_command("nonexistent")
 
         assert result is None
 
-    def test_activate_existing_venv(self, temp_venv_dir):
+    def test_activate_existing_venv(self, tmp_path, monkeypatch):
         """Test getting activate command for existing venv."""
-        venv_path = temp_venv_dir / "test_venv"
+        venv_path = tmp_path / "test_venv"
         bin_dir = venv_path / "bin"
         bin_dir.mkdir(parents=True)
         (bin_dir / "activate").touch()
 
         registry = {"test_venv": {"path": str(venv_path)}}
 
-        with patch("pyvm_updater.venv.get_venv_registry", return_value=registry):
-            with patch("pyvm_updater.venv.get_os_info", return_value=("linux", "amd64")):
-                result = get_venv_activate_command("test_venv")
+        monkeypatch.setattr("pyvm_updater.venv.get_venv_registry", lambda: registry)
+        monkeypatch.setattr("pyvm_updater.venv.get_os_info", lambda: ("linux", "amd64"))
+        result = get_venv_activate_command("test_venv")
 
         assert result is not None
         assert "activate" in result
+
+
+class TestFindPythonExecutable:
+    """Tests for find_python_executable function."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start each test with an empty lookup cache."""
+        venv._PY_EXE_CACHE.clear()
+        yield
+        venv._PY_EXE_CACHE.clear()
+
+    def test_result_cached_for_process(self, tmp_path):
+        """Test that a found interpreter is not searched for again."""
+        exe = tmp_path / "python3.12"
+        exe.touch()
+        with patch("pyvm_updater.venv._find_python_executable", return_value=str(exe)) as mock_find:
+            assert find_python_executable("3.12") == str(exe)
+            assert find_python_executable("3.12") == str(exe)
+        assert mock_find.call_count == 1
+
+    def test_misses_and_vanished_paths_are_retried(self, tmp_path):
+        """Test that not-found results and deleted interpreters trigger a new search."""
+        exe = tmp_path / "python3.12"
+        with patch("pyvm_updater.venv._find_python_executable", side_effect=[None, str(exe), None]) as mock_find:
+            assert find_python_executable("3.12") is None
+            exe.touch()
+            assert find_python_executable("3.12") == str(exe)
+            exe.unlink()
+            assert find_python_executable("3.12") is None
+        assert mock_find.call_count == 3
+
+    def test_windows_registry_avoids_py_launcher(self, tmp_path):
+        """Test that a PEP 514 registry entry is used instead of spawning py."""
+        exe = tmp_path / "python.exe"
+        exe.touch()
+        values = {"ExecutablePath": str(exe)}
+        fake_winreg = types.SimpleNamespace(
+            HKEY_CURRENT_USER=1,
+            HKEY_LOCAL_MACHINE=2,
+            KEY_READ=0x20019,
+            KEY_WOW64_64KEY=0x100,
+            KEY_WOW64_32KEY=0x200,
+            OpenKey=MagicMock(),
+            EnumKey=MagicMock(side_effect=["3.11", "3.12", OSError("no more items")] * 3),
+            QueryValueEx=lambda key, name: (values[name], 1),
+        )
+        with (
+            patch.dict("sys.modules", {"winreg": fake_winreg}),
+            patch("pyvm_updater.venv.get_os_info", return_value=("windows", "amd64")),
+            patch("pyvm_updater.venv.get_installed_python_versions", return_value=[]),
+            patch("pyvm_updater.venv.subprocess.run") as mock_run,
+        ):
+            assert find_python_executable("3.12") == str(exe)
+        mock_run.assert_not_called()
+        assert fake_winreg.OpenKey.call_args_list[0][0][1] == r"Software\Python\PythonCore"
+
+    def test_pyenv_install_skips_full_scan(self, tmp_path):
+        """Test that an exact pyenv install is returned without scanning installed versions."""
+        exe = tmp_path / "versions" / "3.12.1" / "bin" / "python3"
+        exe.parent.mkdir(parents=True)
+        exe.touch(mode=0o755)
+        with (
+            patch.dict("os.environ", {"PYENV_ROOT": str(tmp_path)}),
+            patch("pyvm_updater.venv.get_os_info", return_value=("linux", "x86_64")),
+            patch("pyvm_updater.venv.get_installed_python_versions") as mock_scan,
+        ):
+            assert find_python_executable("3.12.1") == str(exe)
+        mock_scan.assert_not_called()
+
+    def test_exact_pyenv_install_preferred_over_newer_patch(self, tmp_path):
+        """Test that 3.12.1 resolves to its own pyenv install even with 3.12.5 installed."""
+        for patch_version in ("3.12.1", "3.12.5"):
+            exe = tmp_path / "versions" / patch_version / "bin" / "python3"
+            exe.parent.mkdir(parents=True)
+            exe.touch(mode=0o755)
+        newest = str(tmp_path / "versions" / "3.12.5" / "bin" / "python3")
+        with (
+            patch.dict("os.environ", {"PYENV_ROOT": str(tmp_path)}),
+            patch("pyvm_updater.venv.get_os_info", return_value=("linux", "x86_64")),
+            patch(
+                "pyvm_updater.venv.get_installed_python_versions",
+                return_value=[{"version": "3.12.5", "path": newest}, {"version": "3.12.1", "path": "unused"}],
+            ),
+        ):
+            assert find_python_executable("3.12.1") == str(tmp_path / "versions" / "3.12.1" / "bin" / "python3")
+            assert find_python_executable("3.12") == newest
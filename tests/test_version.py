@@ -1,39 +1,162 @@
 """Tests for pyvm_updater.version module."""
 
-from unittest.mock import patch
+import os
+import platform
+import subprocess
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from pyvm_updater.version import (
+    _fetch_active_python_releases_fallback,
     check_python_version,
+    get_active_python_releases,
+    get_available_python_versions,
     get_installed_python_versions,
+    get_latest_python_info,
+    get_latest_python_info_with_retry,
+    get_versions_filtered,
     is_python_version_installed,
 )
 
+CURRENT_VERSION = platform.python_version()
+
+
+@pytest.fixture(scope="session")
+def installed_versions():
+    """One real scan of this machine, shared by the read-only discovery tests."""
+    return get_installed_python_versions()
+
+
+def _streamed(body, chunk_size=64):
+    """Fake streamed response delivering body in small chunks."""
+    response = MagicMock()
+    response.iter_content.return_value = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+    return response
+
 
 class TestGetInstalledPythonVersions:
     """Tests for get_installed_python_versions function."""
 
-    def test_returns_list(self):
+    def test_returns_list(self, installed_versions):
         """Test that function returns a list."""
-        result = get_installed_python_versions()
-        assert isinstance(result, list)
+        assert isinstance(installed_versions, list)
 
-    def test_contains_current_version(self):
+    def test_contains_current_version(self, installed_versions):
         """Test that current Python version is in the list."""
-        import platform
-
-        current_ver = platform.python_version()
-        result = get_installed_python_versions()
-        versions = [v["version"] for v in result]
-        assert current_ver in versions
+        versions = [v["version"] for v in installed_versions]
+        assert CURRENT_VERSION in versions
 
-    def test_each_item_has_required_keys(self):
+    def test_each_item_has_required_keys(self, installed_versions):
         """Test that each item has required keys."""
-        result = get_installed_python_versions()
-        for item in result:
+        for item in installed_versions:
             assert "version" in item
             assert "path" in item
             assert "default" in item
 
+    @pytest.mark.skipif(os.name == "nt", reason="Unix search paths")
+    def test_version_probe_is_spawn_friendly(self, tmp_path, monkeypatch):
+        """Test that interpreters on PATH are probed with posix_spawn-compatible arguments."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.delenv("PYENV_ROOT", raising=False)
+        bin_dir = tmp_path / ".local" / "bin"
+        bin_dir.mkdir(parents=True)
+        fake = bin_dir / "python3.99"
+        fake.write_text("#!/bin/sh\necho Python 3.99.1\n")
+        fake.chmod(0o755)
+
+        with patch("pyvm_updater.version.subprocess.run", wraps=subprocess.run) as mock_run:
+            versions = get_installed_python_versions()
+
+        assert {"version": "3.99.1", "path": str(fake), "default": False} in versions
+        probe = next(c for c in mock_run.call_args_list if c[0][0][0] == str(fake))
+        assert probe[1]["close_fds"] is False
+        assert "cwd" not in probe[1]
+        assert probe[1]["stdin"] is subprocess.DEVNULL
+        assert probe[1]["stderr"] is subprocess.DEVNULL
+
+    @pytest.mark.skipif(os.name == "nt", reason="Unix search paths")
+    def test_patch_version_read_from_link_target(self, tmp_path, monkeypatch):
+        """Test that a versioned link target is used instead of running --version."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.delenv("PYENV_ROOT", raising=False)
+        real = tmp_path / "Cellar" / "python@3.98" / "3.98.4" / "bin" / "python3.98"
+        real.parent.mkdir(parents=True)
+        real.write_text("#!/bin/sh\nexit 1\n")
+        real.chmod(0o755)
+        bin_dir = tmp_path / ".local" / "bin"
+        bin_dir.mkdir(parents=True)
+        (bin_dir / "python3.98").symlink_to(real)
+
+        with patch("pyvm_updater.version.subprocess.run", wraps=subprocess.run) as mock_run:
+            versions = get_installed_python_versions()
+
+        assert {"version": "3.98.4", "path": str(bin_dir / "python3.98"), "default": False} in versions
+        assert all("python3.98" not in c[0][0][0] for c in mock_run.call_args_list)
+
+    @pytest.mark.skipif(os.name == "nt", reason="Unix search paths")
+    def test_concurrent_scans_merge_in_priority_order(self, tmp_path, monkeypatch):
+        """Test that a version found by both mise and pyenv is reported once, from mise."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("PYENV_ROOT", str(tmp_path / "pyenv"))
+        mise_exe = tmp_path / ".local" / "share" / "mise" / "installs" / "python" / "3.97.1" / "bin" / "python3"
+        pyenv_exe = tmp_path / "pyenv" / "versions" / "3.97.1" / "bin" / "python3"
+        only_pyenv = tmp_path / "pyenv" / "versions" / "3.96.0" / "bin" / "python3"
+        for exe in (mise_exe, pyenv_exe, only_pyenv):
+            exe.parent.mkdir(parents=True)
+            exe.touch()
+
+        versions = get_installed_python_versions()
+
+        assert [v["path"] for v in versions if v["version"] == "3.97.1"] == [str(mise_exe)]
+        assert [v["path"] for v in versions if v["version"] == "3.96.0"] == [str(only_pyenv)]
+
+    def test_version_dir_names(self):
+        """Test which mise/pyenv directory names are treated as CPython versions."""
+        from pyvm_updater.version import _starts_with_major_minor
+
+        assert _starts_with_major_minor("3.12.1")
+        assert _starts_with_major_minor("3.13")
+        assert _starts_with_major_minor("3.14.0rc1")
+        assert not _starts_with_major_minor("3")
+        assert not _starts_with_major_minor("3.")
+        assert not _starts_with_major_minor("miniconda3-4.7.12")
+        assert not _starts_with_major_minor("pypy3.10-7.3.12")
+
+    @pytest.mark.skipif(os.name == "nt", reason="Unix search paths")
+    def test_sorted_by_parsed_version(self, tmp_path, monkeypatch):
+        """Test that pre-releases sort below finals and above older versions."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("PYENV_ROOT", str(tmp_path / "pyenv"))
+        for name in ("3.97.0rc1", "3.97.0", "3.96.10", "3.96.9"):
+            exe = tmp_path / "pyenv" / "versions" / name / "bin" / "python3"
+            exe.parent.mkdir(parents=True)
+            exe.touch()
+
+        with patch("pyvm_updater.version._scan_system_paths", return_value=[]):
+            versions = get_installed_python_versions()
+
+        ours = [v["version"] for v in versions if v["version"].startswith(("3.96", "3.97"))]
+        assert ours == ["3.97.0", "3.97.0rc1", "3.96.10", "3.96.9"]
+
+    def test_scan_reused_within_ttl(self):
+        """Test that repeated calls reuse one scan until it expires or is invalidated."""
+        from pyvm_updater import version
+
+        with patch("pyvm_updater.version._scan_installed_python_versions", return_value=[]) as mock_scan:
+            get_installed_python_versions()
+            get_installed_python_versions()
+            assert mock_scan.call_count == 1
+
+            version.invalidate_installed_cache()
+            get_installed_python_versions()
+            assert mock_scan.call_count == 2
+
+            with patch("pyvm_updater.version.time.monotonic", return_value=time.monotonic() + version._INSTALLED_TTL):
+                get_installed_python_versions()
+            assert mock_scan.call_count == 3
+
 
 class TestCheckPythonVersion:
     """Tests for check_python_version function."""
@@ -61,15 +184,170 @@ class TestCheckPythonVersion:
         assert needs_update is False
 
 
+class TestGetLatestPythonInfoWithRetry:
+    """Tests for get_latest_python_info_with_retry function."""
+
+    def test_fresh_metadata_store_skips_fetch(self):
+        """Test that the download button recorded by the last sync is used without a request."""
+        with (
+            patch("pyvm_updater.version.get_latest_from_cache", return_value=("3.13.1", "https://x.invalid/")),
+            patch("pyvm_updater.version._fetch_latest_python_info") as mock_fetch,
+        ):
+            assert get_latest_python_info_with_retry() == ("3.13.1", "https://x.invalid/")
+        mock_fetch.assert_not_called()
+
+
+class TestGetLatestPythonInfo:
+    """Tests for get_latest_python_info function."""
+
+    PAGE = (
+        b'<html><body><div class="download-os-windows">'
+        b'<a class="button" href="/ftp/python/3.13.1/python-3.13.1-amd64.exe">Download Python 3.13.1</a>'
+        b"</div></body></html>"
+    )
+
+    def test_parses_download_button(self):
+        """Test that the version and absolute URL come from the download button."""
+        with patch("pyvm_updater.version.get_session") as mock_session:
+            mock_session.return_value.get.return_value = _streamed(self.PAGE)
+            latest, url = get_latest_python_info()
+        assert latest == "3.13.1"
+        assert url == "https://www.python.org/ftp/python/3.13.1/python-3.13.1-amd64.exe"
+
+    def test_missing_button(self):
+        """Test that a page without a download button yields no version."""
+        with patch("pyvm_updater.version.get_session") as mock_session:
+            mock_session.return_value.get.return_value = _streamed(b"<html><body></body></html>")
+            assert get_latest_python_info() == (None, None)
+
+    def test_stops_reading_after_button(self):
+        """Test that the rest of the page is not downloaded once the button is parsed."""
+        tail_read = []
+
+        def chunks():
+            yield self.PAGE[:60]
+            yield self.PAGE[60:]
+            tail_read.append(True)
+            yield b"<div>" * 1000
+
+        with patch("pyvm_updater.version.get_session") as mock_session:
+            response = MagicMock()
+            response.iter_content.return_value = chunks()
+            mock_session.return_value.get.return_value = response
+            latest, _ = get_latest_python_info()
+        assert latest == "3.13.1"
+        assert not tail_read
+        response.close.assert_called_once()
+
+
+class TestAvailableVersionsFallback:
+    """Tests for the streamed python.org fallback of get_available_python_versions."""
+
+    def test_reads_only_limit_rows(self, downloads_page):
+        """Test that the fallback returns the first limit release links."""
+        with (
+            patch("pyvm_updater.version.get_versions_from_cache", return_value=[]),
+            patch("pyvm_updater.version.sync_python_org"),
+            patch("pyvm_updater.version.get_session") as mock_session,
+        ):
+            mock_session.return_value.get.return_value = _streamed(downloads_page.encode())
+            versions = get_available_python_versions(limit=2)
+        assert versions == [
+            {"version": "3.13.1", "url": "https://www.python.org/downloads/release/python-3131/"},
+            {"version": "3.12.8", "url": "https://www.python.org/downloads/release/python-3128/"},
+        ]
+
+
+class TestActiveReleasesFallback:
+    """Tests for the direct python.org release-schedule parse."""
+
+    def test_reads_schedule_rows(self, downloads_page):
+        """Test that each schedule row is read from its class-tagged cells."""
+        with patch("pyvm_updater.version.get_session") as mock_session:
+            mock_session.return_value.get.return_value = MagicMock(content=downloads_page.encode())
+            releases = _fetch_active_python_releases_fallback()
+
+        assert releases == [
+            {
+                "series": "3.13",
+                "status": "bugfix",
+                "first_release": "2024-10-07",
+                "end_of_support": "2029-10",
+                "latest_version": "3.13.1",
+            },
+            {
+                "series": "3.12",
+                "status": "security",
+                "first_release": "2023-10-02",
+                "end_of_support": "2028-10",
+                "latest_version": "3.12.8",
+            },
+        ]
+
+
+class TestColdCache:
+    """Tests for the empty-cache paths of the release lookups."""
+
+    def test_no_wait_returns_immediately(self):
+        """Test that wait=False starts a background sync instead of fetching inline."""
+        with (
+            patch("pyvm_updater.version.get_releases_from_cache", return_value=[]),
+            patch("pyvm_updater.version.get_versions_from_cache", return_value=[]),
+            patch("pyvm_updater.version.start_background_sync_if_stale") as mock_bg,
+            patch("pyvm_updater.version.sync_python_org") as mock_sync,
+            patch("pyvm_updater.version.get_session") as mock_session,
+        ):
+            assert get_active_python_releases(wait=False) == []
+            assert get_available_python_versions(wait=False) == []
+        assert mock_bg.call_count == 2
+        mock_sync.assert_not_called()
+        mock_session.assert_not_called()
+
+    def test_wait_syncs_inline(self):
+        """Test that the default still fills an empty cache before returning."""
+        rows = [{"version": "3.13.1", "url": "https://www.python.org/downloads/release/python-3131/"}]
+        with (
+            patch("pyvm_updater.version.get_versions_from_cache", side_effect=[[], rows]),
+            patch("pyvm_updater.version.sync_python_org") as mock_sync,
+        ):
+            assert get_available_python_versions() == rows
+        mock_sync.assert_called_once()
+
+
+class TestGetVersionsFiltered:
+    """Tests for get_versions_filtered function."""
+
+    RELEASES = [
+        {"series": "3.13", "status": "bugfix", "latest_version": "3.13.1"},
+        {"series": "3.12", "status": "security", "latest_version": "3.12.8"},
+        {"series": "3.8", "status": "end-of-life", "latest_version": "3.8.20"},
+    ]
+
+    def test_min_version_parsed_once(self):
+        """Test that min_version filters releases and is parsed a single time."""
+        from pyvm_updater import version
+
+        with (
+            patch("pyvm_updater.version.get_active_python_releases", return_value=self.RELEASES),
+            patch("pyvm_updater.version.pkg_version.parse", wraps=version.pkg_version.parse) as mock_parse,
+        ):
+            result = get_versions_filtered(min_version="3.12")
+        assert [r["version"] for r in result] == ["3.13.1", "3.12.8"]
+        assert [c[0][0] for c in mock_parse.call_args_list].count("3.12") == 1
+
+    def test_invalid_min_version_is_ignored(self):
+        """Test that an unparsable min_version does not filter anything out."""
+        with patch("pyvm_updater.version.get_active_python_releases", return_value=self.RELEASES):
+            result = get_versions_filtered(min_version="not a version", security_supported_only=True)
+        assert [r["version"] for r in result] == ["3.13.1", "3.12.8"]
+
+
 class TestIsPythonVersionInstalled:
     """Tests for is_python_version_installed function."""
 
     def test_current_version_is_installed(self):
         """Test that current Python version is detected as installed."""
-        import platform
-
-        current_ver = platform.python_version()
-        assert is_python_version_installed(current_ver) is True
+        assert is_python_version_installed(CURRENT_VERSION) is True
 
     def test_fake_version_is_not_installed(self):
         """Test that a fake version is not detected as installed."""
@@ -77,10 +355,22 @@ class TestIsPythonVersionInstalled:
 
     def test_major_minor_match(self):
         """Test that current Python version is correctly detected."""
-        import platform
+        # The current full version (e.g., "3.12.12") should definitely be installed
+        assert is_python_version_installed(CURRENT_VERSION) is True
+
+    def test_series_and_exact_lookup(self):
+        """Test that a bare X.Y entry matches a patch version unless exact is requested."""
+        installed = [{"version": "3.98", "path": None, "default": False}]
+        with patch("pyvm_updater.version._scan_installed_python_versions", return_value=installed):
+            assert is_python_version_installed("3.98.2") is True
+            assert is_python_version_installed("3.98.2", exact=True) is False
+            assert is_python_version_installed("3.98") is True
 
-        # Get the current full version (e.g., "3.12.12")
-        current_ver = platform.python_version()
+    def test_version_set_built_once_per_scan(self):
+        """Test that repeated checks reuse one frozenset instead of copying the scan."""
+        from pyvm_updater.version import get_installed_version_set
 
-        # The current full version should definitely be installed
-        assert is_python_version_installed(current_ver) is True
+        installed = [{"version": "3.98.1", "path": None, "default": False}]
+        with patch("pyvm_updater.version._scan_installed_python_versions", return_value=installed):
+            assert get_installed_version_set() is get_installed_version_set()
+            assert is_python_version_installed("3.98.1", exact=True) is True